@@ -0,0 +1,30 @@
+-- Migration: Convert status/type/reason enum columns to VARCHAR
+-- Date: 2026-10-17
+-- Description: The ORM stores these values as plain strings instead of
+-- SQLAlchemy Enum columns. Converts the columns and drops the enum types.
+--
+-- IMPORTANT: This migration is for PostgreSQL only (SQLite already uses VARCHAR)
+
+BEGIN;
+
+ALTER TABLE pending_invoices
+    ALTER COLUMN status TYPE VARCHAR(30) USING status::text;
+
+ALTER TABLE pending_transfers
+    ALTER COLUMN status TYPE VARCHAR(20) USING status::text;
+
+ALTER TABLE pending_adjustments
+    ALTER COLUMN status TYPE VARCHAR(20) USING status::text,
+    ALTER COLUMN adjustment_type TYPE VARCHAR(20) USING adjustment_type::text;
+
+ALTER TABLE pending_adjustment_items
+    ALTER COLUMN adjustment_type TYPE VARCHAR(20) USING adjustment_type::text,
+    ALTER COLUMN reason TYPE VARCHAR(30) USING reason::text;
+
+DROP TYPE IF EXISTS invoicestatus;
+DROP TYPE IF EXISTS transferstatus;
+DROP TYPE IF EXISTS adjustmentstatus;
+DROP TYPE IF EXISTS adjustmenttype;
+DROP TYPE IF EXISTS adjustmentreason;
+
+COMMIT;
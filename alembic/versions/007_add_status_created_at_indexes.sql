@@ -0,0 +1,19 @@
+-- Migration: Add composite (status, created_at) indexes on pending tables
+-- Date: 2026-10-17
+-- Description: Replaces single-column status indexes with (status, created_at)
+-- composites so "filter by status, newest first" queries avoid a sort pass.
+-- Works on both PostgreSQL and SQLite.
+
+CREATE INDEX IF NOT EXISTS ix_pending_invoices_status_created_at ON pending_invoices (status, created_at);
+DROP INDEX IF EXISTS ix_pending_invoices_status;
+DROP INDEX IF EXISTS idx_pending_invoices_status;
+
+CREATE INDEX IF NOT EXISTS ix_pending_adjustments_status_created_at ON pending_adjustments (status, created_at);
+DROP INDEX IF EXISTS ix_pending_adjustments_status;
+
+CREATE INDEX IF NOT EXISTS ix_pending_transfers_status_created_at ON pending_transfers (status, created_at);
+DROP INDEX IF EXISTS ix_pending_transfers_status;
+
+CREATE INDEX IF NOT EXISTS ix_product_sync_history_items_history_id_action ON product_sync_history_items (history_id, action);
+DROP INDEX IF EXISTS ix_product_sync_history_items_history_id;
+DROP INDEX IF EXISTS idx_product_sync_history_items_history;
@@ -0,0 +1,12 @@
+-- Migration: Convert short free-text columns from TEXT to sized VARCHAR
+-- Date: 2026-10-17
+-- Description: error_summary and sync_error become VARCHAR(1000), adjustment
+-- item description becomes VARCHAR(500). Existing values are truncated to fit.
+-- PostgreSQL only; SQLite does not enforce VARCHAR lengths.
+
+ALTER TABLE adjustment_history ALTER COLUMN error_summary TYPE VARCHAR(1000) USING left(error_summary, 1000);
+ALTER TABLE invoice_history ALTER COLUMN error_summary TYPE VARCHAR(1000) USING left(error_summary, 1000);
+ALTER TABLE product_sync_history ALTER COLUMN error_summary TYPE VARCHAR(1000) USING left(error_summary, 1000);
+ALTER TABLE transfer_history ALTER COLUMN error_summary TYPE VARCHAR(1000) USING left(error_summary, 1000);
+ALTER TABLE pending_invoice_items ALTER COLUMN sync_error TYPE VARCHAR(1000) USING left(sync_error, 1000);
+ALTER TABLE pending_adjustment_items ALTER COLUMN description TYPE VARCHAR(500) USING left(description, 500);
@@ -0,0 +1,14 @@
+-- Migration: Add partial indexes for the active pending queues
+-- Date: 2026-10-17
+-- Description: Indexes created_at only for rows still awaiting review or
+-- confirmation, so the indexes stay small as finished rows accumulate.
+-- Works on both PostgreSQL and SQLite.
+
+CREATE INDEX IF NOT EXISTS ix_pending_invoices_bodeguero_queue ON pending_invoices (created_at)
+    WHERE status IN ('pendiente_revision', 'en_revision');
+
+CREATE INDEX IF NOT EXISTS ix_pending_adjustments_pending ON pending_adjustments (created_at)
+    WHERE status = 'pending';
+
+CREATE INDEX IF NOT EXISTS ix_pending_transfers_pending ON pending_transfers (created_at)
+    WHERE status = 'pending';
@@ -0,0 +1,6 @@
+-- Migration: Add invoice_id index on pending_invoice_items
+-- Date: 2026-10-17
+-- Description: Backs the selectin load of invoice items (WHERE invoice_id IN ...).
+-- Works on both PostgreSQL and SQLite.
+
+CREATE INDEX IF NOT EXISTS ix_pending_invoice_items_invoice_id ON pending_invoice_items (invoice_id);
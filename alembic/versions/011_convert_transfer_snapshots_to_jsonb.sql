@@ -0,0 +1,10 @@
+-- Migration: Convert transfer_history snapshot columns from TEXT to JSONB
+-- Date: 2026-10-17
+-- Description: Snapshot and new_products columns become JSONB so the driver
+-- decodes them at fetch time. PostgreSQL only; SQLite keeps JSON text.
+
+ALTER TABLE transfer_history ALTER COLUMN origin_snapshots_before TYPE JSONB USING origin_snapshots_before::jsonb;
+ALTER TABLE transfer_history ALTER COLUMN origin_snapshots_after TYPE JSONB USING origin_snapshots_after::jsonb;
+ALTER TABLE transfer_history ALTER COLUMN destination_snapshots_before TYPE JSONB USING destination_snapshots_before::jsonb;
+ALTER TABLE transfer_history ALTER COLUMN destination_snapshots_after TYPE JSONB USING destination_snapshots_after::jsonb;
+ALTER TABLE transfer_history ALTER COLUMN new_products TYPE JSONB USING new_products::jsonb;
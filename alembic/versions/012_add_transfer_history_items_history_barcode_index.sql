@@ -0,0 +1,8 @@
+-- Migration: Add composite (history_id, barcode) index on transfer_history_items
+-- Date: 2026-10-17
+-- Description: Replaces the single-column history_id index. The barcode index
+-- stays for cross-history product search. Works on both PostgreSQL and SQLite.
+
+CREATE INDEX IF NOT EXISTS ix_transfer_history_items_history_id_barcode ON transfer_history_items (history_id, barcode);
+DROP INDEX IF EXISTS ix_transfer_history_items_history_id;
+DROP INDEX IF EXISTS idx_transfer_history_items_history;
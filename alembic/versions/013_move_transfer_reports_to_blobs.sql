@@ -0,0 +1,19 @@
+-- Migration: Move transfer_history PDF/XML content into transfer_history_blobs
+-- Date: 2026-10-17
+-- Description: Report payloads move to a sibling table keyed by history_id,
+-- with the PDF stored as raw bytes instead of base64. PostgreSQL syntax; on
+-- SQLite use migrations/move_transfer_reports_to_blobs.py (no base64 decode in SQL).
+
+CREATE TABLE IF NOT EXISTS transfer_history_blobs (
+    history_id INTEGER PRIMARY KEY REFERENCES transfer_history(id) ON DELETE CASCADE,
+    pdf_bytes BYTEA,
+    xml_content TEXT
+);
+
+INSERT INTO transfer_history_blobs (history_id, pdf_bytes, xml_content)
+SELECT id, decode(pdf_content, 'base64'), xml_content
+FROM transfer_history
+WHERE pdf_content IS NOT NULL OR xml_content IS NOT NULL;
+
+ALTER TABLE transfer_history DROP COLUMN pdf_content;
+ALTER TABLE transfer_history DROP COLUMN xml_content;
@@ -0,0 +1,7 @@
+-- Migration: Convert adjustment_history snapshot columns from TEXT to JSONB
+-- Date: 2026-10-17
+-- Description: snapshots_before/snapshots_after become JSONB so the driver
+-- decodes them at fetch time. PostgreSQL only; SQLite keeps JSON text.
+
+ALTER TABLE adjustment_history ALTER COLUMN snapshots_before TYPE JSONB USING snapshots_before::jsonb;
+ALTER TABLE adjustment_history ALTER COLUMN snapshots_after TYPE JSONB USING snapshots_after::jsonb;
@@ -2,10 +2,13 @@
 Database configuration and session management using SQLAlchemy.
 """
 from typing import Generator
-from sqlalchemy import create_engine
+import orjson
+from sqlalchemy import create_engine, JSON
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from app.core.config import settings
+from app.utils.serialization import dumps
 
 
 # Create database engine
@@ -14,7 +17,9 @@ engine = create_engine(
     pool_pre_ping=True,  # Verify connections before using
     pool_size=5,
     max_overflow=10,
-    echo=settings.DEBUG  # Log SQL queries in debug mode
+    echo=settings.DEBUG,  # Log SQL queries in debug mode
+    json_serializer=lambda obj: dumps(obj).decode(),  # JSON/JSONB columns via orjson
+    json_deserializer=orjson.loads
 )
 
 # Session factory
@@ -27,6 +32,9 @@ SessionLocal = sessionmaker(
 # Base class for ORM models
 Base = declarative_base()
 
+# JSON column type: native JSONB on PostgreSQL, JSON text on SQLite (decoded by the driver)
+JSONVariant = JSON().with_variant(JSONB(), "postgresql")
+
 
 def get_db() -> Generator[Session, None, None]:
     """
@@ -19,7 +19,9 @@ from app.schemas.adjustment import (
 from app.schemas.auth import UserInfo
 from app.features.auth.dependencies import require_admin, require_admin_or_bodeguero, get_current_user
 from app.features.adjustments.service import AdjustmentService
+from app.models import ADJUSTMENT_TYPES
 from app.features.settings.router import get_setting, AUTO_CONFIRM_ADJUSTMENTS
+from app.utils.serialization import json_body, json_body_openapi
 import logging
 
 logger = logging.getLogger(__name__)
@@ -37,12 +39,16 @@ def _create_auto_confirm_user(real_user: UserInfo) -> UserInfo:
     )
 
 
-@router.post("/prepare", response_model=AdjustmentResponse)
+@router.post(
+    "/prepare",
+    response_model=AdjustmentResponse,
+    openapi_extra=json_body_openapi(AdjustmentRequest)
+)
 def prepare_adjustment(
-    request: AdjustmentRequest,
+    current_user: UserInfo = Depends(require_admin_or_bodeguero),
+    request: AdjustmentRequest = Depends(json_body(AdjustmentRequest)),
     manager: OdooConnectionManager = Depends(get_odoo_manager),
-    db: Session = Depends(get_db),
-    current_user: UserInfo = Depends(require_admin_or_bodeguero)
+    db: Session = Depends(get_db)
 ):
     """
     Prepare an inventory adjustment (Step 1).
@@ -138,13 +144,17 @@ def get_pending_adjustments(
         )
 
 
-@router.post("/confirm", response_model=AdjustmentResponse)
+@router.post(
+    "/confirm",
+    response_model=AdjustmentResponse,
+    openapi_extra=json_body_openapi(ConfirmAdjustmentRequest)
+)
 def confirm_adjustment(
-    request: ConfirmAdjustmentRequest,
+    current_user: UserInfo = Depends(require_admin),
+    request: ConfirmAdjustmentRequest = Depends(json_body(ConfirmAdjustmentRequest)),
     adjustment_id: Optional[int] = Query(None, description="ID of pending adjustment to confirm"),
     manager: OdooConnectionManager = Depends(get_odoo_manager),
-    db: Session = Depends(get_db),
-    current_user: UserInfo = Depends(require_admin)
+    db: Session = Depends(get_db)
 ):
     """
     Confirm and execute an inventory adjustment (Step 2).
@@ -253,6 +263,12 @@ def get_adjustment_history(
     logger.info(f"User: {current_user.username}")
     logger.info(f"Filters - Start: {start_date}, End: {end_date}, Type: {adjustment_type}, User: {user_id}")
 
+    if adjustment_type and adjustment_type not in ADJUSTMENT_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid adjustment type: {adjustment_type}"
+        )
+
     try:
         principal_client = manager.get_principal_client()
         service = AdjustmentService(principal_client, db=db)
@@ -306,6 +322,12 @@ def get_complete_adjustment_history(
 
     logger.info(f"Getting complete adjustment history (skip={skip}, limit={limit})")
 
+    if adjustment_type and adjustment_type not in ADJUSTMENT_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid adjustment type: {adjustment_type}"
+        )
+
     try:
         query = db.query(AdjustmentHistory)
 
@@ -330,7 +352,7 @@ def get_complete_adjustment_history(
         logger.info(f"Retrieved {len(histories)} complete adjustment records (total: {total})")
 
         return AdjustmentHistoryListResponse(
-            history=[AdjustmentHistoryDetailResponse.model_validate(h) for h in histories],
+            history=tuple(AdjustmentHistoryDetailResponse.model_validate(h) for h in histories),
             total=total
         )
 
@@ -382,7 +404,7 @@ def get_my_adjustment_history(
         logger.info(f"Retrieved {len(histories)} adjustment records for user {current_user.username}")
 
         return AdjustmentHistoryListResponse(
-            history=[AdjustmentHistoryDetailResponse.model_validate(h) for h in histories],
+            history=tuple(AdjustmentHistoryDetailResponse.model_validate(h) for h in histories),
             total=total
         )
 
@@ -424,13 +446,28 @@ def get_unified_adjustment_history(
 
     Returns a unified list sorted by creation date (most recent first).
     """
-    from app.models.pending_adjustment import PendingAdjustment, AdjustmentStatus
+    from app.models.pending_adjustment import (
+        PendingAdjustment,
+        AdjustmentStatus,
+        ADJUSTMENT_STATUSES
+    )
     from app.models.adjustment_history import AdjustmentHistory
 
     logger.info(f"=== GET UNIFIED ADJUSTMENT HISTORY ===")
     logger.info(f"User: {current_user.username}, Role: {current_user.role}")
     logger.info(f"Filters: status={status_filter}, type={adjustment_type}, executed_by={executed_by}")
 
+    if status_filter and status_filter not in ADJUSTMENT_STATUSES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid status filter: {status_filter}"
+        )
+    if adjustment_type and adjustment_type not in ADJUSTMENT_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid adjustment type: {adjustment_type}"
+        )
+
     try:
         unified_records = []
 
@@ -460,8 +497,8 @@ def get_unified_adjustment_history(
                 'id': f'pending_{pending.id}',
                 'original_id': pending.id,
                 'source': 'pending',
-                'status': pending.status.value,
-                'adjustment_type': pending.adjustment_type.value,
+                'status': pending.status,
+                'adjustment_type': pending.adjustment_type,
                 'username': pending.username,
                 'created_at': pending.created_at,
                 'updated_at': pending.updated_at,
@@ -475,8 +512,8 @@ def get_unified_adjustment_history(
                         'barcode': item.barcode,
                         'product_name': item.product_name,
                         'quantity': item.quantity,
-                        'adjustment_type': item.adjustment_type.value,
-                        'reason': item.reason.value if item.reason else None,
+                        'adjustment_type': item.adjustment_type,
+                        'reason': item.reason,
                         'description': item.description,
                         'available_stock': item.available_stock
                     }
@@ -5,7 +5,7 @@ Two-step process: prepare (validate) then confirm (execute in Odoo).
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import desc, insert
 from app.infrastructure.odoo import OdooClient
 from app.schemas.adjustment import (
     AdjustmentItem,
@@ -21,11 +21,9 @@ from app.core.constants import OdooModel
 from app.models import (
     PendingAdjustment,
     PendingAdjustmentItem,
-    AdjustmentStatus,
-    AdjustmentType,
-    AdjustmentReason
+    AdjustmentStatus
 )
-from app.utils.timezone import get_ecuador_now
+from app.utils.timezone import get_ecuador_now_naive
 import logging
 
 logger = logging.getLogger(__name__)
@@ -156,7 +154,7 @@ class AdjustmentService:
             raise ValueError("Database session not provided")
 
         # Determine adjustment type from first item (all should be same type)
-        adjustment_type = AdjustmentType(items[0].adjustment_type.value)
+        adjustment_type = items[0].adjustment_type
 
         # Create pending adjustment
         pending_adjustment = PendingAdjustment(
@@ -169,23 +167,24 @@ class AdjustmentService:
         self.db.add(pending_adjustment)
         self.db.flush()  # Get the ID
 
-        # Create adjustment items
-        for item in items:
-            adjustment_item = PendingAdjustmentItem(
-                adjustment_id=pending_adjustment.id,
-                barcode=item.barcode,
-                product_id=item.product_id,
-                product_name=item.product_name,
-                quantity=item.quantity,
-                available_stock=item.available_stock,
-                adjustment_type=AdjustmentType(item.adjustment_type.value),
-                reason=AdjustmentReason(item.reason.value),
-                description=item.description,
-                unit_price=item.unit_price,
-                new_product_name=item.new_product_name,
-                photo_url=item.photo_url
-            )
-            self.db.add(adjustment_item)
+        # Create adjustment items in a single multi-row INSERT
+        self.db.execute(insert(PendingAdjustmentItem), [
+            {
+                "adjustment_id": pending_adjustment.id,
+                "barcode": item.barcode,
+                "product_id": item.product_id,
+                "product_name": item.product_name,
+                "quantity": item.quantity,
+                "available_stock": item.available_stock,
+                "adjustment_type": item.adjustment_type,
+                "reason": item.reason,
+                "description": item.description,
+                "unit_price": item.unit_price,
+                "new_product_name": item.new_product_name,
+                "photo_url": item.photo_url
+            }
+            for item in items
+        ])
 
         self.db.commit()
         self.db.refresh(pending_adjustment)
@@ -266,7 +265,7 @@ class AdjustmentService:
                 current_stock = product.get('qty_available', 0)
 
                 logger.info(f"Updating product {product['name']} (ID: {product['id']})")
-                logger.info(f"Current stock: {current_stock}, Adjustment type: {item.adjustment_type.value}, Quantity: {item.quantity}")
+                logger.info(f"Current stock: {current_stock}, Adjustment type: {item.adjustment_type}, Quantity: {item.quantity}")
 
                 # CAPTURE: Snapshot BEFORE adjustment
                 snapshot_before = self._capture_product_snapshot(
@@ -281,7 +280,7 @@ class AdjustmentService:
                 # Determine mode based on adjustment type
                 # ADJUSTMENT (physical count) = replace the value
                 # ENTRY/EXIT = add to existing (negative for exit)
-                if item.adjustment_type.value == 'adjustment':
+                if item.adjustment_type == 'adjustment':
                     mode = 'replace'
                     quantity = item.quantity  # Use the exact counted quantity
                     logger.info(f"Physical count mode: replacing stock with {quantity}")
@@ -320,15 +319,15 @@ class AdjustmentService:
                     'product_id': item.product_id,
                     'product_name': item.product_name,
                     'quantity': item.quantity,
-                    'adjustment_type': item.adjustment_type.value,
-                    'reason': item.reason.value,
+                    'adjustment_type': item.adjustment_type,
+                    'reason': item.reason,
                     'unit_price': item.unit_price,
                     'stock_before': snapshot_before.get('qty_available') if snapshot_before else None,
                     'stock_after': snapshot_after.get('qty_available') if snapshot_after else None
                 })
 
                 # Update product name and photo if provided (only for ADJUSTMENT type)
-                if item.adjustment_type.value == 'adjustment':
+                if item.adjustment_type == 'adjustment':
                     update_values = {}
 
                     logger.info(f"Checking for name/photo updates - new_product_name: '{item.new_product_name}', photo_url exists: {bool(item.photo_url)}")
@@ -464,7 +463,7 @@ class AdjustmentService:
 
                 if pending_adj:
                     pending_adj.status = AdjustmentStatus.CONFIRMED
-                    pending_adj.confirmed_at = get_ecuador_now().replace(tzinfo=None)
+                    pending_adj.confirmed_at = get_ecuador_now_naive()
                     pending_adj.confirmed_by = user.username
                     self.db.commit()
                     logger.info(f"Updated pending adjustment {adjustment_id} status to CONFIRMED")
@@ -489,8 +488,8 @@ class AdjustmentService:
                     'username': user.username,
                     'confirmed_by': user.username,
                     'location_name': 'Principal',
-                    'adjustment_type': items[0].adjustment_type.value if items else '',
-                    'reason': items[0].reason.value if items else '',
+                    'adjustment_type': items[0].adjustment_type if items else '',
+                    'reason': items[0].reason if items else '',
                     'total_items': len(successful_products),
                     'total_quantity': sum(abs(p['quantity']) for p in successful_products)
                 }
@@ -631,11 +630,11 @@ class AdjustmentService:
             for item in adj.items:
                 history.append(AdjustmentHistoryItemResponse(
                     id=item.id,
-                    adjustment_type=item.adjustment_type.value if isinstance(item.adjustment_type, AdjustmentType) else item.adjustment_type,
+                    adjustment_type=item.adjustment_type,
                     product_name=item.product_name,
                     barcode=item.barcode,
                     quantity=item.quantity,
-                    reason=item.reason.value if isinstance(item.reason, AdjustmentReason) else item.reason,
+                    reason=item.reason,
                     description=item.description,
                     created_by=adj.username,
                     confirmed_by=adj.confirmed_by,
@@ -810,9 +809,8 @@ class AdjustmentService:
         Raises:
             Exception: If database operations fail
         """
-        import json
         from app.models.adjustment_history import AdjustmentHistory, AdjustmentHistoryItem
-        from app.utils.timezone import get_ecuador_now
+        from app.utils.timezone import get_ecuador_now_naive
 
         logger.info(f"Creating adjustment history record for location: {location_name}")
 
@@ -829,7 +827,7 @@ class AdjustmentService:
         # Build error summary
         error_summary = None
         if errors:
-            error_summary = "; ".join(errors)
+            error_summary = "; ".join(errors)[:1000]  # Fits the String(1000) column
 
         # Create main history record
         history = AdjustmentHistory(
@@ -837,7 +835,7 @@ class AdjustmentService:
             location=location,
             location_name=location_name,
             executed_by=executed_by,
-            executed_at=get_ecuador_now().replace(tzinfo=None),  # SQLite needs naive datetime
+            executed_at=get_ecuador_now_naive(),
             total_items=total_items,
             successful_items=successful_items,
             failed_items=failed_items,
@@ -846,8 +844,8 @@ class AdjustmentService:
             pdf_content=pdf_content,
             pdf_filename=pdf_filename,
             xml_content=xml_content,
-            snapshots_before=json.dumps(snapshots_before),
-            snapshots_after=json.dumps(snapshots_after),
+            snapshots_before=snapshots_before,
+            snapshots_after=snapshots_after,
             has_errors=len(errors) > 0,
             error_summary=error_summary
         )
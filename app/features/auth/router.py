@@ -12,6 +12,7 @@ from app.schemas.common import MessageResponse, OdooCredentials
 from app.features.auth.service import AuthService
 from app.features.auth.dependencies import get_current_user, require_admin
 from app.infrastructure.odoo import get_odoo_manager, OdooConnectionManager
+from app.utils.serialization import json_body, json_body_openapi, model_response
 
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
@@ -66,11 +67,16 @@ def login_odoo_admin(
     return auth_service.login_odoo(request, odoo_manager=manager)
 
 
-@router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/register",
+    response_model=UserResponse,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=json_body_openapi(UserCreate)
+)
 def register_user(
-    user_data: UserCreate,
-    db: Session = Depends(get_db),
-    current_user: UserInfo = Depends(require_admin)
+    current_user: UserInfo = Depends(require_admin),
+    user_data: UserCreate = Depends(json_body(UserCreate)),
+    db: Session = Depends(get_db)
 ):
     """
     Register a new cajero or bodeguero user.
@@ -188,18 +194,22 @@ def list_users(
     auth_service = AuthService(db)
     users, total = auth_service.get_all_users(skip=skip, limit=limit)
 
-    return UserListResponse(
+    return model_response(UserListResponse(
         users=[UserResponse.model_validate(u) for u in users],
         total=total
-    )
+    ))
 
 
-@router.put("/users/{user_id}", response_model=UserResponse)
+@router.put(
+    "/users/{user_id}",
+    response_model=UserResponse,
+    openapi_extra=json_body_openapi(UserUpdate)
+)
 def update_user(
     user_id: int,
-    user_data: UserUpdate,
-    db: Session = Depends(get_db),
-    current_user: UserInfo = Depends(require_admin)
+    current_user: UserInfo = Depends(require_admin),
+    user_data: UserUpdate = Depends(json_body(UserUpdate)),
+    db: Session = Depends(get_db)
 ):
     """
     Update a user's information.
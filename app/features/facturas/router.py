@@ -13,6 +13,7 @@ from app.core.database import get_db
 from app.core.constants import UserRole
 from app.infrastructure.odoo import get_odoo_manager, OdooConnectionManager
 from app.schemas.auth import UserInfo
+from app.utils.serialization import model_response
 from app.features.auth.dependencies import (
     require_admin,
     require_bodeguero,
@@ -30,9 +31,9 @@ from app.schemas.invoice import (
     InvoiceItemResponse,
     InvoiceUploadResponse,
     InvoiceSyncResponse,
-    InvoiceHistoryListResponse,
     InvoicePreviewResponse
 )
+from app.schemas.invoice_history import InvoiceHistoryListResponse
 from .service import FacturaService
 from .schemas import ExtractProductsResponse
 
@@ -159,7 +160,7 @@ def get_pending_invoices(
     try:
         service = FacturaService(db=db)
         result = service.get_pending_invoices(current_user, status=status_filter)
-        return result
+        return model_response(result)
 
     except Exception as e:
         raise HTTPException(
@@ -202,7 +203,7 @@ def get_pending_invoice_detail(
                 detail=f"Invoice {invoice_id} not found"
             )
 
-        return result
+        return model_response(result)
 
     except HTTPException:
         raise
@@ -410,7 +411,7 @@ def submit_invoice(
         service = FacturaService(db=db)
         result = service.submit_invoice(invoice_id, current_user, request.notes)
 
-        return result
+        return model_response(result)
 
     except ValueError as e:
         raise HTTPException(
@@ -462,13 +463,13 @@ async def update_invoice_config(
                 detail="Quantity mode must be 'add' or 'replace'"
             )
 
-        return service.update_invoice_config(
+        return model_response(service.update_invoice_config(
             invoice_id=invoice_id,
             profit_margin=profit_margin,
             apply_iva=apply_iva,
             quantity_mode=quantity_mode,
             user=current_user
-        )
+        ))
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -5,9 +5,12 @@ Handles both legacy Excel workflow and new pending invoices workflow.
 import io
 import re
 import logging
+from collections import defaultdict
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-from sqlalchemy.orm import Session
+from pydantic import TypeAdapter
+from sqlalchemy import insert
+from sqlalchemy.orm import Session, noload
 from openpyxl import Workbook
 from openpyxl.styles import Font, Alignment
 
@@ -26,20 +29,25 @@ from app.schemas.invoice import (
     PendingInvoiceResponse,
     InvoiceItemResponse,
     InvoiceSyncResponse,
-    InvoiceHistoryListResponse,
-    InvoiceHistoryResponse,
-    InvoiceHistoryItemResponse,
     ProductPreview,
     InvoicePreview,
     InvoicePreviewResponse
 )
+from app.schemas.invoice_history import (
+    InvoiceHistoryListResponse,
+    InvoiceHistoryResponse,
+    InvoiceHistoryItemResponse
+)
 from app.core.constants import UserRole, OdooModel
-from app.utils.timezone import get_ecuador_now
+from app.utils.timezone import get_ecuador_now_naive
 from .utils import extract_productos_from_xml, extract_productos_preview_from_xml, create_unified_xml, update_xml_with_barcodes, update_xml_with_barcodes_consolidated
 
 
 logger = logging.getLogger(__name__)
 
+# Built once: validates a history record's items in a single pydantic-core call
+_HISTORY_ITEMS_ADAPTER = TypeAdapter(List[InvoiceHistoryItemResponse])
+
 
 class FacturaService:
     """Service for processing facturas and generating Excel."""
@@ -109,20 +117,23 @@ class FacturaService:
                 self.db.add(pending_invoice)
                 self.db.flush()  # Get ID
 
-                # Create items
-                for producto in productos:
-                    item = PendingInvoiceItem(
-                        invoice_id=pending_invoice.id,
-                        codigo_original=producto['codigo'],
-                        product_name=producto['descripcion'],
-                        quantity=producto.get('cantidad', 0),
-                        cantidad_original=producto.get('cantidad', 0),
-                        barcode=None,  # Bodeguero will fill this
-                        unit_price=producto.get('precio_unitario'),
-                        total_price=producto.get('precio_total'),
-                        modified_by_bodeguero=False
-                    )
-                    self.db.add(item)
+                # Create items in a single multi-row INSERT
+                item_rows = [
+                    {
+                        "invoice_id": pending_invoice.id,
+                        "codigo_original": producto['codigo'],
+                        "product_name": producto['descripcion'],
+                        "quantity": producto.get('cantidad', 0),
+                        "cantidad_original": producto.get('cantidad', 0),
+                        "barcode": None,  # Bodeguero will fill this
+                        "unit_price": producto.get('precio_unitario'),
+                        "total_price": producto.get('precio_total'),
+                        "modified_by_bodeguero": False
+                    }
+                    for producto in productos
+                ]
+                if item_rows:
+                    self.db.execute(insert(PendingInvoiceItem), item_rows)
 
                 self.db.commit()
 
@@ -252,10 +263,10 @@ class FacturaService:
         invoices = query.all()
 
         # Convert to response with price filtering
-        invoice_responses = [
+        invoice_responses = tuple(
             self._invoice_to_response(invoice, user)
             for invoice in invoices
-        ]
+        )
 
         return PendingInvoiceListResponse(
             invoices=invoice_responses,
@@ -599,7 +610,7 @@ class FacturaService:
 
         # Update invoice
         invoice.status = InvoiceStatus.CORREGIDA
-        invoice.submitted_at = get_ecuador_now().replace(tzinfo=None)
+        invoice.submitted_at = get_ecuador_now_naive()
         invoice.submitted_by = user.username
         if notes:
             invoice.notes = notes
@@ -856,7 +867,7 @@ class FacturaService:
                         successful_items.append(item)
                     else:
                         item.sync_success = False
-                        item.sync_error = result.message
+                        item.sync_error = result.message[:1000] if result.message else None
                         failed_items.append({'item': item, 'error': result.message})
                         errors.append(f"{item.product_name} ({result.barcode}): {result.message}")
 
@@ -882,7 +893,7 @@ class FacturaService:
             # No items synced (keep current status)
             logger.warning(f"Invoice {invoice_id}: no items synced successfully")
 
-        invoice.synced_at = get_ecuador_now().replace(tzinfo=None)
+        invoice.synced_at = get_ecuador_now_naive()
         invoice.synced_by = user.username
         if notes:
             invoice.notes = (invoice.notes or "") + f"\nAdmin: {notes}"
@@ -986,12 +997,21 @@ class FacturaService:
         )
 
         total = query.count()
-        history_records = query.offset(skip).limit(limit).all()
-
-        history_responses = [
-            self._history_to_response(record)
+        # Items are fetched below as plain rows instead of ORM objects
+        history_records = query.options(noload(InvoiceHistory.items)).offset(skip).limit(limit).all()
+
+        items_by_history = defaultdict(list)
+        if history_records:
+            rows = self.db.execute(
+                InvoiceHistoryItem.items_select([record.id for record in history_records])
+            ).mappings()
+            for row in rows:
+                items_by_history[row["history_id"]].append(row)
+
+        history_responses = tuple(
+            self._history_to_response(record, items_by_history[record.id])
             for record in history_records
-        ]
+        )
 
         return InvoiceHistoryListResponse(
             history=history_responses,
@@ -1057,7 +1077,7 @@ class FacturaService:
             invoice_date=pending_invoice.invoice_date,
             uploaded_by=pending_invoice.uploaded_by_username,
             synced_by=synced_by,
-            synced_at=get_ecuador_now().replace(tzinfo=None),
+            synced_at=get_ecuador_now_naive(),
             total_items=len(pending_invoice.items),
             successful_items=len(successful_items),
             failed_items=len(failed_items),
@@ -1065,7 +1085,7 @@ class FacturaService:
             total_value=total_value if total_value > 0 else None,
             xml_content=pending_invoice.xml_content,
             has_errors=len(failed_items) > 0,
-            error_summary="; ".join([f"{f['item'].product_name}: {f['error']}" for f in failed_items]) if failed_items else None
+            error_summary="; ".join([f"{f['item'].product_name}: {f['error']}" for f in failed_items])[:1000] if failed_items else None
         )
 
         self.db.add(history)
@@ -1144,7 +1164,7 @@ class FacturaService:
             invoice_number=invoice.invoice_number,
             supplier_name=invoice.supplier_name,
             invoice_date=invoice.invoice_date,
-            status=invoice.status.value if isinstance(invoice.status, InvoiceStatus) else invoice.status,
+            status=invoice.status,
             uploaded_by_username=invoice.uploaded_by_username,
             xml_filename=invoice.xml_filename,
             barcode_source=invoice.barcode_source,
@@ -1342,24 +1362,9 @@ class FacturaService:
             product_id=item.product_id
         )
 
-    def _history_to_response(self, history: InvoiceHistory) -> InvoiceHistoryResponse:
-        """Convert history to response."""
-        items = [
-            InvoiceHistoryItemResponse(
-                id=item.id,
-                codigo_original=item.codigo_original,
-                barcode=item.barcode,
-                product_id=item.product_id,
-                product_name=item.product_name,
-                quantity=item.quantity,
-                unit_price=item.unit_price,
-                total_value=item.total_value,
-                success=item.success,
-                error_message=item.error_message,
-                was_modified=item.was_modified
-            )
-            for item in history.items
-        ]
+    def _history_to_response(self, history: InvoiceHistory, item_rows: List) -> InvoiceHistoryResponse:
+        """Convert history to response (item_rows from InvoiceHistoryItem.items_select())."""
+        items = _HISTORY_ITEMS_ADAPTER.validate_python(item_rows)
 
         return InvoiceHistoryResponse(
             id=history.id,
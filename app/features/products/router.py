@@ -29,7 +29,7 @@ from app.features.auth.dependencies import (
 )
 from app.features.products.service import ProductService
 from app.features.products.xml_parser import XMLInvoiceParser
-from app.core.constants import XMLProvider, QuantityMode
+from app.core.constants import XMLProvider
 from app.core.exceptions import ValidationError
 from app.utils.validators import validate_xml_file
 from app.models.product_sync_history import ProductSyncHistory, ProductSyncHistoryItem
@@ -175,12 +175,6 @@ async def sync_products(
         # Apply profit margin if needed
         parser = XMLInvoiceParser()
 
-        # Validate quantity mode
-        try:
-            mode = QuantityMode(request.quantity_mode)
-        except ValueError:
-            mode = QuantityMode.REPLACE
-
         # Sync products
         result = service.sync_products_bulk(
             products=request.products,
@@ -31,7 +31,7 @@ from app.utils.formatters import (
 )
 from app.utils.validators import validate_barcode, validate_quantity, validate_price
 from app.models.product_sync_history import ProductSyncHistory, ProductSyncHistoryItem
-from app.utils.timezone import get_ecuador_now
+from app.utils.timezone import get_ecuador_now_naive
 
 
 class ProductService:
@@ -834,6 +834,7 @@ class ProductService:
             error_summary = "; ".join(errors[:5])  # Limit to first 5 errors
             if len(errors) > 5:
                 error_summary += f" ... and {len(errors) - 5} more errors"
+            error_summary = error_summary[:1000]  # Fits the String(1000) column
 
         # Create main history record
         history = ProductSyncHistory(
@@ -843,7 +844,7 @@ class ProductService:
             quantity_mode=quantity_mode,
             apply_iva=apply_iva,
             executed_by=executed_by,
-            executed_at=get_ecuador_now().replace(tzinfo=None),  # SQLite needs naive datetime
+            executed_at=get_ecuador_now_naive(),
             total_items=total_items,
             successful_items=successful_items,
             failed_items=failed_items,
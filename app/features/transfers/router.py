@@ -29,17 +29,22 @@ from app.features.auth.dependencies import (
 )
 from app.features.transfers.service import TransferService
 from app.models import TransferStatus
+from app.utils.serialization import json_body, json_body_openapi, model_response
 
 
 router = APIRouter(prefix="/transfers", tags=["Transfers"])
 
 
-@router.post("/prepare", response_model=TransferResponse)
+@router.post(
+    "/prepare",
+    response_model=TransferResponse,
+    openapi_extra=json_body_openapi(TransferRequest)
+)
 def prepare_transfer(
-    request: TransferRequest,
+    current_user: UserInfo = Depends(require_admin_or_bodeguero_or_cajero),
+    request: TransferRequest = Depends(json_body(TransferRequest)),
     manager: OdooConnectionManager = Depends(get_odoo_manager),
-    db: Session = Depends(get_db),
-    current_user: UserInfo = Depends(require_admin_or_bodeguero_or_cajero)
+    db: Session = Depends(get_db)
 ):
     """
     Prepare a transfer (Step 1).
@@ -145,7 +150,7 @@ def get_pending_transfers(
 
         logger.info(f"Retrieved {result.total} pending transfers for {current_user.role.value}")
 
-        return result
+        return model_response(result)
 
     except Exception as e:
         logger.error(f"Error getting pending transfers: {str(e)}")
@@ -155,12 +160,16 @@ def get_pending_transfers(
         )
 
 
-@router.post("/verify", response_model=PendingTransferResponse)
+@router.post(
+    "/verify",
+    response_model=PendingTransferResponse,
+    openapi_extra=json_body_openapi(VerifyTransferRequest)
+)
 def verify_transfer(
-    request: VerifyTransferRequest,
+    current_user: UserInfo = Depends(require_bodeguero),
+    request: VerifyTransferRequest = Depends(json_body(VerifyTransferRequest)),
     manager: OdooConnectionManager = Depends(get_odoo_manager),
-    db: Session = Depends(get_db),
-    current_user: UserInfo = Depends(require_bodeguero)
+    db: Session = Depends(get_db)
 ):
     """
     Verify a transfer prepared by cajero (verification step).
@@ -254,12 +263,16 @@ def cancel_pending_transfer(
         )
 
 
-@router.post("/validate", response_model=TransferValidationResponse)
+@router.post(
+    "/validate",
+    response_model=TransferValidationResponse,
+    openapi_extra=json_body_openapi(TransferRequest)
+)
 def validate_transfer(
-    request: TransferRequest,
+    current_user: UserInfo = Depends(require_admin_or_bodeguero),
+    request: TransferRequest = Depends(json_body(TransferRequest)),
     manager: OdooConnectionManager = Depends(get_odoo_manager),
-    db: Session = Depends(get_db),
-    current_user: UserInfo = Depends(require_admin_or_bodeguero)
+    db: Session = Depends(get_db)
 ):
     """
     Validate transfer items without making changes.
@@ -287,13 +300,17 @@ def validate_transfer(
         )
 
 
-@router.post("/confirm", response_model=TransferResponse)
+@router.post(
+    "/confirm",
+    response_model=TransferResponse,
+    openapi_extra=json_body_openapi(ConfirmTransferRequest)
+)
 def confirm_transfer(
-    request: ConfirmTransferRequest,
+    current_user: UserInfo = Depends(require_admin),
+    request: ConfirmTransferRequest = Depends(json_body(ConfirmTransferRequest)),
     transfer_id: int = None,
     manager: OdooConnectionManager = Depends(get_odoo_manager),
-    db: Session = Depends(get_db),
-    current_user: UserInfo = Depends(require_admin)
+    db: Session = Depends(get_db)
 ):
     """
     Confirm and execute transfer (Step 2).
@@ -446,6 +463,7 @@ def get_transfer_history(
     - Total count
     """
     import logging
+    from sqlalchemy.orm import selectinload
     from app.models.transfer_history import TransferHistory
     from app.models.pending_transfer import PendingTransfer, TransferStatus
     from app.schemas.transfer import TransferHistoryItemResponse
@@ -456,7 +474,7 @@ def get_transfer_history(
         all_records = []
 
         # 1. Get completed transfers (from transfer_history)
-        completed_query = db.query(TransferHistory)
+        completed_query = db.query(TransferHistory).options(selectinload(TransferHistory.items))
 
         # Apply filters for completed transfers
         if destination_location_id:
@@ -484,9 +502,9 @@ def get_transfer_history(
                 "has_errors": record.has_errors,
                 "error_summary": record.error_summary,
                 "pdf_filename": record.pdf_filename,
-                "items": [TransferHistoryItemResponse.model_validate(item) for item in record.items]
+                "items": [TransferHistoryItemResponse.from_orm_fast(item) for item in record.items]
             }
-            all_records.append((record.executed_at, TransferHistoryResponse(**history_dict)))
+            all_records.append((record.executed_at, TransferHistoryResponse.model_construct(**history_dict)))
 
         # 2. Get pending, cancelled, and confirmed (without history) transfers (from pending_transfers)
         # Note: CONFIRMED transfers should have a history record, but we include them
@@ -534,7 +552,7 @@ def get_transfer_history(
                     "total_value": 0,
                     "is_new_product": False
                 }
-                items_list.append(item_dict)
+                items_list.append(TransferHistoryItemResponse.model_construct(**item_dict))
 
             history_dict = {
                 "id": pending.id,
@@ -555,7 +573,7 @@ def get_transfer_history(
                 "pdf_filename": None,
                 "items": items_list
             }
-            all_records.append((pending.created_at, TransferHistoryResponse(**history_dict)))
+            all_records.append((pending.created_at, TransferHistoryResponse.model_construct(**history_dict)))
 
         # 3. Sort all records by date (most recent first)
         all_records.sort(key=lambda x: x[0], reverse=True)
@@ -566,10 +584,10 @@ def get_transfer_history(
 
         logger.info(f"Retrieved {len(paginated_records)} transfer history records for admin (total: {total})")
 
-        return TransferHistoryListResponse(
+        return model_response(TransferHistoryListResponse(
             history=paginated_records,
             total=total
-        )
+        ))
 
     except Exception as e:
         logger.error(f"Error retrieving transfer history: {str(e)}")
@@ -601,6 +619,7 @@ def get_my_transfer_history(
     - Total count
     """
     import logging
+    from sqlalchemy.orm import selectinload
     from app.models.transfer_history import TransferHistory
     from app.models.pending_transfer import PendingTransfer, TransferStatus
     from app.schemas.transfer import TransferHistoryItemResponse
@@ -612,7 +631,9 @@ def get_my_transfer_history(
 
         # 1. Get completed transfers (from transfer_history)
         # Include transfers executed by user OR prepared by user (even if executed by admin)
-        completed_query = db.query(TransferHistory).outerjoin(
+        completed_query = db.query(TransferHistory).options(
+            selectinload(TransferHistory.items)
+        ).outerjoin(
             PendingTransfer,
             TransferHistory.pending_transfer_id == PendingTransfer.id
         ).filter(
@@ -639,9 +660,9 @@ def get_my_transfer_history(
                 "has_errors": record.has_errors,
                 "error_summary": record.error_summary,
                 "pdf_filename": record.pdf_filename,
-                "items": [TransferHistoryItemResponse.model_validate(item) for item in record.items]
+                "items": [TransferHistoryItemResponse.from_orm_fast(item) for item in record.items]
             }
-            all_records.append((record.executed_at, TransferHistoryResponse(**history_dict)))
+            all_records.append((record.executed_at, TransferHistoryResponse.model_construct(**history_dict)))
 
         # 2. Get pending, cancelled, and confirmed (without history) transfers (from pending_transfers)
         # Note: CONFIRMED transfers should have a history record, but we include them
@@ -683,7 +704,7 @@ def get_my_transfer_history(
                     "total_value": 0,
                     "is_new_product": False
                 }
-                items_list.append(item_dict)
+                items_list.append(TransferHistoryItemResponse.model_construct(**item_dict))
 
             history_dict = {
                 "id": pending.id,
@@ -704,7 +725,7 @@ def get_my_transfer_history(
                 "pdf_filename": None,
                 "items": items_list
             }
-            all_records.append((pending.created_at, TransferHistoryResponse(**history_dict)))
+            all_records.append((pending.created_at, TransferHistoryResponse.model_construct(**history_dict)))
 
         # 3. Sort all records by date (most recent first)
         all_records.sort(key=lambda x: x[0], reverse=True)
@@ -715,10 +736,10 @@ def get_my_transfer_history(
 
         logger.info(f"Retrieved {len(paginated_records)} transfer history records for user {current_user.username} (total: {total})")
 
-        return TransferHistoryListResponse(
+        return model_response(TransferHistoryListResponse(
             history=paginated_records,
             total=total
-        )
+        ))
 
     except Exception as e:
         logger.error(f"Error retrieving user transfer history: {str(e)}")
@@ -801,10 +822,10 @@ def get_transfer_history_detail(
             "has_errors": history.has_errors,
             "error_summary": history.error_summary,
             "pdf_filename": history.pdf_filename,
-            "items": [TransferHistoryItemResponse.model_validate(item) for item in history.items]
+            "items": [TransferHistoryItemResponse.from_orm_fast(item) for item in history.items]
         }
 
-        return TransferHistoryResponse(**history_dict)
+        return TransferHistoryResponse.model_construct(**history_dict)
 
     except HTTPException:
         raise
@@ -832,9 +853,8 @@ def download_transfer_pdf(
     - Bodeguero/Cajero: Can only download PDFs for their own transfers
     """
     import logging
-    import base64
     from fastapi.responses import Response
-    from app.models.transfer_history import TransferHistory
+    from app.models.transfer_history import TransferHistory, TransferHistoryBlob
     from app.models.pending_transfer import PendingTransfer
 
     logger = logging.getLogger(__name__)
@@ -863,15 +883,13 @@ def download_transfer_pdf(
                     detail="Not authorized to download this PDF"
                 )
 
-        if not history.pdf_content:
+        pdf_bytes = db.query(TransferHistoryBlob.pdf_bytes).filter_by(history_id=history_id).scalar()
+        if not pdf_bytes:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="PDF not available for this transfer"
             )
 
-        # Decode base64 PDF content
-        pdf_bytes = base64.b64decode(history.pdf_content)
-
         filename = history.pdf_filename or f"transfer_{history_id}.pdf"
 
         logger.info(f"Downloading PDF for transfer history {history_id}: {filename}")
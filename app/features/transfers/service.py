@@ -4,6 +4,7 @@ Two-step process: prepare (validate) then confirm (execute).
 """
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.infrastructure.odoo import OdooClient
 from app.schemas.transfer import (
@@ -24,7 +25,7 @@ from app.core.exceptions import (
     ProductNotFoundError
 )
 from app.utils.formatters import format_decimal_for_odoo
-from app.models import PendingTransfer, PendingTransferItem, TransferStatus
+from app.models import PendingTransfer, PendingTransferItem, TransferStatus, TRANSFER_STATUSES
 
 
 class TransferService:
@@ -752,10 +753,10 @@ class TransferService:
         Raises:
             Exception: If database operations fail
         """
-        import json
+        import base64
         import logging
-        from app.models.transfer_history import TransferHistory, TransferHistoryItem
-        from app.utils.timezone import get_ecuador_now
+        from app.models.transfer_history import TransferHistory, TransferHistoryBlob, TransferHistoryItem
+        from app.utils.timezone import get_ecuador_now_naive
 
         logger = logging.getLogger(__name__)
         logger.info(f"Creating transfer history record for destination: {destination_location_name}")
@@ -773,7 +774,7 @@ class TransferService:
         # Build error summary
         error_summary = None
         if errors:
-            error_summary = "; ".join(errors)
+            error_summary = "; ".join(errors)[:1000]  # Fits the String(1000) column
 
         # Create main history record
         history = TransferHistory(
@@ -782,51 +783,58 @@ class TransferService:
             destination_location_id=destination_location_id,
             destination_location_name=destination_location_name,
             executed_by=executed_by,
-            executed_at=get_ecuador_now().replace(tzinfo=None),  # SQLite needs naive datetime
+            executed_at=get_ecuador_now_naive(),
             total_items=total_items,
             successful_items=successful_items,
             failed_items=failed_items,
             total_quantity_requested=total_quantity_requested,
             total_quantity_transferred=total_quantity_transferred,
-            pdf_content=pdf_content,
             pdf_filename=pdf_filename,
-            xml_content=xml_content,
-            origin_snapshots_before=json.dumps(origin_before),
-            origin_snapshots_after=json.dumps(origin_after),
-            destination_snapshots_before=json.dumps(destination_before),
-            destination_snapshots_after=json.dumps(destination_after),
-            new_products=json.dumps(new_products),
+            origin_snapshots_before=origin_before,
+            origin_snapshots_after=origin_after,
+            destination_snapshots_before=destination_before,
+            destination_snapshots_after=destination_after,
+            new_products=new_products,
             has_errors=len(errors) > 0,
             error_summary=error_summary
         )
+        if pdf_content or xml_content:
+            history.blob = TransferHistoryBlob(
+                pdf_bytes=base64.b64decode(pdf_content) if pdf_content else None,
+                xml_content=xml_content
+            )
 
         self.db.add(history)
         self.db.flush()  # Get ID for items
 
         logger.info(f"Transfer history record created with ID: {history.id}")
 
-        # Create individual item records
-        for product in all_products:
-            is_successful = product in successful_products
-
-            item = TransferHistoryItem(
-                history_id=history.id,
-                barcode=product.get('barcode', ''),
-                product_id=product.get('product_id', 0),
-                product_name=product.get('product_name', ''),
-                quantity_requested=product.get('quantity_requested', 0),
-                quantity_transferred=product.get('quantity_transferred', 0) if is_successful else 0,
-                success=is_successful,
-                error_message=product.get('error') if not is_successful else None,
-                stock_origin_before=product.get('stock_before'),
-                stock_origin_after=product.get('stock_after'),
-                stock_destination_before=product.get('dest_stock_before'),
-                stock_destination_after=product.get('dest_stock_after'),
-                unit_price=product.get('unit_price'),
-                total_value=product.get('quantity_transferred', 0) * product.get('unit_price', 0) if is_successful else 0,
-                is_new_product=product.get('barcode', '') in [p.get('barcode', '') for p in new_products]
-            )
-            self.db.add(item)
+        # Create individual item records in a single multi-row INSERT
+        # (all_products lists successful products first)
+        new_product_barcodes = {p.get('barcode', '') for p in new_products}
+        item_rows = []
+        for index, product in enumerate(all_products):
+            is_successful = index < successful_items
+
+            item_rows.append({
+                "history_id": history.id,
+                "barcode": product.get('barcode', ''),
+                "product_id": product.get('product_id', 0),
+                "product_name": product.get('product_name', ''),
+                "quantity_requested": product.get('quantity_requested', 0),
+                "quantity_transferred": product.get('quantity_transferred', 0) if is_successful else 0,
+                "success": is_successful,
+                "error_message": product.get('error') if not is_successful else None,
+                "stock_origin_before": product.get('stock_before'),
+                "stock_origin_after": product.get('stock_after'),
+                "stock_destination_before": product.get('dest_stock_before'),
+                "stock_destination_after": product.get('dest_stock_after'),
+                "unit_price": product.get('unit_price'),
+                "total_value": product.get('quantity_transferred', 0) * product.get('unit_price', 0) if is_successful else 0,
+                "is_new_product": product.get('barcode', '') in new_product_barcodes
+            })
+        if item_rows:
+            self.db.execute(insert(TransferHistoryItem), item_rows)
 
         # Commit all changes
         self.db.commit()
@@ -888,18 +896,21 @@ class TransferService:
             self.db.add(pending_transfer)
             self.db.flush()  # Get the ID
 
-            # Create transfer items
-            for item, details in zip(items, product_details):
-                transfer_item = PendingTransferItem(
-                    transfer_id=pending_transfer.id,
-                    barcode=item.barcode,
-                    product_id=details.get('product_id', 0),
-                    product_name=details['name'],
-                    quantity=item.quantity,
-                    available_stock=int(details['stock_before']),
-                    unit_price=details.get('list_price', 0)
-                )
-                self.db.add(transfer_item)
+            # Create transfer items in a single multi-row INSERT
+            item_rows = [
+                {
+                    "transfer_id": pending_transfer.id,
+                    "barcode": item.barcode,
+                    "product_id": details.get('product_id', 0),
+                    "product_name": details['name'],
+                    "quantity": item.quantity,
+                    "available_stock": int(details['stock_before']),
+                    "unit_price": details.get('list_price', 0)
+                }
+                for item, details in zip(items, product_details)
+            ]
+            if item_rows:
+                self.db.execute(insert(PendingTransferItem), item_rows)
 
             self.db.commit()
             self.db.refresh(pending_transfer)
@@ -960,7 +971,7 @@ class TransferService:
         transfers = query.options(selectinload(PendingTransfer.items)).order_by(PendingTransfer.created_at.desc()).all()
 
         return PendingTransferListResponse(
-            transfers=[PendingTransferResponse.model_validate(t) for t in transfers],
+            transfers=[PendingTransferResponse.from_orm_fast(t) for t in transfers],
             total=len(transfers)
         )
 
@@ -984,12 +995,12 @@ class TransferService:
         if not transfer:
             return None
 
-        return PendingTransferResponse.model_validate(transfer)
+        return PendingTransferResponse.from_orm_fast(transfer)
 
     def update_transfer_status(
         self,
         transfer_id: int,
-        status: TransferStatus,
+        status: str,
         confirmed_by: Optional[str] = None
     ) -> PendingTransferResponse:
         """
@@ -1009,6 +1020,9 @@ class TransferService:
         if not self.db:
             raise TransferError("Database session required")
 
+        if status not in TRANSFER_STATUSES:
+            raise TransferError(f"Invalid transfer status: {status}")
+
         transfer = self.db.query(PendingTransfer).filter(
             PendingTransfer.id == transfer_id
         ).first()
@@ -1017,13 +1031,13 @@ class TransferService:
             raise TransferError(f"Transfer {transfer_id} not found")
 
         try:
-            from app.utils.timezone import get_ecuador_now
+            from app.utils.timezone import get_ecuador_now_naive
 
             transfer.status = status
-            transfer.updated_at = get_ecuador_now().replace(tzinfo=None)
+            transfer.updated_at = get_ecuador_now_naive()
 
             if status == TransferStatus.CONFIRMED and confirmed_by:
-                transfer.confirmed_at = get_ecuador_now().replace(tzinfo=None)
+                transfer.confirmed_at = get_ecuador_now_naive()
                 transfer.confirmed_by = confirmed_by
 
             self.db.commit()
@@ -1072,7 +1086,7 @@ class TransferService:
             )
 
         try:
-            from app.utils.timezone import get_ecuador_now
+            from app.utils.timezone import get_ecuador_now_naive
 
             # Update items if they were edited
             if items:
@@ -1110,9 +1124,9 @@ class TransferService:
 
             # Update transfer status and verification fields
             transfer.status = TransferStatus.PENDING
-            transfer.verified_at = get_ecuador_now().replace(tzinfo=None)
+            transfer.verified_at = get_ecuador_now_naive()
             transfer.verified_by = verified_by
-            transfer.updated_at = get_ecuador_now().replace(tzinfo=None)
+            transfer.updated_at = get_ecuador_now_naive()
 
             self.db.commit()
             self.db.refresh(transfer)
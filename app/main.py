@@ -6,7 +6,6 @@ import logging
 import sys
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from contextlib import asynccontextmanager
@@ -22,6 +21,7 @@ logging.basicConfig(
 from app.core.database import init_db, close_db
 from app.migrations.runner import run_migrations
 from app.core.exceptions import AppException
+from app.utils.serialization import ORJSONResponse, add_json_body_schemas
 from app.middleware.error_handler import (
     app_exception_handler,
     http_exception_handler,
@@ -112,6 +112,7 @@ app = FastAPI(
     version=settings.APP_VERSION,
     description="API for syncing products and managing transfers between Odoo locations",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc"
 )
@@ -155,6 +156,22 @@ app.include_router(inconsistencies_router, prefix="/api")
 app.include_router(facturas_router, prefix="/api")
 app.include_router(settings_router, prefix="/api")
 
+_default_openapi = app.openapi
+
+
+def custom_openapi() -> dict:
+    """Build the OpenAPI schema once, registering json_body request schemas and adding examples outside production."""
+    if app.openapi_schema is None:
+        openapi_schema = _default_openapi()
+        add_json_body_schemas(openapi_schema)
+        if settings.ENVIRONMENT != "production":
+            from app.schemas.examples import add_examples
+            add_examples(openapi_schema)
+    return app.openapi_schema
+
+
+app.openapi = custom_openapi
+
 
 @app.get("/", tags=["Root"])
 async def root():
@@ -235,7 +252,7 @@ async def connect_principal(credentials: dict):
             "data": result
         }
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "success": False,
@@ -261,7 +278,7 @@ async def connect_branch(request: dict):
         # Get location configuration
         location = LocationService.get_location_by_id(branch_request.location_id)
         if not location:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={
                     "success": False,
@@ -287,7 +304,7 @@ async def connect_branch(request: dict):
             "data": result
         }
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "success": False,
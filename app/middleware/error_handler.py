@@ -2,13 +2,13 @@
 Global error handling middleware.
 """
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from app.utils.serialization import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from app.core.exceptions import AppException, exception_to_http_exception
 
 
-async def app_exception_handler(request: Request, exc: AppException) -> JSONResponse:
+async def app_exception_handler(request: Request, exc: AppException) -> ORJSONResponse:
     """
     Handler for custom application exceptions.
 
@@ -19,7 +19,7 @@ async def app_exception_handler(request: Request, exc: AppException) -> JSONResp
     Returns:
         JSON error response
     """
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "success": False,
@@ -33,7 +33,7 @@ async def app_exception_handler(request: Request, exc: AppException) -> JSONResp
     )
 
 
-async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> ORJSONResponse:
     """
     Handler for HTTP exceptions.
 
@@ -44,7 +44,7 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException)
     Returns:
         JSON error response
     """
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "success": False,
@@ -58,7 +58,7 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException)
     )
 
 
-async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+async def validation_exception_handler(request: Request, exc: RequestValidationError) -> ORJSONResponse:
     """
     Handler for request validation errors.
 
@@ -77,7 +77,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
             "type": error["type"]
         })
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "success": False,
@@ -91,7 +91,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     )
 
 
-async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def generic_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """
     Handler for uncaught exceptions.
 
@@ -109,7 +109,7 @@ async def generic_exception_handler(request: Request, exc: Exception) -> JSONRes
     logger.error(f"Unhandled exception: {str(exc)}")
     logger.error(traceback.format_exc())
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "success": False,
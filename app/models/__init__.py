@@ -4,16 +4,19 @@ Database models.
 from app.models.user import User
 from app.models.odoo_connection import OdooConnection
 from app.models.audit_log import AuditLog
-from app.models.pending_transfer import PendingTransfer, PendingTransferItem, TransferStatus
+from app.models.pending_transfer import PendingTransfer, PendingTransferItem, TransferStatus, TRANSFER_STATUSES
 from app.models.pending_adjustment import (
     PendingAdjustment,
     PendingAdjustmentItem,
     AdjustmentStatus,
     AdjustmentType,
-    AdjustmentReason
+    AdjustmentReason,
+    ADJUSTMENT_STATUSES,
+    ADJUSTMENT_TYPES,
+    ADJUSTMENT_REASONS
 )
 from app.models.product_sync_history import ProductSyncHistory, ProductSyncHistoryItem
-from app.models.pending_invoice import PendingInvoice, PendingInvoiceItem, InvoiceStatus
+from app.models.pending_invoice import PendingInvoice, PendingInvoiceItem, InvoiceStatus, INVOICE_STATUSES
 from app.models.invoice_history import InvoiceHistory, InvoiceHistoryItem
 from app.models.app_setting import AppSetting
 
@@ -24,16 +27,21 @@ __all__ = [
     "PendingTransfer",
     "PendingTransferItem",
     "TransferStatus",
+    "TRANSFER_STATUSES",
     "PendingAdjustment",
     "PendingAdjustmentItem",
     "AdjustmentStatus",
     "AdjustmentType",
     "AdjustmentReason",
+    "ADJUSTMENT_STATUSES",
+    "ADJUSTMENT_TYPES",
+    "ADJUSTMENT_REASONS",
     "ProductSyncHistory",
     "ProductSyncHistoryItem",
     "PendingInvoice",
     "PendingInvoiceItem",
     "InvoiceStatus",
+    "INVOICE_STATUSES",
     "InvoiceHistory",
     "InvoiceHistoryItem",
     "AppSetting"
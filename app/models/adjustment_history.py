@@ -2,11 +2,34 @@
 Adjustment History Models
 Stores complete historical records of executed adjustments with all details.
 """
+from operator import attrgetter
 from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text, ForeignKey
-from sqlalchemy.orm import relationship
-from app.core.database import Base
+from sqlalchemy.orm import relationship, deferred
+from app.core.database import Base, JSONVariant
 from app.utils.timezone import get_ecuador_now
-import json
+from app.utils.serialization import serialize_rows
+
+
+# Columns exposed by AdjustmentHistoryItem.to_dict, in response order
+_ITEM_FIELDS = (
+    "id",
+    "history_id",
+    "barcode",
+    "product_id",
+    "product_name",
+    "quantity_requested",
+    "quantity_adjusted",
+    "adjustment_type",
+    "reason",
+    "success",
+    "error_message",
+    "stock_before",
+    "stock_after",
+    "unit_price",
+    "total_value",
+    "created_at",
+)
+_get_item_fields = attrgetter(*_ITEM_FIELDS)
 
 
 class AdjustmentHistory(Base):
@@ -35,22 +58,22 @@ class AdjustmentHistory(Base):
     total_quantity_adjusted = Column(Integer, nullable=False)
 
     # Generated reports (stored as base64/text)
-    pdf_content = Column(Text, nullable=True)  # Base64 encoded PDF
+    pdf_content = deferred(Column(Text, nullable=True))  # Base64 encoded PDF
     pdf_filename = Column(String(255), nullable=True)
-    xml_content = Column(Text, nullable=True)
+    xml_content = deferred(Column(Text, nullable=True))
 
-    # Stock snapshots (stored as JSON)
-    snapshots_before = Column(Text, nullable=True)  # JSON array
-    snapshots_after = Column(Text, nullable=True)
+    # Stock snapshots
+    snapshots_before = Column(JSONVariant, nullable=True)  # JSON array
+    snapshots_after = Column(JSONVariant, nullable=True)
 
     # Error tracking
     has_errors = Column(Boolean, default=False)
-    error_summary = Column(Text, nullable=True)
+    error_summary = Column(String(1000), nullable=True)
 
     created_at = Column(DateTime, default=get_ecuador_now)
 
     # Relationships
-    items = relationship("AdjustmentHistoryItem", back_populates="history", cascade="all, delete-orphan")
+    items = relationship("AdjustmentHistoryItem", cascade="all, delete-orphan", lazy="selectin")
     pending_adjustment = relationship("PendingAdjustment", foreign_keys=[pending_adjustment_id])
 
     def to_dict(self):
@@ -61,7 +84,7 @@ class AdjustmentHistory(Base):
             "location": self.location,
             "location_name": self.location_name,
             "executed_by": self.executed_by,
-            "executed_at": self.executed_at.isoformat() if self.executed_at else None,
+            "executed_at": self.executed_at,
             "total_items": self.total_items,
             "successful_items": self.successful_items,
             "failed_items": self.failed_items,
@@ -70,10 +93,10 @@ class AdjustmentHistory(Base):
             "pdf_filename": self.pdf_filename,
             "has_errors": self.has_errors,
             "error_summary": self.error_summary,
-            "items": [item.to_dict() for item in self.items] if self.items else [],
-            "snapshots_before": json.loads(self.snapshots_before) if self.snapshots_before else [],
-            "snapshots_after": json.loads(self.snapshots_after) if self.snapshots_after else [],
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "items": serialize_rows(_ITEM_FIELDS, _get_item_fields, self.items),
+            "snapshots_before": self.snapshots_before or [],
+            "snapshots_after": self.snapshots_after or [],
+            "created_at": self.created_at,
         }
 
 
@@ -114,26 +137,6 @@ class AdjustmentHistoryItem(Base):
 
     created_at = Column(DateTime, default=get_ecuador_now)
 
-    # Relationship
-    history = relationship("AdjustmentHistory", back_populates="items")
-
     def to_dict(self):
         """Convert to dictionary for API responses"""
-        return {
-            "id": self.id,
-            "history_id": self.history_id,
-            "barcode": self.barcode,
-            "product_id": self.product_id,
-            "product_name": self.product_name,
-            "quantity_requested": self.quantity_requested,
-            "quantity_adjusted": self.quantity_adjusted,
-            "adjustment_type": self.adjustment_type,
-            "reason": self.reason,
-            "success": self.success,
-            "error_message": self.error_message,
-            "stock_before": self.stock_before,
-            "stock_after": self.stock_after,
-            "unit_price": self.unit_price,
-            "total_value": self.total_value,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-        }
+        return dict(zip(_ITEM_FIELDS, _get_item_fields(self)))
@@ -38,5 +38,5 @@ class AuditLog(Base):
             "resource": self.resource,
             "details": self.details,
             "ip_address": self.ip_address,
-            "created_at": self.created_at.isoformat() if self.created_at else None
+            "created_at": self.created_at
         }
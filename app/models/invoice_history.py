@@ -3,15 +3,32 @@ Invoice History models for tracking completed invoice syncs.
 Stores historical record of invoice synchronizations to Odoo.
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, Text, DateTime, Boolean, ForeignKey
-from sqlalchemy.orm import relationship
+from operator import attrgetter
+from sqlalchemy import Column, Integer, String, Float, Text, DateTime, Boolean, ForeignKey, select
+from sqlalchemy.orm import relationship, deferred
 from app.core.database import Base
-from app.utils.timezone import get_ecuador_now
-
-
-def _get_ecuador_now():
-    """Wrapper for SQLAlchemy default."""
-    return get_ecuador_now().replace(tzinfo=None)  # SQLite needs naive datetime
+from app.utils.timezone import get_ecuador_now_naive
+from app.utils.serialization import serialize_rows
+
+
+# Columns exposed by InvoiceHistoryItem.to_dict, in response order
+_ITEM_FIELDS = (
+    "id",
+    "history_id",
+    "codigo_original",
+    "barcode",
+    "product_id",
+    "product_name",
+    "quantity",
+    "unit_price",
+    "sale_price",
+    "total_value",
+    "success",
+    "error_message",
+    "was_modified",
+    "created_at",
+)
+_get_item_fields = attrgetter(*_ITEM_FIELDS)
 
 
 class InvoiceHistory(Base):
@@ -35,7 +52,7 @@ class InvoiceHistory(Base):
     # Tracking
     uploaded_by = Column(String(50), nullable=False)
     synced_by = Column(String(50), nullable=False)
-    synced_at = Column(DateTime, default=_get_ecuador_now, nullable=False, index=True)
+    synced_at = Column(DateTime, default=get_ecuador_now_naive, nullable=False, index=True)
 
     # Summary statistics
     total_items = Column(Integer, default=0, nullable=False)
@@ -45,17 +62,17 @@ class InvoiceHistory(Base):
     total_value = Column(Float, nullable=True)
 
     # XML content (optional, can be large)
-    xml_content = Column(Text, nullable=True)
+    xml_content = deferred(Column(Text, nullable=True))
 
     # Error tracking
     has_errors = Column(Boolean, default=False, nullable=False)
-    error_summary = Column(Text, nullable=True)
+    error_summary = Column(String(1000), nullable=True)
 
     # Timestamps
-    created_at = Column(DateTime, default=_get_ecuador_now, nullable=False)
+    created_at = Column(DateTime, default=get_ecuador_now_naive, nullable=False)
 
     # Relationship to items
-    items = relationship("InvoiceHistoryItem", back_populates="history", cascade="all, delete-orphan")
+    items = relationship("InvoiceHistoryItem", cascade="all, delete-orphan", lazy="selectin")
 
     def __repr__(self) -> str:
         return f"<InvoiceHistory(id={self.id}, invoice='{self.invoice_number}', items={self.total_items}, success={self.successful_items}, failed={self.failed_items})>"
@@ -67,10 +84,10 @@ class InvoiceHistory(Base):
             "pending_invoice_id": self.pending_invoice_id,
             "invoice_number": self.invoice_number,
             "supplier_name": self.supplier_name,
-            "invoice_date": self.invoice_date.isoformat() if self.invoice_date else None,
+            "invoice_date": self.invoice_date,
             "uploaded_by": self.uploaded_by,
             "synced_by": self.synced_by,
-            "synced_at": self.synced_at.isoformat() if self.synced_at else None,
+            "synced_at": self.synced_at,
             "total_items": self.total_items,
             "successful_items": self.successful_items,
             "failed_items": self.failed_items,
@@ -78,8 +95,8 @@ class InvoiceHistory(Base):
             "total_value": self.total_value,
             "has_errors": self.has_errors,
             "error_summary": self.error_summary,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "items": [item.to_dict() for item in self.items] if self.items else []
+            "created_at": self.created_at,
+            "items": serialize_rows(_ITEM_FIELDS, _get_item_fields, self.items)
         }
 
 
@@ -114,29 +131,25 @@ class InvoiceHistoryItem(Base):
     was_modified = Column(Boolean, default=False, nullable=False)
 
     # Timestamp
-    created_at = Column(DateTime, default=_get_ecuador_now, nullable=False)
-
-    # Relationship to history
-    history = relationship("InvoiceHistory", back_populates="items")
+    created_at = Column(DateTime, default=get_ecuador_now_naive, nullable=False)
 
     def __repr__(self) -> str:
         return f"<InvoiceHistoryItem(id={self.id}, codigo='{self.codigo_original}', success={self.success})>"
 
     def to_dict(self) -> dict:
         """Convert item to dictionary representation."""
-        return {
-            "id": self.id,
-            "history_id": self.history_id,
-            "codigo_original": self.codigo_original,
-            "barcode": self.barcode,
-            "product_id": self.product_id,
-            "product_name": self.product_name,
-            "quantity": self.quantity,
-            "unit_price": self.unit_price,
-            "sale_price": self.sale_price,
-            "total_value": self.total_value,
-            "success": self.success,
-            "error_message": self.error_message,
-            "was_modified": self.was_modified,
-            "created_at": self.created_at.isoformat() if self.created_at else None
-        }
+        return dict(zip(_ITEM_FIELDS, _get_item_fields(self)))
+
+    @classmethod
+    def items_select(cls, history_ids):
+        """
+        Build a Core SELECT of the items for the given history records.
+
+        Rows bypass ORM hydration and the identity map; use .mappings()
+        to get dict-like rows keyed by column name.
+        """
+        return (
+            select(*(getattr(cls, name) for name in _ITEM_FIELDS))
+            .where(cls.history_id.in_(history_ids))
+            .order_by(cls.id)
+        )
@@ -34,5 +34,5 @@ class OdooConnection(Base):
             "database": self.database,
             "port": self.port,
             "is_active": self.is_active,
-            "created_at": self.created_at.isoformat() if self.created_at else None
+            "created_at": self.created_at
         }
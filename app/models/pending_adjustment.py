@@ -3,34 +3,28 @@ Pending Adjustment models for database persistence.
 Stores inventory adjustments prepared by bodeguero awaiting admin confirmation.
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, DateTime, Enum as SQLEnum, ForeignKey, Text
+from sqlalchemy import Column, Index, Integer, String, Float, DateTime, ForeignKey, Text, text
 from sqlalchemy.orm import relationship
 from app.core.database import Base
-from app.utils.timezone import get_ecuador_now
-from enum import Enum
+from app.utils.timezone import get_ecuador_now_naive
 
 
-def _get_ecuador_now():
-    """Wrapper for SQLAlchemy default."""
-    return get_ecuador_now().replace(tzinfo=None)  # SQLite needs naive datetime
-
-
-class AdjustmentStatus(str, Enum):
-    """Adjustment status enum."""
+class AdjustmentStatus:
+    """Adjustment status values (stored as plain strings)."""
     PENDING = "pending"
     CONFIRMED = "confirmed"
     REJECTED = "rejected"
 
 
-class AdjustmentType(str, Enum):
-    """Adjustment type enum."""
+class AdjustmentType:
+    """Adjustment type values (stored as plain strings)."""
     ENTRY = "entry"
     EXIT = "exit"
     ADJUSTMENT = "adjustment"
 
 
-class AdjustmentReason(str, Enum):
-    """Adjustment reason enum."""
+class AdjustmentReason:
+    """Adjustment reason values (stored as plain strings)."""
     # ENTRY reasons
     PURCHASE = "purchase"
     RETURN_IN = "return_in"
@@ -49,6 +43,35 @@ class AdjustmentReason(str, Enum):
     SYSTEM_CORRECTION = "system_correction"
 
 
+ADJUSTMENT_STATUSES = frozenset({
+    AdjustmentStatus.PENDING,
+    AdjustmentStatus.CONFIRMED,
+    AdjustmentStatus.REJECTED,
+})
+
+ADJUSTMENT_TYPES = frozenset({
+    AdjustmentType.ENTRY,
+    AdjustmentType.EXIT,
+    AdjustmentType.ADJUSTMENT,
+})
+
+ADJUSTMENT_REASONS = frozenset({
+    AdjustmentReason.PURCHASE,
+    AdjustmentReason.RETURN_IN,
+    AdjustmentReason.CORRECTION_IN,
+    AdjustmentReason.SALE,
+    AdjustmentReason.DAMAGE,
+    AdjustmentReason.LOSS,
+    AdjustmentReason.THEFT,
+    AdjustmentReason.RETURN_OUT,
+    AdjustmentReason.CORRECTION_OUT,
+    AdjustmentReason.LOCAL_SERVICE_USE,
+    AdjustmentReason.EXPIRED,
+    AdjustmentReason.PHYSICAL_COUNT,
+    AdjustmentReason.SYSTEM_CORRECTION,
+})
+
+
 class PendingAdjustment(Base):
     """
     Main adjustment record prepared by bodeguero.
@@ -56,28 +79,33 @@ class PendingAdjustment(Base):
     """
 
     __tablename__ = "pending_adjustments"
+    __table_args__ = (
+        Index("ix_pending_adjustments_status_created_at", "status", "created_at"),
+        # Partial index for the admin confirmation queue
+        Index(
+            "ix_pending_adjustments_pending",
+            "created_at",
+            sqlite_where=text("status = 'pending'"),
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True)  # Nullable for Odoo admins
     username = Column(String(50), nullable=False)  # For easy display
-    adjustment_type = Column(
-        SQLEnum(AdjustmentType, values_callable=lambda obj: [e.value for e in obj]),
-        nullable=False,
-        index=True
-    )
+    adjustment_type = Column(String(20), nullable=False, index=True)
     status = Column(
-        SQLEnum(AdjustmentStatus, values_callable=lambda obj: [e.value for e in obj]),
+        String(20),
         nullable=False,
-        default=AdjustmentStatus.PENDING,
-        index=True
+        default=AdjustmentStatus.PENDING
     )
-    created_at = Column(DateTime, default=_get_ecuador_now, nullable=False)
-    updated_at = Column(DateTime, default=_get_ecuador_now, onupdate=_get_ecuador_now, nullable=False)
+    created_at = Column(DateTime, default=get_ecuador_now_naive, nullable=False)
+    updated_at = Column(DateTime, default=get_ecuador_now_naive, onupdate=get_ecuador_now_naive, nullable=False)
     confirmed_at = Column(DateTime, nullable=True)
     confirmed_by = Column(String(50), nullable=True)  # Admin username who confirmed
 
     # Relationship to items
-    items = relationship("PendingAdjustmentItem", back_populates="adjustment", cascade="all, delete-orphan")
+    items = relationship("PendingAdjustmentItem", cascade="all, delete-orphan", lazy="selectin")
 
     def __repr__(self) -> str:
         return f"<PendingAdjustment(id={self.id}, user='{self.username}', type='{self.adjustment_type}', status='{self.status}', items={len(self.items)})>"
@@ -88,13 +116,13 @@ class PendingAdjustment(Base):
             "id": self.id,
             "user_id": self.user_id,
             "username": self.username,
-            "adjustment_type": self.adjustment_type.value if isinstance(self.adjustment_type, AdjustmentType) else self.adjustment_type,
-            "status": self.status.value if isinstance(self.status, AdjustmentStatus) else self.status,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "confirmed_at": self.confirmed_at.isoformat() if self.confirmed_at else None,
+            "adjustment_type": self.adjustment_type,
+            "status": self.status,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "confirmed_at": self.confirmed_at,
             "confirmed_by": self.confirmed_by,
-            "items": [item.to_dict() for item in self.items] if self.items else []
+            "items": [item.to_dict() for item in self.items]
         }
 
 
@@ -113,22 +141,13 @@ class PendingAdjustmentItem(Base):
     product_name = Column(String(255), nullable=False)
     quantity = Column(Integer, nullable=False)  # Can be negative for exits
     available_stock = Column(Integer, nullable=False)  # Stock at time of preparation
-    adjustment_type = Column(
-        SQLEnum(AdjustmentType, values_callable=lambda obj: [e.value for e in obj]),
-        nullable=False
-    )
-    reason = Column(
-        SQLEnum(AdjustmentReason, values_callable=lambda obj: [e.value for e in obj]),
-        nullable=False
-    )
-    description = Column(Text, nullable=True)
+    adjustment_type = Column(String(20), nullable=False)
+    reason = Column(String(30), nullable=False)
+    description = Column(String(500), nullable=True)
     unit_price = Column(Float, nullable=True)
     new_product_name = Column(String(255), nullable=True)  # For ADJUSTMENT type: new name
     photo_url = Column(Text, nullable=True)  # For ADJUSTMENT type: photo URL (base64 images)
 
-    # Relationship to adjustment
-    adjustment = relationship("PendingAdjustment", back_populates="items")
-
     def __repr__(self) -> str:
         return f"<PendingAdjustmentItem(id={self.id}, barcode='{self.barcode}', qty={self.quantity}, reason='{self.reason}')>"
 
@@ -142,8 +161,8 @@ class PendingAdjustmentItem(Base):
             "product_name": self.product_name,
             "quantity": self.quantity,
             "available_stock": self.available_stock,
-            "adjustment_type": self.adjustment_type.value if isinstance(self.adjustment_type, AdjustmentType) else self.adjustment_type,
-            "reason": self.reason.value if isinstance(self.reason, AdjustmentReason) else self.reason,
+            "adjustment_type": self.adjustment_type,
+            "reason": self.reason,
             "description": self.description,
             "unit_price": self.unit_price,
             "new_product_name": self.new_product_name,
@@ -3,20 +3,18 @@ Pending Invoice models for database persistence.
 Stores invoices from SRI pending bodeguero review and admin sync.
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, Text, DateTime, Boolean, Enum as SQLEnum, ForeignKey
-from sqlalchemy.orm import relationship
+from operator import attrgetter
+from sqlalchemy import Column, Index, Integer, String, Float, Text, DateTime, Boolean, ForeignKey, text
+from sqlalchemy.orm import relationship, deferred
 from app.core.database import Base
-from app.utils.timezone import get_ecuador_now
-from enum import Enum
+from app.utils.timezone import get_ecuador_now_naive
 
 
-def _get_ecuador_now():
-    """Wrapper for SQLAlchemy default."""
-    return get_ecuador_now().replace(tzinfo=None)  # SQLite needs naive datetime
+_get_quantity = attrgetter("quantity")
 
 
-class InvoiceStatus(str, Enum):
-    """Invoice processing status enum."""
+class InvoiceStatus:
+    """Invoice processing status values (stored as plain strings)."""
     PENDIENTE_REVISION = "pendiente_revision"  # Admin uploaded, waiting for bodeguero
     EN_REVISION = "en_revision"  # Bodeguero working on it
     CORREGIDA = "corregida"  # Bodeguero finished, waiting for admin sync
@@ -24,6 +22,15 @@ class InvoiceStatus(str, Enum):
     SINCRONIZADA = "sincronizada"  # All items synced to Odoo
 
 
+INVOICE_STATUSES = frozenset({
+    InvoiceStatus.PENDIENTE_REVISION,
+    InvoiceStatus.EN_REVISION,
+    InvoiceStatus.CORREGIDA,
+    InvoiceStatus.PARCIALMENTE_SINCRONIZADA,
+    InvoiceStatus.SINCRONIZADA,
+})
+
+
 class PendingInvoice(Base):
     """
     Main invoice record from SRI XML.
@@ -31,6 +38,16 @@ class PendingInvoice(Base):
     """
 
     __tablename__ = "pending_invoices"
+    __table_args__ = (
+        Index("ix_pending_invoices_status_created_at", "status", "created_at"),
+        # Partial index for the bodeguero review queue (matches its status filter)
+        Index(
+            "ix_pending_invoices_bodeguero_queue",
+            "created_at",
+            sqlite_where=text("status IN ('pendiente_revision', 'en_revision')"),
+            postgresql_where=text("status IN ('pendiente_revision', 'en_revision')"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -43,22 +60,21 @@ class PendingInvoice(Base):
     uploaded_by_id = Column(Integer, ForeignKey("users.id"), nullable=True)
     uploaded_by_username = Column(String(50), nullable=False)
     xml_filename = Column(String(255), nullable=False)
-    xml_content = Column(Text, nullable=False)
+    xml_content = deferred(Column(Text, nullable=False))
 
     # Barcode extraction preference
     barcode_source = Column(String(20), nullable=True, default='codigoAuxiliar')  # 'codigoPrincipal' or 'codigoAuxiliar'
 
     # Status tracking
     status = Column(
-        SQLEnum(InvoiceStatus, values_callable=lambda obj: [e.value for e in obj]),
+        String(30),
         nullable=False,
-        default=InvoiceStatus.PENDIENTE_REVISION,
-        index=True
+        default=InvoiceStatus.PENDIENTE_REVISION
     )
 
     # Timestamps
-    created_at = Column(DateTime, default=_get_ecuador_now, nullable=False)
-    updated_at = Column(DateTime, default=_get_ecuador_now, onupdate=_get_ecuador_now, nullable=False)
+    created_at = Column(DateTime, default=get_ecuador_now_naive, nullable=False)
+    updated_at = Column(DateTime, default=get_ecuador_now_naive, onupdate=get_ecuador_now_naive, nullable=False)
 
     # Bodeguero submission
     submitted_at = Column(DateTime, nullable=True)
@@ -77,33 +93,34 @@ class PendingInvoice(Base):
     quantity_mode = Column(String(10), default='add', nullable=False)  # 'add' or 'replace' stock
 
     # Relationship to items
-    items = relationship("PendingInvoiceItem", back_populates="invoice", cascade="all, delete-orphan")
+    items = relationship("PendingInvoiceItem", cascade="all, delete-orphan", lazy="selectin")
 
     def __repr__(self) -> str:
         return f"<PendingInvoice(id={self.id}, number='{self.invoice_number}', status='{self.status}', items={len(self.items)})>"
 
     def to_dict(self) -> dict:
         """Convert invoice to dictionary representation."""
+        items = self.items
         return {
             "id": self.id,
             "invoice_number": self.invoice_number,
             "supplier_name": self.supplier_name,
-            "invoice_date": self.invoice_date.isoformat() if self.invoice_date else None,
+            "invoice_date": self.invoice_date,
             "uploaded_by_id": self.uploaded_by_id,
             "uploaded_by_username": self.uploaded_by_username,
             "xml_filename": self.xml_filename,
             "barcode_source": self.barcode_source,
-            "status": self.status.value if isinstance(self.status, InvoiceStatus) else self.status,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "submitted_at": self.submitted_at.isoformat() if self.submitted_at else None,
+            "status": self.status,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "submitted_at": self.submitted_at,
             "submitted_by": self.submitted_by,
-            "synced_at": self.synced_at.isoformat() if self.synced_at else None,
+            "synced_at": self.synced_at,
             "synced_by": self.synced_by,
             "notes": self.notes,
-            "items": [item.to_dict() for item in self.items] if self.items else [],
-            "total_items": len(self.items) if self.items else 0,
-            "total_quantity": sum(item.quantity for item in self.items) if self.items else 0
+            "items": [item.to_dict() for item in items],
+            "total_items": len(items),
+            "total_quantity": sum(map(_get_quantity, items))
         }
 
 
@@ -116,7 +133,7 @@ class PendingInvoiceItem(Base):
     __tablename__ = "pending_invoice_items"
 
     id = Column(Integer, primary_key=True, index=True)
-    invoice_id = Column(Integer, ForeignKey("pending_invoices.id"), nullable=False)
+    invoice_id = Column(Integer, ForeignKey("pending_invoices.id"), nullable=False, index=True)
 
     # Product info from XML
     codigo_original = Column(String(100), nullable=False)
@@ -146,10 +163,7 @@ class PendingInvoiceItem(Base):
     # Odoo sync results
     product_id = Column(Integer, nullable=True)  # Odoo product ID after sync
     sync_success = Column(Boolean, nullable=True)
-    sync_error = Column(Text, nullable=True)
-
-    # Relationship to invoice
-    invoice = relationship("PendingInvoice", back_populates="items")
+    sync_error = Column(String(1000), nullable=True)
 
     def __repr__(self) -> str:
         return f"<PendingInvoiceItem(id={self.id}, codigo='{self.codigo_original}', qty={self.quantity})>"
@@ -3,26 +3,28 @@ Pending Transfer models for database persistence.
 Stores transfers prepared by bodeguero awaiting admin confirmation.
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, DateTime, Enum as SQLEnum, ForeignKey
+from sqlalchemy import Column, Index, Integer, String, Float, DateTime, ForeignKey, text
 from sqlalchemy.orm import relationship
 from app.core.database import Base
-from app.utils.timezone import get_ecuador_now
-from enum import Enum
+from app.utils.timezone import get_ecuador_now_naive
 
 
-def _get_ecuador_now():
-    """Wrapper for SQLAlchemy default."""
-    return get_ecuador_now().replace(tzinfo=None)  # SQLite needs naive datetime
-
-
-class TransferStatus(str, Enum):
-    """Transfer status enum."""
+class TransferStatus:
+    """Transfer status values (stored as plain strings)."""
     PENDING_VERIFICATION = "pending_verification"  # Awaiting bodeguero verification (cajero transfers)
     PENDING = "pending"  # Awaiting admin confirmation
     CONFIRMED = "confirmed"
     CANCELLED = "cancelled"
 
 
+TRANSFER_STATUSES = frozenset({
+    TransferStatus.PENDING_VERIFICATION,
+    TransferStatus.PENDING,
+    TransferStatus.CONFIRMED,
+    TransferStatus.CANCELLED,
+})
+
+
 class PendingTransfer(Base):
     """
     Main transfer record prepared by bodeguero.
@@ -30,19 +32,28 @@ class PendingTransfer(Base):
     """
 
     __tablename__ = "pending_transfers"
+    __table_args__ = (
+        Index("ix_pending_transfers_status_created_at", "status", "created_at"),
+        # Partial index for the admin confirmation queue
+        Index(
+            "ix_pending_transfers_pending",
+            "created_at",
+            sqlite_where=text("status = 'pending'"),
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True)  # Nullable for Odoo admins
     username = Column(String(50), nullable=False)  # For easy display
     created_by_role = Column(String(20), nullable=True)  # 'admin', 'bodeguero', 'cajero'
     status = Column(
-        SQLEnum(TransferStatus, values_callable=lambda obj: [e.value for e in obj]),
+        String(20),
         nullable=False,
-        default=TransferStatus.PENDING,
-        index=True
+        default=TransferStatus.PENDING
     )
-    created_at = Column(DateTime, default=_get_ecuador_now, nullable=False)
-    updated_at = Column(DateTime, default=_get_ecuador_now, onupdate=_get_ecuador_now, nullable=False)
+    created_at = Column(DateTime, default=get_ecuador_now_naive, nullable=False)
+    updated_at = Column(DateTime, default=get_ecuador_now_naive, onupdate=get_ecuador_now_naive, nullable=False)
     verified_at = Column(DateTime, nullable=True)
     verified_by = Column(String(50), nullable=True)  # Bodeguero username who verified
     confirmed_at = Column(DateTime, nullable=True)
@@ -53,7 +64,7 @@ class PendingTransfer(Base):
     destination_location_name = Column(String(100), nullable=True)  # Human-readable name
 
     # Relationship to items
-    items = relationship("PendingTransferItem", back_populates="transfer", cascade="all, delete-orphan")
+    items = relationship("PendingTransferItem", cascade="all, delete-orphan", lazy="selectin")
 
     def __repr__(self) -> str:
         return f"<PendingTransfer(id={self.id}, user='{self.username}', status='{self.status}', items={len(self.items)})>"
@@ -65,16 +76,16 @@ class PendingTransfer(Base):
             "user_id": self.user_id,
             "username": self.username,
             "created_by_role": self.created_by_role,
-            "status": self.status.value if isinstance(self.status, TransferStatus) else self.status,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "verified_at": self.verified_at.isoformat() if self.verified_at else None,
+            "status": self.status,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "verified_at": self.verified_at,
             "verified_by": self.verified_by,
-            "confirmed_at": self.confirmed_at.isoformat() if self.confirmed_at else None,
+            "confirmed_at": self.confirmed_at,
             "confirmed_by": self.confirmed_by,
             "destination_location_id": self.destination_location_id,
             "destination_location_name": self.destination_location_name,
-            "items": [item.to_dict() for item in self.items] if self.items else []
+            "items": [item.to_dict() for item in self.items]
         }
 
 
@@ -95,9 +106,6 @@ class PendingTransferItem(Base):
     available_stock = Column(Integer, nullable=False)  # Stock at time of preparation
     unit_price = Column(Float, nullable=True)
 
-    # Relationship to transfer
-    transfer = relationship("PendingTransfer", back_populates="items")
-
     def __repr__(self) -> str:
         return f"<PendingTransferItem(id={self.id}, barcode='{self.barcode}', qty={self.quantity})>"
 
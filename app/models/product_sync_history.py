@@ -2,10 +2,37 @@
 Product Sync History Models
 Stores complete historical records of product synchronizations from XML files.
 """
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text, ForeignKey
-from sqlalchemy.orm import relationship
+from operator import attrgetter
+from sqlalchemy import Column, Index, Integer, String, Float, DateTime, Boolean, Text, ForeignKey
+from sqlalchemy.orm import relationship, deferred
 from app.core.database import Base
 from app.utils.timezone import get_ecuador_now
+from app.utils.serialization import serialize_rows
+
+
+# Columns exposed by ProductSyncHistoryItem.to_dict, in response order
+_ITEM_FIELDS = (
+    "id",
+    "history_id",
+    "barcode",
+    "product_id",
+    "product_name",
+    "action",
+    "quantity_processed",
+    "success",
+    "error_message",
+    "stock_before",
+    "stock_after",
+    "stock_updated",
+    "old_standard_price",
+    "new_standard_price",
+    "old_list_price",
+    "new_list_price",
+    "price_updated",
+    "is_new_product",
+    "created_at",
+)
+_get_item_fields = attrgetter(*_ITEM_FIELDS)
 
 
 class ProductSyncHistory(Base):
@@ -38,18 +65,18 @@ class ProductSyncHistory(Base):
     updated_count = Column(Integer, nullable=False)
 
     # Generated reports (stored as base64/text)
-    pdf_content = Column(Text, nullable=True)  # Base64 encoded PDF
+    pdf_content = deferred(Column(Text, nullable=True))  # Base64 encoded PDF
     pdf_filename = Column(String(255), nullable=True)
-    xml_content = Column(Text, nullable=True)  # Original XML content
+    xml_content = deferred(Column(Text, nullable=True))  # Original XML content
 
     # Error tracking
     has_errors = Column(Boolean, default=False)
-    error_summary = Column(Text, nullable=True)
+    error_summary = Column(String(1000), nullable=True)
 
     created_at = Column(DateTime, default=get_ecuador_now)
 
     # Relationships
-    items = relationship("ProductSyncHistoryItem", back_populates="history", cascade="all, delete-orphan")
+    items = relationship("ProductSyncHistoryItem", cascade="all, delete-orphan", lazy="selectin")
 
     def to_dict(self):
         """Convert to dictionary for API responses"""
@@ -61,7 +88,7 @@ class ProductSyncHistory(Base):
             "quantity_mode": self.quantity_mode,
             "apply_iva": self.apply_iva,
             "executed_by": self.executed_by,
-            "executed_at": self.executed_at.isoformat() if self.executed_at else None,
+            "executed_at": self.executed_at,
             "total_items": self.total_items,
             "successful_items": self.successful_items,
             "failed_items": self.failed_items,
@@ -70,8 +97,8 @@ class ProductSyncHistory(Base):
             "pdf_filename": self.pdf_filename,
             "has_errors": self.has_errors,
             "error_summary": self.error_summary,
-            "items": [item.to_dict() for item in self.items] if self.items else [],
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "items": serialize_rows(_ITEM_FIELDS, _get_item_fields, self.items),
+            "created_at": self.created_at,
         }
 
 
@@ -81,9 +108,12 @@ class ProductSyncHistoryItem(Base):
     Stores detailed result for each product including price and stock changes.
     """
     __tablename__ = "product_sync_history_items"
+    __table_args__ = (
+        Index("ix_product_sync_history_items_history_id_action", "history_id", "action"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    history_id = Column(Integer, ForeignKey("product_sync_history.id"), nullable=False, index=True)
+    history_id = Column(Integer, ForeignKey("product_sync_history.id"), nullable=False)
 
     # Product identification
     barcode = Column(String(100), nullable=False, index=True)
@@ -115,29 +145,6 @@ class ProductSyncHistoryItem(Base):
 
     created_at = Column(DateTime, default=get_ecuador_now)
 
-    # Relationship
-    history = relationship("ProductSyncHistory", back_populates="items")
-
     def to_dict(self):
         """Convert to dictionary for API responses"""
-        return {
-            "id": self.id,
-            "history_id": self.history_id,
-            "barcode": self.barcode,
-            "product_id": self.product_id,
-            "product_name": self.product_name,
-            "action": self.action,
-            "quantity_processed": self.quantity_processed,
-            "success": self.success,
-            "error_message": self.error_message,
-            "stock_before": self.stock_before,
-            "stock_after": self.stock_after,
-            "stock_updated": self.stock_updated,
-            "old_standard_price": self.old_standard_price,
-            "new_standard_price": self.new_standard_price,
-            "old_list_price": self.old_list_price,
-            "new_list_price": self.new_list_price,
-            "price_updated": self.price_updated,
-            "is_new_product": self.is_new_product,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-        }
+        return dict(zip(_ITEM_FIELDS, _get_item_fields(self)))
@@ -2,11 +2,66 @@
 Transfer History Models
 Stores complete historical records of executed transfers with all details.
 """
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text, ForeignKey
-from sqlalchemy.orm import relationship
-from app.core.database import Base
+from operator import attrgetter
+from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text, ForeignKey, Index, LargeBinary
+from sqlalchemy.orm import relationship, deferred
+from app.core.database import Base, JSONVariant
 from app.utils.timezone import get_ecuador_now
-import json
+from app.utils.serialization import serialize_rows
+
+
+# Columns exposed by TransferHistoryItem.to_dict, in response order
+_ITEM_FIELDS = (
+    "id",
+    "history_id",
+    "barcode",
+    "product_id",
+    "product_name",
+    "quantity_requested",
+    "quantity_transferred",
+    "success",
+    "error_message",
+    "stock_origin_before",
+    "stock_origin_after",
+    "stock_destination_before",
+    "stock_destination_after",
+    "unit_price",
+    "total_value",
+    "is_new_product",
+    "created_at",
+)
+_get_item_fields = attrgetter(*_ITEM_FIELDS)
+
+# Scalar columns returned by TransferHistory.to_dict, in response order
+_HISTORY_FIELDS = (
+    "id",
+    "pending_transfer_id",
+    "origin_location",
+    "destination_location_id",
+    "destination_location_name",
+    "executed_by",
+    "executed_at",
+    "total_items",
+    "successful_items",
+    "failed_items",
+    "total_quantity_requested",
+    "total_quantity_transferred",
+    "pdf_filename",
+    "has_errors",
+    "error_summary",
+    "created_at",
+)
+_get_history_fields = attrgetter(*_HISTORY_FIELDS)
+
+# JSON array columns, returned as [] when NULL
+_JSON_LIST_FIELDS = (
+    "origin_snapshots_before",
+    "origin_snapshots_after",
+    "destination_snapshots_before",
+    "destination_snapshots_after",
+    "new_products",
+)
+_get_json_list_fields = attrgetter(*_JSON_LIST_FIELDS)
 
 
 class TransferHistory(Base):
@@ -35,54 +90,55 @@ class TransferHistory(Base):
     total_quantity_requested = Column(Integer, nullable=False)
     total_quantity_transferred = Column(Integer, nullable=False)
 
-    # Generated reports (stored as base64/text)
-    pdf_content = Column(Text, nullable=True)  # Base64 encoded PDF
+    # Generated reports (content lives in transfer_history_blobs)
     pdf_filename = Column(String(255), nullable=True)
-    xml_content = Column(Text, nullable=True)
 
-    # Stock snapshots (stored as JSON)
-    origin_snapshots_before = Column(Text, nullable=True)  # JSON array
-    origin_snapshots_after = Column(Text, nullable=True)
-    destination_snapshots_before = Column(Text, nullable=True)
-    destination_snapshots_after = Column(Text, nullable=True)
-    new_products = Column(Text, nullable=True)  # JSON array of newly created products
+    # Stock snapshots (deferred as one group: touching any column loads all five in one query;
+    # queries that need them up front can use .options(undefer_group("snapshots")))
+    origin_snapshots_before = deferred(Column(JSONVariant, nullable=True), group="snapshots")  # JSON array
+    origin_snapshots_after = deferred(Column(JSONVariant, nullable=True), group="snapshots")
+    destination_snapshots_before = deferred(Column(JSONVariant, nullable=True), group="snapshots")
+    destination_snapshots_after = deferred(Column(JSONVariant, nullable=True), group="snapshots")
+    new_products = deferred(Column(JSONVariant, nullable=True), group="snapshots")  # JSON array of newly created products
 
     # Error tracking
     has_errors = Column(Boolean, default=False)
-    error_summary = Column(Text, nullable=True)
+    error_summary = Column(String(1000), nullable=True)
 
     created_at = Column(DateTime, default=get_ecuador_now)
 
     # Relationships
-    items = relationship("TransferHistoryItem", back_populates="history", cascade="all, delete-orphan")
+    items = relationship("TransferHistoryItem", cascade="all, delete-orphan", lazy="selectin")
     pending_transfer = relationship("PendingTransfer", foreign_keys=[pending_transfer_id])
+    # Never loaded implicitly: query TransferHistoryBlob by history_id when the PDF is needed.
+    # Deletes still go through the ORM cascade: SQLite runs without PRAGMA foreign_keys,
+    # so the ON DELETE CASCADE on the blob table cannot be relied on.
+    blob = relationship(
+        "TransferHistoryBlob",
+        uselist=False,
+        cascade="all, delete-orphan",
+        lazy="raise"
+    )
 
     def to_dict(self):
         """Convert to dictionary for API responses"""
-        return {
-            "id": self.id,
-            "pending_transfer_id": self.pending_transfer_id,
-            "origin_location": self.origin_location,
-            "destination_location_id": self.destination_location_id,
-            "destination_location_name": self.destination_location_name,
-            "executed_by": self.executed_by,
-            "executed_at": self.executed_at.isoformat() if self.executed_at else None,
-            "total_items": self.total_items,
-            "successful_items": self.successful_items,
-            "failed_items": self.failed_items,
-            "total_quantity_requested": self.total_quantity_requested,
-            "total_quantity_transferred": self.total_quantity_transferred,
-            "pdf_filename": self.pdf_filename,
-            "has_errors": self.has_errors,
-            "error_summary": self.error_summary,
-            "items": [item.to_dict() for item in self.items] if self.items else [],
-            "origin_snapshots_before": json.loads(self.origin_snapshots_before) if self.origin_snapshots_before else [],
-            "origin_snapshots_after": json.loads(self.origin_snapshots_after) if self.origin_snapshots_after else [],
-            "destination_snapshots_before": json.loads(self.destination_snapshots_before) if self.destination_snapshots_before else [],
-            "destination_snapshots_after": json.loads(self.destination_snapshots_after) if self.destination_snapshots_after else [],
-            "new_products": json.loads(self.new_products) if self.new_products else [],
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-        }
+        data = dict(zip(_HISTORY_FIELDS, _get_history_fields(self)))
+        data["items"] = serialize_rows(_ITEM_FIELDS, _get_item_fields, self.items)
+        for field, value in zip(_JSON_LIST_FIELDS, _get_json_list_fields(self)):
+            data[field] = value or []
+        return data
+
+
+class TransferHistoryBlob(Base):
+    """
+    Generated report content for a transfer history record.
+    Kept out of transfer_history so list queries never read PDF/XML payloads.
+    """
+    __tablename__ = "transfer_history_blobs"
+
+    history_id = Column(Integer, ForeignKey("transfer_history.id", ondelete="CASCADE"), primary_key=True)
+    pdf_bytes = Column(LargeBinary, nullable=True)  # Raw PDF (not base64)
+    xml_content = Column(Text, nullable=True)
 
 
 class TransferHistoryItem(Base):
@@ -91,12 +147,15 @@ class TransferHistoryItem(Base):
     Stores detailed result for each product including stock changes and errors.
     """
     __tablename__ = "transfer_history_items"
+    __table_args__ = (
+        Index("ix_transfer_history_items_history_id_barcode", "history_id", "barcode"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    history_id = Column(Integer, ForeignKey("transfer_history.id"), nullable=False, index=True)
+    history_id = Column(Integer, ForeignKey("transfer_history.id"), nullable=False)
 
     # Product identification
-    barcode = Column(String(100), nullable=False, index=True)
+    barcode = Column(String(100), nullable=False, index=True)  # Cross-history product search
     product_id = Column(Integer, nullable=False)
     product_name = Column(String(255), nullable=False)
 
@@ -123,27 +182,6 @@ class TransferHistoryItem(Base):
 
     created_at = Column(DateTime, default=get_ecuador_now)
 
-    # Relationship
-    history = relationship("TransferHistory", back_populates="items")
-
     def to_dict(self):
         """Convert to dictionary for API responses"""
-        return {
-            "id": self.id,
-            "history_id": self.history_id,
-            "barcode": self.barcode,
-            "product_id": self.product_id,
-            "product_name": self.product_name,
-            "quantity_requested": self.quantity_requested,
-            "quantity_transferred": self.quantity_transferred,
-            "success": self.success,
-            "error_message": self.error_message,
-            "stock_origin_before": self.stock_origin_before,
-            "stock_origin_after": self.stock_origin_after,
-            "stock_destination_before": self.stock_destination_before,
-            "stock_destination_after": self.stock_destination_after,
-            "unit_price": self.unit_price,
-            "total_value": self.total_value,
-            "is_new_product": self.is_new_product,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-        }
+        return dict(zip(_ITEM_FIELDS, _get_item_fields(self)))
@@ -1,8 +1,8 @@
 """
 User model for database authentication (cajeros and bodegueros).
 """
-from datetime import datetime
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum as SQLEnum, func
+from sqlalchemy.orm import validates
 from app.core.database import Base
 from app.core.constants import UserRole
 
@@ -26,8 +26,21 @@ class User(Base):
         index=True
     )
     is_active = Column(Boolean, default=True, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    # Filled by the database in the INSERT/UPDATE itself (no per-row Python callback);
+    # server_default covers tables created from this model
+    created_at = Column(DateTime, default=func.now(), server_default=func.now(), nullable=False)
+    updated_at = Column(
+        DateTime,
+        default=func.now(),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False
+    )
+
+    @validates("role")
+    def _coerce_role(self, key, role):
+        """Normalize role to UserRole on assignment so reads never need to check its type."""
+        return UserRole(role)
 
     def __repr__(self) -> str:
         return f"<User(id={self.id}, username='{self.username}', role='{self.role}')>"
@@ -39,8 +52,8 @@ class User(Base):
             "username": self.username,
             "email": self.email,
             "full_name": self.full_name,
-            "role": self.role.value if isinstance(self.role, UserRole) else self.role,
+            "role": self.role.value,
             "is_active": self.is_active,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None
+            "created_at": self.created_at,
+            "updated_at": self.updated_at
         }
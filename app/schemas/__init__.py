@@ -1,89 +1,84 @@
 """
 Pydantic schemas for request/response validation.
+
+Submodules are imported lazily (PEP 562): ``from app.schemas import X`` only
+loads the module that defines X.
 """
-from app.schemas.common import (
-    MessageResponse,
-    ErrorResponse,
-    PaginationParams,
-    PaginatedResponse,
-    OdooConfigBase,
-    OdooCredentials,
-    HealthResponse
-)
-from app.schemas.user import (
-    UserBase,
-    UserCreate,
-    UserUpdate,
-    UserResponse,
-    UserListResponse
-)
-from app.schemas.auth import (
-    LoginRequest,
-    OdooLoginRequest,
-    TokenResponse,
-    LoginResponse,
-    UserInfo,
-    TokenPayload
-)
-from app.schemas.product import (
-    ProductData,
-    ProductMapped,
-    ProductInput,
-    ProductResponse,
-    SyncResult,
-    SyncResponse,
-    XMLUploadRequest,
-    XMLParseResponse,
-    InconsistencyItem,
-    InconsistencyResponse
-)
-from app.schemas.transfer import (
-    TransferItem,
-    TransferRequest,
-    ConfirmTransferRequest,
-    TransferProductDetail,
-    TransferResponse,
-    TransferValidationError,
-    TransferValidationResponse
-)
-from app.schemas.sales import (
-    SaleByEmployee,
-    PaymentMethodSummary,
-    POSSession,
-    CierreCajaResponse,
-    SalesDateRange
-)
-from app.schemas.adjustment import (
-    AdjustmentTypeEnum,
-    AdjustmentReasonEnum,
-    AdjustmentItem,
-    AdjustmentRequest,
-    ConfirmAdjustmentRequest,
-    AdjustmentResponse,
-    PendingAdjustmentItemResponse,
-    PendingAdjustmentResponse,
-    PendingAdjustmentListResponse,
-    AdjustmentHistoryItemResponse,
-    AdjustmentHistoryResponse
-)
-from app.schemas.product_sync import (
-    ProductSyncHistoryItemResponse,
-    ProductSyncHistoryResponse,
-    ProductSyncHistoryListResponse
-)
-from app.schemas.invoice import (
-    InvoiceItemUpdateRequest,
-    InvoiceSubmitRequest,
-    InvoiceSyncRequest,
-    InvoiceItemResponse,
-    PendingInvoiceResponse,
-    PendingInvoiceListResponse,
-    InvoiceUploadResponse,
-    InvoiceSyncResponse,
-    InvoiceHistoryItemResponse,
-    InvoiceHistoryResponse,
-    InvoiceHistoryListResponse
-)
+import importlib
+from typing import Any
+
+# Public name -> defining submodule
+_LAZY = {
+    "MessageResponse": "common",
+    "ErrorResponse": "common",
+    "PaginationParams": "common",
+    "PaginatedResponse": "common",
+    "OdooConfigBase": "common",
+    "OdooCredentials": "common",
+    "HealthResponse": "common",
+    "UserBase": "user",
+    "UserCreate": "user",
+    "UserUpdate": "user",
+    "UserResponse": "user",
+    "UserListResponse": "user",
+    "LoginRequest": "auth",
+    "OdooLoginRequest": "auth",
+    "TokenResponse": "auth",
+    "LoginResponse": "auth",
+    "UserInfo": "auth",
+    "TokenPayload": "auth",
+    "ProductData": "product",
+    "ProductMapped": "product",
+    "ProductInput": "product",
+    "ProductResponse": "product",
+    "SyncResult": "product",
+    "SyncResponse": "product",
+    "XMLUploadRequest": "product",
+    "XMLParseResponse": "product",
+    "InconsistencyItem": "product",
+    "InconsistencyResponse": "product",
+    "TransferItem": "transfer",
+    "TransferRequest": "transfer",
+    "ConfirmTransferRequest": "transfer",
+    "TransferProductDetail": "transfer",
+    "TransferResponse": "transfer",
+    "TransferValidationError": "transfer",
+    "TransferValidationResponse": "transfer",
+    "SaleByEmployee": "sales",
+    "PaymentMethodSummary": "sales",
+    "POSSession": "sales",
+    "CierreCajaResponse": "sales",
+    "SalesDateRange": "sales",
+    "AdjustmentTypeEnum": "adjustment",
+    "AdjustmentReasonEnum": "adjustment",
+    "AdjustmentItem": "adjustment",
+    "EntryAdjustmentItem": "adjustment",
+    "ExitAdjustmentItem": "adjustment",
+    "AdjustmentActionItem": "adjustment",
+    "AdjustmentRequest": "adjustment",
+    "ConfirmAdjustmentRequest": "adjustment",
+    "AdjustmentResponse": "adjustment",
+    "PendingAdjustmentItemResponse": "adjustment",
+    "PendingAdjustmentResponse": "adjustment",
+    "PendingAdjustmentListResponse": "adjustment",
+    "AdjustmentHistoryItemResponse": "adjustment",
+    "AdjustmentHistoryResponse": "adjustment",
+    "ProductSyncHistoryItemResponse": "product_sync",
+    "ProductSyncHistoryResponse": "product_sync",
+    "ProductSyncHistoryListResponse": "product_sync",
+    "InvoiceItemUpdateRequest": "invoice",
+    "InvoiceSubmitRequest": "invoice",
+    "InvoiceSyncRequest": "invoice",
+    "InvoiceItemResponse": "invoice",
+    "PendingInvoiceResponse": "invoice",
+    "PendingInvoiceListResponse": "invoice",
+    "InvoiceUploadResponse": "invoice",
+    "InvoiceSyncResponse": "invoice",
+    "InvoiceHistoryItemResponse": "invoice_history",
+    "InvoiceHistoryResponse": "invoice_history",
+    "InvoiceHistoryListResponse": "invoice_history",
+}
+
 
 __all__ = [
     # Common
@@ -136,6 +131,9 @@ __all__ = [
     "AdjustmentTypeEnum",
     "AdjustmentReasonEnum",
     "AdjustmentItem",
+    "EntryAdjustmentItem",
+    "ExitAdjustmentItem",
+    "AdjustmentActionItem",
     "AdjustmentRequest",
     "ConfirmAdjustmentRequest",
     "AdjustmentResponse",
@@ -157,7 +155,23 @@ __all__ = [
     "PendingInvoiceListResponse",
     "InvoiceUploadResponse",
     "InvoiceSyncResponse",
+    # Invoice History
     "InvoiceHistoryItemResponse",
     "InvoiceHistoryResponse",
     "InvoiceHistoryListResponse",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining ``name`` on first access and cache it."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(list(globals()) + list(_LAZY))
@@ -1,11 +1,12 @@
 """
 Adjustment-related schemas.
 """
-from typing import List, Optional, Dict, Any
+from typing import Annotated, Any, ClassVar, List, Literal, Optional, Tuple, Union
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic.dataclasses import dataclass
 from enum import Enum
-import json
+from app.schemas.common import ORMBase
 
 
 class AdjustmentTypeEnum(str, Enum):
@@ -35,92 +36,110 @@ class AdjustmentReasonEnum(str, Enum):
     SYSTEM_CORRECTION = "system_correction"
 
 
-class AdjustmentItem(BaseModel):
-    """Single product item in an adjustment."""
+# Request field type: plain strings checked against a literal set (no enum lookup)
+AdjustmentReasonLiteral = Literal[
+    "purchase", "return_in", "correction_in",
+    "sale", "damage", "loss", "theft", "return_out", "correction_out", "local_service_use", "expired",
+    "physical_count", "system_correction",
+]
+
+# Reasons allowed for each adjustment type
+ENTRY_REASONS = frozenset({
+    AdjustmentReasonEnum.PURCHASE.value,
+    AdjustmentReasonEnum.RETURN_IN.value,
+    AdjustmentReasonEnum.CORRECTION_IN.value,
+})
+EXIT_REASONS = frozenset({
+    AdjustmentReasonEnum.SALE.value,
+    AdjustmentReasonEnum.DAMAGE.value,
+    AdjustmentReasonEnum.LOSS.value,
+    AdjustmentReasonEnum.THEFT.value,
+    AdjustmentReasonEnum.RETURN_OUT.value,
+    AdjustmentReasonEnum.CORRECTION_OUT.value,
+    AdjustmentReasonEnum.LOCAL_SERVICE_USE.value,
+    AdjustmentReasonEnum.EXPIRED.value,
+})
+ADJUSTMENT_ONLY_REASONS = frozenset({
+    AdjustmentReasonEnum.PHYSICAL_COUNT.value,
+    AdjustmentReasonEnum.SYSTEM_CORRECTION.value,
+})
+REASONS_BY_TYPE = {
+    AdjustmentTypeEnum.ENTRY.value: ENTRY_REASONS,
+    AdjustmentTypeEnum.EXIT.value: EXIT_REASONS,
+    AdjustmentTypeEnum.ADJUSTMENT.value: ADJUSTMENT_ONLY_REASONS,
+}
+
+
+@dataclass(slots=True, kw_only=True, config=ConfigDict(extra="ignore"))
+class _AdjustmentItemBase:
+    """
+    Fields shared by every adjustment item variant.
+
+    Slots-backed pydantic dataclasses: bulk requests carry one per product.
+    """
     barcode: str = Field(..., description="Product barcode")
     product_id: int = Field(..., description="Odoo product ID")
     product_name: str = Field(..., description="Product name")
     quantity: int = Field(..., description="Quantity to adjust (negative for exits)")
     available_stock: int = Field(..., description="Current available stock")
-    adjustment_type: AdjustmentTypeEnum = Field(..., description="Type of adjustment")
-    reason: AdjustmentReasonEnum = Field(..., description="Reason for adjustment")
-    description: Optional[str] = Field(None, description="Optional description")
+    reason: AdjustmentReasonLiteral = Field(..., description="Reason for adjustment")
+    description: Optional[str] = Field(None, max_length=500, description="Optional description")
     unit_price: Optional[float] = Field(None, description="Unit price")
+
+    @model_validator(mode='after')
+    def validate_reason_for_type(self):
+        """Reject reasons that do not belong to the item's adjustment type."""
+        if self.reason not in REASONS_BY_TYPE[self.adjustment_type]:
+            raise ValueError(
+                f"Reason '{self.reason}' is not valid for adjustment type '{self.adjustment_type}'"
+            )
+        return self
+
+
+@dataclass(slots=True, kw_only=True, config=ConfigDict(extra="ignore"))
+class EntryAdjustmentItem(_AdjustmentItemBase):
+    """Adjustment item that adds stock."""
+    adjustment_type: Literal["entry"] = Field(..., description="Type of adjustment")
+
+    # Only used by ADJUSTMENT items; read as None here
+    new_product_name: ClassVar[Optional[str]] = None
+    photo_url: ClassVar[Optional[str]] = None
+
+
+@dataclass(slots=True, kw_only=True, config=ConfigDict(extra="ignore"))
+class ExitAdjustmentItem(_AdjustmentItemBase):
+    """Adjustment item that removes stock."""
+    adjustment_type: Literal["exit"] = Field(..., description="Type of adjustment")
+
+    # Only used by ADJUSTMENT items; read as None here
+    new_product_name: ClassVar[Optional[str]] = None
+    photo_url: ClassVar[Optional[str]] = None
+
+
+@dataclass(slots=True, kw_only=True, config=ConfigDict(extra="ignore"))
+class AdjustmentActionItem(_AdjustmentItemBase):
+    """Adjustment item that sets stock and may rename or re-photograph the product."""
+    adjustment_type: Literal["adjustment"] = Field(..., description="Type of adjustment")
     new_product_name: Optional[str] = Field(None, description="New product name (for ADJUSTMENT type)")
     photo_url: Optional[str] = Field(None, description="Photo URL (for ADJUSTMENT type)")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "barcode": "123456789",
-                "product_id": 100,
-                "product_name": "Producto Ejemplo",
-                "quantity": 10,
-                "available_stock": 50,
-                "adjustment_type": "entry",
-                "reason": "purchase",
-                "description": "Compra de mercadería",
-                "unit_price": 15.50,
-                "new_product_name": None,
-                "photo_url": None
-            }
-        }
+
+# Single product item in an adjustment; pydantic-core picks the variant from adjustment_type
+AdjustmentItem = Annotated[
+    Union[EntryAdjustmentItem, ExitAdjustmentItem, AdjustmentActionItem],
+    Field(discriminator="adjustment_type")
+]
 
 
 class AdjustmentRequest(BaseModel):
     """Request to prepare an adjustment."""
     items: List[AdjustmentItem] = Field(..., min_length=1, description="Items to adjust")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "items": [
-                    {
-                        "barcode": "123456789",
-                        "product_id": 100,
-                        "product_name": "Producto A",
-                        "quantity": 10,
-                        "available_stock": 50,
-                        "adjustment_type": "entry",
-                        "reason": "purchase",
-                        "description": "Nueva compra"
-                    },
-                    {
-                        "barcode": "987654321",
-                        "product_id": 101,
-                        "product_name": "Producto B",
-                        "quantity": -5,
-                        "available_stock": 20,
-                        "adjustment_type": "exit",
-                        "reason": "damage",
-                        "description": "Producto dañado"
-                    }
-                ]
-            }
-        }
-
 
 class ConfirmAdjustmentRequest(BaseModel):
     """Request to confirm and execute an adjustment."""
     items: List[AdjustmentItem] = Field(..., min_length=1, description="Final confirmed items")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "items": [
-                    {
-                        "barcode": "123456789",
-                        "product_id": 100,
-                        "product_name": "Producto A",
-                        "quantity": 10,
-                        "available_stock": 50,
-                        "adjustment_type": "entry",
-                        "reason": "purchase"
-                    }
-                ]
-            }
-        }
-
 
 class AdjustmentResponse(BaseModel):
     """Response from adjustment operation."""
@@ -129,20 +148,10 @@ class AdjustmentResponse(BaseModel):
     processed_count: int = Field(default=0, description="Number of items processed")
     inventory_updated: bool = Field(default=False, description="Whether inventory was actually updated in Odoo")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "success": True,
-                "message": "Adjustment prepared successfully",
-                "processed_count": 2,
-                "inventory_updated": False
-            }
-        }
-
 
 # Pending Adjustment Schemas
 
-class PendingAdjustmentItemResponse(BaseModel):
+class PendingAdjustmentItemResponse(ORMBase):
     """Response schema for a pending adjustment item."""
     id: int
     barcode: str
@@ -157,11 +166,8 @@ class PendingAdjustmentItemResponse(BaseModel):
     new_product_name: Optional[str] = None
     photo_url: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
 
-class PendingAdjustmentResponse(BaseModel):
+class PendingAdjustmentResponse(ORMBase):
     """Response schema for a pending adjustment."""
     id: int
     user_id: Optional[int] = None
@@ -174,64 +180,23 @@ class PendingAdjustmentResponse(BaseModel):
     confirmed_by: Optional[str] = None
     items: List[PendingAdjustmentItemResponse] = []
 
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
-            "example": {
-                "id": 1,
-                "user_id": 5,
-                "username": "bodeguero1",
-                "adjustment_type": "entry",
-                "status": "pending",
-                "created_at": "2025-12-04T10:30:00",
-                "updated_at": "2025-12-04T10:30:00",
-                "confirmed_at": None,
-                "confirmed_by": None,
-                "items": [
-                    {
-                        "id": 1,
-                        "barcode": "123456789",
-                        "product_id": 100,
-                        "product_name": "Producto Ejemplo",
-                        "quantity": 10,
-                        "available_stock": 50,
-                        "adjustment_type": "entry",
-                        "reason": "purchase",
-                        "description": "Nueva compra",
-                        "unit_price": 15.50
-                    }
-                ]
-            }
-        }
-
 
 class PendingAdjustmentListResponse(BaseModel):
     """Response schema for list of pending adjustments."""
     adjustments: List[PendingAdjustmentResponse]
     total: int
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "adjustments": [
-                    {
-                        "id": 1,
-                        "username": "bodeguero1",
-                        "adjustment_type": "entry",
-                        "status": "pending",
-                        "created_at": "2025-12-04T10:30:00",
-                        "items": []
-                    }
-                ],
-                "total": 1
-            }
-        }
-
 
 # Adjustment History Schemas
 
-class AdjustmentHistoryItemResponse(BaseModel):
-    """Response schema for adjustment history item."""
+@dataclass(slots=True, kw_only=True)
+class AdjustmentHistoryItemResponse:
+    """
+    Response schema for adjustment history item.
+
+    A slots-backed pydantic dataclass (no per-instance __dict__), since the
+    history list holds one per confirmed item. Built from keyword arguments only.
+    """
     id: int
     adjustment_type: str
     product_name: str
@@ -244,41 +209,16 @@ class AdjustmentHistoryItemResponse(BaseModel):
     created_at: datetime
     confirmed_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class AdjustmentHistoryResponse(BaseModel):
     """Response schema for adjustment history."""
     history: List[AdjustmentHistoryItemResponse]
     total: int
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "history": [
-                    {
-                        "id": 1,
-                        "adjustment_type": "entry",
-                        "product_name": "Producto A",
-                        "barcode": "123456789",
-                        "quantity": 10,
-                        "reason": "purchase",
-                        "description": "Nueva compra",
-                        "created_by": "bodeguero1",
-                        "confirmed_by": "admin",
-                        "created_at": "2025-12-04T10:30:00",
-                        "confirmed_at": "2025-12-04T11:00:00"
-                    }
-                ],
-                "total": 1
-            }
-        }
-
 
 # Complete Adjustment History Schemas (with snapshots and PDF)
 
-class AdjustmentHistoryItemDetailResponse(BaseModel):
+class AdjustmentHistoryItemDetailResponse(ORMBase):
     """Detailed response schema for adjustment history item."""
     id: int
     barcode: str
@@ -295,11 +235,8 @@ class AdjustmentHistoryItemDetailResponse(BaseModel):
     unit_price: Optional[float] = None
     total_value: Optional[float] = None
 
-    class Config:
-        from_attributes = True
-
 
-class AdjustmentHistoryDetailResponse(BaseModel):
+class AdjustmentHistoryDetailResponse(ORMBase):
     """Complete adjustment history record with all details."""
     id: int
     pending_adjustment_id: Optional[int] = None
@@ -316,53 +253,29 @@ class AdjustmentHistoryDetailResponse(BaseModel):
     has_errors: bool
     error_summary: Optional[str] = None
     items: List[AdjustmentHistoryItemDetailResponse] = []
-    snapshots_before: List[Dict[str, Any]] = []
-    snapshots_after: List[Dict[str, Any]] = []
-
-    class Config:
-        from_attributes = True
+    snapshots_before: Any = Field([], description="Stock snapshots before execution")
+    snapshots_after: Any = Field([], description="Stock snapshots after execution")
 
+    @field_validator('snapshots_before', 'snapshots_after', mode='before')
     @classmethod
-    def model_validate(cls, obj: Any, **kwargs):
-        """Custom validation to parse JSON fields."""
-        if isinstance(obj, dict):
-            # Already a dict, use default validation
-            return super().model_validate(obj, **kwargs)
-
-        # Parse from ORM object
-        data = {
-            'id': obj.id,
-            'pending_adjustment_id': obj.pending_adjustment_id,
-            'location': obj.location,
-            'location_name': obj.location_name,
-            'executed_by': obj.executed_by,
-            'executed_at': obj.executed_at,
-            'total_items': obj.total_items,
-            'successful_items': obj.successful_items,
-            'failed_items': obj.failed_items,
-            'total_quantity_requested': obj.total_quantity_requested,
-            'total_quantity_adjusted': obj.total_quantity_adjusted,
-            'pdf_filename': obj.pdf_filename,
-            'has_errors': obj.has_errors,
-            'error_summary': obj.error_summary,
-            'items': [AdjustmentHistoryItemDetailResponse.model_validate(item) for item in obj.items],
-            'snapshots_before': json.loads(obj.snapshots_before) if obj.snapshots_before else [],
-            'snapshots_after': json.loads(obj.snapshots_after) if obj.snapshots_after else []
-        }
-        return cls(**data)
+    def default_empty_snapshots(cls, v):
+        """NULL snapshot columns are returned as empty lists."""
+        return v or []
 
 
 class AdjustmentHistoryListResponse(BaseModel):
     """Response schema for list of complete adjustment histories."""
-    history: List[AdjustmentHistoryDetailResponse]
+    history: Tuple[AdjustmentHistoryDetailResponse, ...]
     total: int
 
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
 
 # ============================================================
 # Unified History Schemas (combines pending + history)
 # ============================================================
 
-class UnifiedAdjustmentRecord(BaseModel):
+class UnifiedAdjustmentRecord(ORMBase):
     """Unified record combining pending and history adjustments."""
     id: str = Field(..., description="Composite ID: 'pending_{id}' or 'history_{id}'")
     original_id: int = Field(..., description="Original record ID from database")
@@ -377,45 +290,15 @@ class UnifiedAdjustmentRecord(BaseModel):
     total_items: int = Field(..., description="Total number of items")
     successful_items: Optional[int] = Field(None, description="Successful items (history only)")
     failed_items: Optional[int] = Field(None, description="Failed items (history only)")
-    items: List[Dict[str, Any]] = Field(..., description="List of adjustment items")
+    items: Any = Field(..., description="List of adjustment items (dicts, passed through unvalidated)")
     has_pdf: bool = Field(..., description="Whether PDF report is available")
     pdf_filename: Optional[str] = Field(None, description="PDF filename")
     has_errors: Optional[bool] = Field(None, description="Whether execution had errors (history only)")
 
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
-            "example": {
-                "id": "pending_123",
-                "original_id": 123,
-                "source": "pending",
-                "status": "pending",
-                "adjustment_type": "entry",
-                "username": "bodeguero1",
-                "created_at": "2025-01-15T10:30:00",
-                "updated_at": "2025-01-15T10:30:00",
-                "confirmed_at": None,
-                "confirmed_by": None,
-                "total_items": 5,
-                "successful_items": None,
-                "failed_items": None,
-                "items": [],
-                "has_pdf": False,
-                "pdf_filename": None,
-                "has_errors": None
-            }
-        }
-
 
 class UnifiedAdjustmentHistoryResponse(BaseModel):
     """Response for unified adjustment history (pending + confirmed + rejected)."""
     records: List[UnifiedAdjustmentRecord] = Field(..., description="List of unified adjustment records")
     total: int = Field(..., description="Total number of records")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "records": [],
-                "total": 0
-            }
-        }
+    model_config = ConfigDict(defer_build=True)
@@ -1,8 +1,27 @@
 """
 Common schemas shared across features.
 """
+from functools import cached_property
 from typing import Optional, Any, Dict
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ORMBase(BaseModel):
+    """Base for response schemas read from ORM objects."""
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_orm_fast(cls, obj: Any, **values: Any):
+        """
+        Build from a trusted ORM row without running validation.
+
+        Only for rows read back from our own database; anything coming from
+        a client must go through ``model_validate``. Nested models are not
+        converted, so pass them pre-built in ``values``.
+        """
+        for name in cls.model_fields.keys() - values.keys():
+            values[name] = getattr(obj, name)
+        return cls.model_construct(**values)
 
 
 class MessageResponse(BaseModel):
@@ -23,7 +42,9 @@ class PaginationParams(BaseModel):
     page: int = Field(default=1, ge=1, description="Page number (1-indexed)")
     page_size: int = Field(default=50, ge=1, le=1000, description="Items per page")
 
-    @property
+    model_config = ConfigDict(frozen=True)  # Keeps the cached offset valid
+
+    @cached_property
     def offset(self) -> int:
         """Calculate SQL offset from page number."""
         return (self.page - 1) * self.page_size
@@ -63,18 +84,6 @@ class OdooCredentials(OdooConfigBase):
     username: str = Field(..., description="Odoo username")
     password: str = Field(..., description="Odoo password")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "url": "https://odoo.example.com",
-                "database": "production_db",
-                "port": 443,
-                "username": "admin",
-                "password": "password123",
-                "verify_ssl": True
-            }
-        }
-
 
 class BranchConnectionRequest(BaseModel):
     """Branch connection request using location selector."""
@@ -83,16 +92,6 @@ class BranchConnectionRequest(BaseModel):
     password: str = Field(..., description="Odoo password")
     verify_ssl: bool = Field(default=True, description="Verify SSL certificate")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "location_id": "sucursal",
-                "username": "admin",
-                "password": "password123",
-                "verify_ssl": True
-            }
-        }
-
 
 class HealthResponse(BaseModel):
     """Health check response."""
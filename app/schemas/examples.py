@@ -0,0 +1,538 @@
+"""
+OpenAPI examples for request/response schemas.
+
+Kept out of the schema classes so the example payloads are only loaded
+when ``/openapi.json`` is generated (see ``app.main.custom_openapi``).
+Keyed by schema class name; the example is set on every schema whose
+``title`` matches, including request bodies registered via
+``json_body_openapi``.
+"""
+from typing import Any, Dict
+
+
+EXAMPLES: Dict[str, Dict[str, Any]] = {
+    "EntryAdjustmentItem": {
+        "barcode": "123456789",
+        "product_id": 100,
+        "product_name": "Producto Ejemplo",
+        "quantity": 10,
+        "available_stock": 50,
+        "adjustment_type": "entry",
+        "reason": "purchase",
+        "description": "Compra de mercadería",
+        "unit_price": 15.50
+    },
+    "AdjustmentRequest": {
+        "items": [
+            {
+                "barcode": "123456789",
+                "product_id": 100,
+                "product_name": "Producto A",
+                "quantity": 10,
+                "available_stock": 50,
+                "adjustment_type": "entry",
+                "reason": "purchase",
+                "description": "Nueva compra"
+            },
+            {
+                "barcode": "987654321",
+                "product_id": 101,
+                "product_name": "Producto B",
+                "quantity": -5,
+                "available_stock": 20,
+                "adjustment_type": "exit",
+                "reason": "damage",
+                "description": "Producto dañado"
+            }
+        ]
+    },
+    "ConfirmAdjustmentRequest": {
+        "items": [
+            {
+                "barcode": "123456789",
+                "product_id": 100,
+                "product_name": "Producto A",
+                "quantity": 10,
+                "available_stock": 50,
+                "adjustment_type": "entry",
+                "reason": "purchase"
+            }
+        ]
+    },
+    "AdjustmentResponse": {
+        "success": True,
+        "message": "Adjustment prepared successfully",
+        "processed_count": 2,
+        "inventory_updated": False
+    },
+    "PendingAdjustmentResponse": {
+        "id": 1,
+        "user_id": 5,
+        "username": "bodeguero1",
+        "adjustment_type": "entry",
+        "status": "pending",
+        "created_at": "2025-12-04T10:30:00",
+        "updated_at": "2025-12-04T10:30:00",
+        "confirmed_at": None,
+        "confirmed_by": None,
+        "items": [
+            {
+                "id": 1,
+                "barcode": "123456789",
+                "product_id": 100,
+                "product_name": "Producto Ejemplo",
+                "quantity": 10,
+                "available_stock": 50,
+                "adjustment_type": "entry",
+                "reason": "purchase",
+                "description": "Nueva compra",
+                "unit_price": 15.50
+            }
+        ]
+    },
+    "PendingAdjustmentListResponse": {
+        "adjustments": [
+            {
+                "id": 1,
+                "username": "bodeguero1",
+                "adjustment_type": "entry",
+                "status": "pending",
+                "created_at": "2025-12-04T10:30:00",
+                "items": []
+            }
+        ],
+        "total": 1
+    },
+    "AdjustmentHistoryResponse": {
+        "history": [
+            {
+                "id": 1,
+                "adjustment_type": "entry",
+                "product_name": "Producto A",
+                "barcode": "123456789",
+                "quantity": 10,
+                "reason": "purchase",
+                "description": "Nueva compra",
+                "created_by": "bodeguero1",
+                "confirmed_by": "admin",
+                "created_at": "2025-12-04T10:30:00",
+                "confirmed_at": "2025-12-04T11:00:00"
+            }
+        ],
+        "total": 1
+    },
+    "UnifiedAdjustmentRecord": {
+        "id": "pending_123",
+        "original_id": 123,
+        "source": "pending",
+        "status": "pending",
+        "adjustment_type": "entry",
+        "username": "bodeguero1",
+        "created_at": "2025-01-15T10:30:00",
+        "updated_at": "2025-01-15T10:30:00",
+        "confirmed_at": None,
+        "confirmed_by": None,
+        "total_items": 5,
+        "successful_items": None,
+        "failed_items": None,
+        "items": [],
+        "has_pdf": False,
+        "pdf_filename": None,
+        "has_errors": None
+    },
+    "UnifiedAdjustmentHistoryResponse": {
+        "records": [],
+        "total": 0
+    },
+    "LoginRequest": {
+        "username": "admin",
+        "password": "admin_password"
+    },
+    "OdooLoginRequest": {
+        "username": "admin",
+        "password": "admin_password",
+        "location_id": "principal",
+        "verify_ssl": True
+    },
+    "TokenResponse": {
+        "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
+        "token_type": "bearer",
+        "expires_in": 86400
+    },
+    "UserInfo": {
+        "username": "jperez",
+        "role": "cajero",
+        "auth_source": "database",
+        "full_name": "Juan Pérez",
+        "user_id": 1
+    },
+    "LoginResponse": {
+        "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
+        "token_type": "bearer",
+        "expires_in": 86400,
+        "user": {
+            "username": "jperez",
+            "role": "cajero",
+            "auth_source": "database",
+            "full_name": "Juan Pérez"
+        }
+    },
+    "OdooCredentials": {
+        "url": "https://odoo.example.com",
+        "database": "production_db",
+        "port": 443,
+        "username": "admin",
+        "password": "password123",
+        "verify_ssl": True
+    },
+    "BranchConnectionRequest": {
+        "location_id": "sucursal",
+        "username": "admin",
+        "password": "password123",
+        "verify_ssl": True
+    },
+    "InvoiceItemUpdateRequest": {
+        "quantity": 120,
+        "barcode": "7501234567890"
+    },
+    "InvoiceItemSalePriceUpdateRequest": {
+        "manual_sale_price": 8.50
+    },
+    "AdminItemUpdateRequest": {
+        "quantity": 120,
+        "barcode": "7501234567890",
+        "product_name": "Producto Corregido"
+    },
+    "ItemExcludeRequest": {
+        "is_excluded": True,
+        "reason": "No es para venta - servicio de transporte"
+    },
+    "InvoiceSubmitRequest": {
+        "notes": "Todos los códigos de barras verificados"
+    },
+    "InvoiceSyncRequest": {
+        "notes": "Sincronizado después de verificación",
+        "item_ids": [1, 2, 3]
+    },
+    "ProductPreview": {
+        "codigo_principal": "SKU12345",
+        "codigo_auxiliar": "7501234567890",
+        "descripcion": "Producto de ejemplo",
+        "cantidad": 100.0,
+        "precio_unitario": 5.50,
+        "precio_total": 550.00
+    },
+    "InvoicePreview": {
+        "filename": "factura_001.xml",
+        "invoice_number": "001-001-000123456",
+        "supplier_name": "Proveedor SA",
+        "invoice_date": "2025-01-15T10:30:00",
+        "products": [],
+        "total_products": 100
+    },
+    "InvoicePreviewResponse": {
+        "success": True,
+        "message": "Preview generated for 2 file(s)",
+        "previews": [],
+        "total_files": 2,
+        "total_products": 250
+    },
+    "ProductData": {
+        "descripcion": "Producto de ejemplo",
+        "cantidad": 10.0,
+        "codigo_auxiliar": "123456789",
+        "precio_unitario": 5.50,
+        "precio_total_linea": 55.00
+    },
+    "ProductMapped": {
+        "name": "Producto de ejemplo",
+        "qty_available": 10.0,
+        "barcode": "123456789",
+        "standard_price": 5.50,
+        "list_price": 8.25,
+        "display_price": 9.49,
+        "type": "storable",
+        "tracking": "none",
+        "available_in_pos": True,
+        "quantity_mode": "replace"
+    },
+    "ProductInput": {
+        "name": "Nuevo Producto",
+        "qty_available": 20.0,
+        "barcode": "987654321",
+        "standard_price": 10.00,
+        "list_price": 15.00,
+        "display_price": 17.25,
+        "quantity_mode": "replace",
+        "image_1920": None
+    },
+    "ProductResponse": {
+        "id": 123,
+        "name": "Producto de ejemplo",
+        "barcode": "123456789",
+        "qty_available": 10.0,
+        "standard_price": 5.50,
+        "list_price": 8.25,
+        "display_price": 9.49,
+        "tracking": "none",
+        "available_in_pos": True,
+        "image_1920": None
+    },
+    "SyncResult": {
+        "success": True,
+        "message": "Product created successfully",
+        "product_id": 123,
+        "action": "created",
+        "product_name": "Producto de ejemplo",
+        "barcode": "123456789"
+    },
+    "SyncResponse": {
+        "results": [],
+        "total_processed": 25,
+        "created_count": 10,
+        "updated_count": 12,
+        "errors_count": 3,
+        "pdf_filename": "sync_report_20240115_103000.pdf",
+        "pdf_content": "base64_encoded_pdf_content"
+    },
+    "XMLUploadRequest": {
+        "provider": "D'Mujeres",
+        "apply_margin": True,
+        "margin_percentage": 0.50,
+        "quantity_mode": "replace"
+    },
+    "XMLParseResponse": {
+        "products": [],
+        "total_found": 25,
+        "provider": "D'Mujeres"
+    },
+    "InconsistencyItem": {
+        "barcode": "123456789",
+        "product_name": "Producto A",
+        "sucursal_id": 456,
+        "principal_list_price": 10.00,
+        "sucursal_list_price": 9.50,
+        "list_price_difference": 0.50,
+        "principal_standard_price": 8.00,
+        "sucursal_standard_price": 7.50,
+        "standard_price_difference": 0.50,
+        "principal_stock": 100.0,
+        "sucursal_stock": 50.0
+    },
+    "FixInconsistencyItem": {
+        "barcode": "123456789",
+        "sucursal_id": 456,
+        "new_name": "Producto A",
+        "new_list_price": 10.00,
+        "new_standard_price": 8.00
+    },
+    "InconsistencyResponse": {
+        "success": True,
+        "message": "Found 5 inconsistencies",
+        "inconsistencies": [],
+        "total_inconsistencies": 5
+    },
+    "SyncRequest": {
+        "products": [],
+        "profit_margin": 0.50,
+        "quantity_mode": "replace",
+        "xml_filename": "factura_20251217.xml",
+        "xml_provider": "D'Mujeres",
+        "apply_iva": True
+    },
+    "ProductSyncHistoryResponse": {
+        "id": 1,
+        "xml_filename": "factura_dmujeres_20251217.xml",
+        "xml_provider": "D'Mujeres",
+        "profit_margin": 0.3,
+        "quantity_mode": "replace",
+        "apply_iva": True,
+        "executed_by": "admin",
+        "executed_at": "2025-12-17T10:30:00",
+        "total_items": 50,
+        "successful_items": 48,
+        "failed_items": 2,
+        "created_count": 10,
+        "updated_count": 38,
+        "has_errors": True,
+        "error_summary": "2 products failed: Product A: Invalid barcode, Product B: Not found",
+        "pdf_filename": "sync_report_20251217_103000.pdf",
+        "items": []
+    },
+    "ProductSyncHistoryListResponse": {
+        "history": [],
+        "total": 0
+    },
+    "SaleByEmployee": {
+        "employee_name": "SILVIA CHICAIZA",
+        "payment_method": "Efectivo",
+        "total_amount": 150.75,
+        "transaction_count": 12,
+        "first_sale_time": "08:30:00"
+    },
+    "PaymentMethodSummary": {
+        "method": "Efectivo",
+        "total": 450.50,
+        "count": 35
+    },
+    "POSSession": {
+        "id": 1,
+        "name": "POS/2024/0001",
+        "state": "opened",
+        "user_id": 2,
+        "user_name": "Juan Pérez",
+        "start_at": "2024-01-15T08:00:00",
+        "stop_at": None,
+        "config_id": 1,
+        "config_name": "Main POS",
+        "cash_register_balance_start": 100.00,
+        "cash_register_balance_end_real": None
+    },
+    "CierreCajaResponse": {
+        "date": "2024-01-15",
+        "total_sales": 1250.75,
+        "sales_by_employee": [],
+        "payment_methods": [],
+        "first_sale_time": "08:30:00",
+        "last_sale_time": "18:45:00",
+        "pos_sessions": []
+    },
+    "SalesDateRange": {
+        "start_date": "2024-01-15",
+        "end_date": "2024-01-15"
+    },
+    "TransferItem": {
+        "barcode": "123456789",
+        "quantity": 5
+    },
+    "TransferRequest": {
+        "products": [
+            {"barcode": "123456789", "quantity": 5},
+            {"barcode": "987654321", "quantity": 3}
+        ],
+        "destination_location_id": "sucursal"
+    },
+    "VerifyTransferRequest": {
+        "transfer_id": 1,
+        "products": [
+            {"barcode": "123456789", "quantity": 5},
+            {"barcode": "987654321", "quantity": 3}
+        ]
+    },
+    "ConfirmTransferRequest": {
+        "products": [
+            {"barcode": "123456789", "quantity": 5},
+            {"barcode": "987654321", "quantity": 3}
+        ],
+        "destination_location_id": "sucursal_sacha"
+    },
+    "TransferResponse": {
+        "success": True,
+        "message": "Transfer prepared successfully",
+        "xml_content": "<?xml version='1.0'?>...",
+        "pdf_filename": "transfer_admin_report_20240115_103000.pdf",
+        "processed_count": 2,
+        "inventory_reduced": False
+    },
+    "PendingTransferResponse": {
+        "id": 1,
+        "user_id": 5,
+        "username": "bodeguero1",
+        "created_by_role": "bodeguero",
+        "status": "pending",
+        "created_at": "2025-12-03T10:30:00",
+        "updated_at": "2025-12-03T10:30:00",
+        "verified_at": None,
+        "verified_by": None,
+        "confirmed_at": None,
+        "confirmed_by": None,
+        "destination_location_id": "sucursal",
+        "destination_location_name": "Sucursal Principal",
+        "items": [
+            {
+                "id": 1,
+                "barcode": "123456789",
+                "product_id": 100,
+                "product_name": "Producto Ejemplo",
+                "quantity": 5,
+                "available_stock": 20,
+                "unit_price": 15.50
+            }
+        ]
+    },
+    "PendingTransferListResponse": {
+        "transfers": [
+            {
+                "id": 1,
+                "username": "bodeguero1",
+                "status": "pending",
+                "created_at": "2025-12-03T10:30:00",
+                "items": []
+            }
+        ],
+        "total": 1
+    },
+    "TransferHistoryResponse": {
+        "id": 1,
+        "pending_transfer_id": 5,
+        "origin_location": "principal",
+        "destination_location_id": "sucursal",
+        "destination_location_name": "Sucursal Principal",
+        "executed_by": "admin",
+        "executed_at": "2025-12-10T15:30:00",
+        "total_items": 3,
+        "successful_items": 2,
+        "failed_items": 1,
+        "total_quantity_requested": 15,
+        "total_quantity_transferred": 10,
+        "has_errors": True,
+        "error_summary": "Product X: Insufficient stock",
+        "pdf_filename": "transfer_report_20251210_153000.pdf",
+        "items": []
+    },
+    "TransferHistoryListResponse": {
+        "history": [],
+        "total": 0
+    },
+    "TransferHistoryProductSearchResponse": {
+        "results": [],
+        "total": 0,
+        "search_query": "ABC123",
+        "search_type": "barcode"
+    },
+    "UserCreate": {
+        "username": "jperez",
+        "email": "jperez@example.com",
+        "full_name": "Juan Pérez",
+        "password": "SecurePass123",
+        "role": "cajero"
+    },
+    "UserResponse": {
+        "id": 1,
+        "username": "jperez",
+        "email": "jperez@example.com",
+        "full_name": "Juan Pérez",
+        "role": "cajero",
+        "is_active": True,
+        "created_at": "2024-01-15T10:30:00",
+        "updated_at": "2024-01-15T10:30:00"
+    },
+}
+
+
+def add_examples(node: Any) -> None:
+    """
+    Attach ``EXAMPLES`` entries to an OpenAPI document in place.
+
+    Args:
+        node: OpenAPI document (or any sub-tree of it)
+    """
+    if isinstance(node, dict):
+        example = EXAMPLES.get(node.get("title")) if "properties" in node else None
+        if example is not None:
+            node["example"] = example
+        for value in node.values():
+            add_examples(value)
+    elif isinstance(node, list):
+        for value in node:
+            add_examples(value)
@@ -2,9 +2,11 @@
 Invoice schemas for request/response validation.
 Handles data transfer between API endpoints and clients.
 """
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, NaiveDatetime, SkipValidation
+from pydantic.dataclasses import dataclass
+from app.schemas.common import ORMBase
 
 
 # ============================================================================
@@ -16,26 +18,13 @@ class InvoiceItemUpdateRequest(BaseModel):
     quantity: float = Field(..., gt=0, description="Quantity in units")
     barcode: Optional[str] = Field(None, description="Product barcode")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "quantity": 120,
-                "barcode": "7501234567890"
-            }
-        }
+    model_config = ConfigDict(frozen=True)
 
 
 class InvoiceItemSalePriceUpdateRequest(BaseModel):
     """Request to update manual sale price (admin only)."""
     manual_sale_price: Optional[float] = Field(None, description="Manual sale price with IVA (null to use calculated price)")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "manual_sale_price": 8.50
-            }
-        }
-
 
 class AdminItemUpdateRequest(BaseModel):
     """Request for admin to update invoice item (can edit all fields)."""
@@ -44,40 +33,18 @@ class AdminItemUpdateRequest(BaseModel):
     product_name: Optional[str] = Field(None, description="Product name (admin only)")
     source_item_ids: Optional[List[int]] = Field(None, description="IDs of all source items in a consolidated group")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "quantity": 120,
-                "barcode": "7501234567890",
-                "product_name": "Producto Corregido"
-            }
-        }
-
 
 class ItemExcludeRequest(BaseModel):
     """Request to exclude/include item from sync (admin only)."""
     is_excluded: bool = Field(..., description="True to exclude, False to include")
     reason: Optional[str] = Field(None, max_length=255, description="Reason for exclusion")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "is_excluded": True,
-                "reason": "No es para venta - servicio de transporte"
-            }
-        }
-
 
 class InvoiceSubmitRequest(BaseModel):
     """Request to submit invoice as completed (bodeguero)."""
     notes: Optional[str] = Field(None, description="Optional notes or comments")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "notes": "Todos los códigos de barras verificados"
-            }
-        }
+    model_config = ConfigDict(frozen=True)
 
 
 class InvoiceSyncRequest(BaseModel):
@@ -85,21 +52,21 @@ class InvoiceSyncRequest(BaseModel):
     notes: Optional[str] = Field(None, description="Optional admin notes")
     item_ids: Optional[List[int]] = Field(None, description="Optional list of item IDs to sync. If None, syncs all items.")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "notes": "Sincronizado después de verificación",
-                "item_ids": [1, 2, 3]
-            }
-        }
+    model_config = ConfigDict(frozen=True)
 
 
 # ============================================================================
 # RESPONSE SCHEMAS
 # ============================================================================
 
-class InvoiceItemResponse(BaseModel):
-    """Invoice item response (prices filtered based on role)."""
+@dataclass(slots=True, kw_only=True)
+class InvoiceItemResponse:
+    """
+    Invoice item response (prices filtered based on role).
+
+    A slots-backed pydantic dataclass (no per-instance __dict__), since invoices
+    carry hundreds of items. Built from keyword arguments only.
+    """
     id: int
     codigo_original: str
     product_name: str
@@ -114,33 +81,30 @@ class InvoiceItemResponse(BaseModel):
     # Exclusion fields (admin can exclude items like "TRANSPORTE")
     is_excluded: bool = False
     excluded_reason: Optional[str] = None
-    # Sync status fields
-    sync_success: Optional[bool] = None
-    sync_error: Optional[str] = None
-    product_id: Optional[int] = None
+    # Sync status fields (copied from the DB row server-side, so not re-validated)
+    sync_success: SkipValidation[Optional[bool]] = None
+    sync_error: SkipValidation[Optional[str]] = None
+    product_id: SkipValidation[Optional[int]] = None
     # For consolidated items: list of original item IDs that were merged
     source_item_ids: Optional[List[int]] = None
     # Odoo product info (populated for admin when Odoo is available)
     odoo_exists: bool = False
     odoo_list_price: Optional[float] = None
 
-    class Config:
-        from_attributes = True
 
-
-class PendingInvoiceResponse(BaseModel):
+class PendingInvoiceResponse(ORMBase):
     """Pending invoice response with items."""
     id: int
     invoice_number: Optional[str]
     supplier_name: Optional[str]
-    invoice_date: Optional[datetime]
+    invoice_date: Optional[NaiveDatetime]
     status: str
     uploaded_by_username: str
     xml_filename: str
     barcode_source: Optional[str] = None
-    created_at: datetime
-    updated_at: datetime
-    submitted_at: Optional[datetime]
+    created_at: NaiveDatetime
+    updated_at: NaiveDatetime
+    submitted_at: Optional[NaiveDatetime]
     submitted_by: Optional[str]
     notes: Optional[str]
     # Sync configuration
@@ -151,15 +115,14 @@ class PendingInvoiceResponse(BaseModel):
     total_items: int
     total_quantity: float
 
-    class Config:
-        from_attributes = True
-
 
 class PendingInvoiceListResponse(BaseModel):
     """List of pending invoices."""
-    invoices: List[PendingInvoiceResponse]
+    invoices: Tuple[PendingInvoiceResponse, ...]
     total: int
 
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
 
 class InvoiceUploadResponse(BaseModel):
     """Response after uploading XML invoices."""
@@ -194,18 +157,6 @@ class ProductPreview(BaseModel):
     precio_unitario: Optional[float] = None
     precio_total: Optional[float] = None
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "codigo_principal": "SKU12345",
-                "codigo_auxiliar": "7501234567890",
-                "descripcion": "Producto de ejemplo",
-                "cantidad": 100.0,
-                "precio_unitario": 5.50,
-                "precio_total": 550.00
-            }
-        }
-
 
 class InvoicePreview(BaseModel):
     """Preview data for a single XML file."""
@@ -216,18 +167,6 @@ class InvoicePreview(BaseModel):
     products: List[ProductPreview]
     total_products: int
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "filename": "factura_001.xml",
-                "invoice_number": "001-001-000123456",
-                "supplier_name": "Proveedor SA",
-                "invoice_date": "2025-01-15T10:30:00",
-                "products": [],
-                "total_products": 100
-            }
-        }
-
 
 class InvoicePreviewResponse(BaseModel):
     """Response containing preview for all uploaded files."""
@@ -237,60 +176,4 @@ class InvoicePreviewResponse(BaseModel):
     total_files: int
     total_products: int
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "success": True,
-                "message": "Preview generated for 2 file(s)",
-                "previews": [],
-                "total_files": 2,
-                "total_products": 250
-            }
-        }
-
-
-# ============================================================================
-# HISTORY SCHEMAS
-# ============================================================================
-
-class InvoiceHistoryItemResponse(BaseModel):
-    """Invoice history item response."""
-    id: int
-    codigo_original: str
-    barcode: Optional[str] = None
-    product_id: Optional[int] = None
-    product_name: str
-    quantity: float
-    unit_price: Optional[float] = None  # Cost
-    sale_price: Optional[float] = None  # Sale price synced to Odoo
-    total_value: Optional[float] = None  # Total cost
-    success: bool
-    error_message: Optional[str] = None
-    was_modified: bool
-
-    class Config:
-        from_attributes = True
-
-
-class InvoiceHistoryResponse(BaseModel):
-    """Invoice history response."""
-    id: int
-    invoice_number: str
-    supplier_name: Optional[str]
-    uploaded_by: str
-    synced_by: str
-    synced_at: datetime
-    total_items: int
-    successful_items: int
-    failed_items: int
-    has_errors: bool
-    items: List[InvoiceHistoryItemResponse]
-
-    class Config:
-        from_attributes = True
-
-
-class InvoiceHistoryListResponse(BaseModel):
-    """List of invoice history records."""
-    history: List[InvoiceHistoryResponse]
-    total: int
+    model_config = ConfigDict(defer_build=True)
@@ -0,0 +1,48 @@
+"""
+Invoice history schemas.
+
+Kept apart from ``app.schemas.invoice`` so the pending-invoice flow does
+not build the history models; only the ``/history`` endpoints use them.
+"""
+from typing import List, Optional, Tuple
+from pydantic import BaseModel, ConfigDict, NaiveDatetime
+from app.schemas.common import ORMBase
+
+
+class InvoiceHistoryItemResponse(ORMBase):
+    """Invoice history item response."""
+    id: int
+    codigo_original: str
+    barcode: Optional[str] = None
+    product_id: Optional[int] = None
+    product_name: str
+    quantity: float
+    unit_price: Optional[float] = None  # Cost
+    sale_price: Optional[float] = None  # Sale price synced to Odoo
+    total_value: Optional[float] = None  # Total cost
+    success: bool
+    error_message: Optional[str] = None
+    was_modified: bool
+
+
+class InvoiceHistoryResponse(ORMBase):
+    """Invoice history response."""
+    id: int
+    invoice_number: str
+    supplier_name: Optional[str]
+    uploaded_by: str
+    synced_by: str
+    synced_at: NaiveDatetime
+    total_items: int
+    successful_items: int
+    failed_items: int
+    has_errors: bool
+    items: List[InvoiceHistoryItemResponse]
+
+
+class InvoiceHistoryListResponse(BaseModel):
+    """List of invoice history records."""
+    history: Tuple[InvoiceHistoryResponse, ...]
+    total: int
+
+    model_config = ConfigDict(defer_build=True, frozen=True)
@@ -1,8 +1,9 @@
 """
 Product-related schemas.
 """
-from typing import Optional, List
-from pydantic import BaseModel, Field, field_validator
+from typing import Annotated, List, Literal, Optional
+from annotated_types import Ge, Gt
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from app.core.constants import QuantityMode, XMLProvider
 
 
@@ -14,46 +15,21 @@ class ProductData(BaseModel):
     precio_unitario: float = Field(..., gt=0, description="Unit price")
     precio_total_linea: Optional[float] = Field(None, description="Total line price (for consolidation)")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "descripcion": "Producto de ejemplo",
-                "cantidad": 10.0,
-                "codigo_auxiliar": "123456789",
-                "precio_unitario": 5.50,
-                "precio_total_linea": 55.00
-            }
-        }
-
 
 class ProductMapped(BaseModel):
-    """Product mapped to Odoo format."""
-    name: str = Field(..., description="Product name")
-    qty_available: float = Field(..., ge=0, description="Available quantity")
-    barcode: str = Field(..., description="Product barcode")
-    standard_price: float = Field(..., gt=0, description="Cost price")
-    list_price: float = Field(..., gt=0, description="Sale price (without IVA)")
-    display_price: Optional[float] = Field(None, description="Sale price with IVA for display")
-    type: str = Field(default='storable', description="Product type")
-    tracking: str = Field(default='none', description="Inventory tracking mode")
-    available_in_pos: bool = Field(default=True, description="Available in POS")
-    quantity_mode: QuantityMode = Field(default=QuantityMode.REPLACE, description="Quantity update mode")
+    """Product mapped to Odoo format (internal; not part of the API schema)."""
+    name: str
+    qty_available: Annotated[float, Ge(0)]
+    barcode: str
+    standard_price: Annotated[float, Gt(0)]  # Cost price
+    list_price: Annotated[float, Gt(0)]  # Sale price (without IVA)
+    display_price: Optional[float] = None  # Sale price with IVA for display
+    type: str = 'storable'
+    tracking: str = 'none'  # Inventory tracking mode
+    available_in_pos: bool = True
+    quantity_mode: QuantityMode = QuantityMode.REPLACE
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "name": "Producto de ejemplo",
-                "qty_available": 10.0,
-                "barcode": "123456789",
-                "standard_price": 5.50,
-                "list_price": 8.25,
-                "display_price": 9.49,
-                "type": "storable",
-                "tracking": "none",
-                "available_in_pos": True,
-                "quantity_mode": "replace"
-            }
-        }
+    model_config = ConfigDict(use_enum_values=True)
 
 
 class ProductInput(BaseModel):
@@ -67,20 +43,6 @@ class ProductInput(BaseModel):
     quantity_mode: QuantityMode = Field(default=QuantityMode.REPLACE)
     image_1920: Optional[str] = Field(None, description="Product image (base64)")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "name": "Nuevo Producto",
-                "qty_available": 20.0,
-                "barcode": "987654321",
-                "standard_price": 10.00,
-                "list_price": 15.00,
-                "display_price": 17.25,
-                "quantity_mode": "replace",
-                "image_1920": None
-            }
-        }
-
 
 class ProductResponse(BaseModel):
     """Product information response from Odoo."""
@@ -95,22 +57,6 @@ class ProductResponse(BaseModel):
     available_in_pos: bool
     image_1920: Optional[str] = None
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "id": 123,
-                "name": "Producto de ejemplo",
-                "barcode": "123456789",
-                "qty_available": 10.0,
-                "standard_price": 5.50,
-                "list_price": 8.25,
-                "display_price": 9.49,
-                "tracking": "none",
-                "available_in_pos": True,
-                "image_1920": None
-            }
-        }
-
 
 class SyncResult(BaseModel):
     """Result of a single product sync operation."""
@@ -132,18 +78,6 @@ class SyncResult(BaseModel):
     price_updated: Optional[bool] = None
     stock_updated: Optional[bool] = None
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "success": True,
-                "message": "Product created successfully",
-                "product_id": 123,
-                "action": "created",
-                "product_name": "Producto de ejemplo",
-                "barcode": "123456789"
-            }
-        }
-
 
 class SyncResponse(BaseModel):
     """Response from bulk product sync operation."""
@@ -155,19 +89,6 @@ class SyncResponse(BaseModel):
     pdf_filename: Optional[str] = None
     pdf_content: Optional[str] = None
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "results": [],
-                "total_processed": 25,
-                "created_count": 10,
-                "updated_count": 12,
-                "errors_count": 3,
-                "pdf_filename": "sync_report_20240115_103000.pdf",
-                "pdf_content": "base64_encoded_pdf_content"
-            }
-        }
-
 
 class XMLUploadRequest(BaseModel):
     """Request for XML file upload with provider."""
@@ -176,15 +97,7 @@ class XMLUploadRequest(BaseModel):
     margin_percentage: Optional[float] = Field(None, ge=0, le=1, description="Custom margin (0-1)")
     quantity_mode: QuantityMode = Field(default=QuantityMode.REPLACE)
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "provider": "D'Mujeres",
-                "apply_margin": True,
-                "margin_percentage": 0.50,
-                "quantity_mode": "replace"
-            }
-        }
+    model_config = ConfigDict(frozen=True)
 
 
 class XMLParseResponse(BaseModel):
@@ -193,14 +106,7 @@ class XMLParseResponse(BaseModel):
     total_found: int
     provider: XMLProvider
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "products": [],
-                "total_found": 25,
-                "provider": "D'Mujeres"
-            }
-        }
+    model_config = ConfigDict(defer_build=True)
 
 
 class InconsistencyItem(BaseModel):
@@ -217,23 +123,6 @@ class InconsistencyItem(BaseModel):
     principal_stock: float
     sucursal_stock: float
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "barcode": "123456789",
-                "product_name": "Producto A",
-                "sucursal_id": 456,
-                "principal_list_price": 10.00,
-                "sucursal_list_price": 9.50,
-                "list_price_difference": 0.50,
-                "principal_standard_price": 8.00,
-                "sucursal_standard_price": 7.50,
-                "standard_price_difference": 0.50,
-                "principal_stock": 100.0,
-                "sucursal_stock": 50.0
-            }
-        }
-
 
 class FixInconsistencyItem(BaseModel):
     """Item to fix in branch."""
@@ -243,17 +132,6 @@ class FixInconsistencyItem(BaseModel):
     new_list_price: Optional[float] = None
     new_standard_price: Optional[float] = None
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "barcode": "123456789",
-                "sucursal_id": 456,
-                "new_name": "Producto A",
-                "new_list_price": 10.00,
-                "new_standard_price": 8.00
-            }
-        }
-
 
 class InconsistencyResponse(BaseModel):
     """Response with detected inconsistencies."""
@@ -262,35 +140,15 @@ class InconsistencyResponse(BaseModel):
     inconsistencies: List[InconsistencyItem]
     total_inconsistencies: int = Field(description="Total inconsistencies found")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "success": True,
-                "message": "Found 5 inconsistencies",
-                "inconsistencies": [],
-                "total_inconsistencies": 5
-            }
-        }
+    model_config = ConfigDict(defer_build=True)
 
 
 class SyncRequest(BaseModel):
     """Request for syncing products to Odoo."""
     products: List[dict] = Field(..., description="List of products to sync")
     profit_margin: float = Field(default=0.50, ge=0, le=1, description="Profit margin (0-1)")
-    quantity_mode: str = Field(default="replace", description="Quantity mode: replace or add")
+    quantity_mode: Literal["replace", "add"] = Field(default="replace", description="Quantity mode: replace or add")
     xml_filename: Optional[str] = Field(default="manual_sync.xml", description="Name of XML file")
     xml_provider: Optional[str] = Field(default="Generic", description="Provider name")
     apply_iva: Optional[bool] = Field(default=True, description="Whether IVA was applied")
     xml_content: Optional[str] = Field(default=None, description="Original XML content")
-
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "products": [],
-                "profit_margin": 0.50,
-                "quantity_mode": "replace",
-                "xml_filename": "factura_20251217.xml",
-                "xml_provider": "D'Mujeres",
-                "apply_iva": True
-            }
-        }
@@ -2,11 +2,11 @@
 Product Sync History schemas.
 """
 from typing import List, Optional
-from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, NaiveDatetime
+from app.schemas.common import ORMBase
 
 
-class ProductSyncHistoryItemResponse(BaseModel):
+class ProductSyncHistoryItemResponse(ORMBase):
     """Response schema for a product sync history item."""
     id: int
     barcode: str
@@ -26,11 +26,8 @@ class ProductSyncHistoryItemResponse(BaseModel):
     price_updated: bool = False
     is_new_product: bool = False
 
-    class Config:
-        from_attributes = True
 
-
-class ProductSyncHistoryResponse(BaseModel):
+class ProductSyncHistoryResponse(ORMBase):
     """Response schema for product sync history."""
     id: int
     xml_filename: str
@@ -39,7 +36,7 @@ class ProductSyncHistoryResponse(BaseModel):
     quantity_mode: str
     apply_iva: bool
     executed_by: str
-    executed_at: datetime
+    executed_at: NaiveDatetime
     total_items: int
     successful_items: int
     failed_items: int
@@ -50,40 +47,10 @@ class ProductSyncHistoryResponse(BaseModel):
     pdf_filename: Optional[str] = None
     items: List[ProductSyncHistoryItemResponse] = []
 
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
-            "example": {
-                "id": 1,
-                "xml_filename": "factura_dmujeres_20251217.xml",
-                "xml_provider": "D'Mujeres",
-                "profit_margin": 0.3,
-                "quantity_mode": "replace",
-                "apply_iva": True,
-                "executed_by": "admin",
-                "executed_at": "2025-12-17T10:30:00",
-                "total_items": 50,
-                "successful_items": 48,
-                "failed_items": 2,
-                "created_count": 10,
-                "updated_count": 38,
-                "has_errors": True,
-                "error_summary": "2 products failed: Product A: Invalid barcode, Product B: Not found",
-                "pdf_filename": "sync_report_20251217_103000.pdf",
-                "items": []
-            }
-        }
-
 
 class ProductSyncHistoryListResponse(BaseModel):
     """Response schema for list of product sync history."""
     history: List[ProductSyncHistoryResponse]
     total: int
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "history": [],
-                "total": 0
-            }
-        }
+    model_config = ConfigDict(defer_build=True)
@@ -1,8 +1,17 @@
 """
 Sales and cash register schemas.
 """
-from typing import List, Optional
-from pydantic import BaseModel, Field, field_validator
+from typing import Annotated, List, Optional
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field
+
+
+def _odoo_false_to_none(v):
+    """Odoo returns False for empty fields."""
+    return None if v is False else v
+
+
+OdooOptionalStr = Annotated[Optional[str], BeforeValidator(_odoo_false_to_none)]
+OdooOptionalFloat = Annotated[Optional[float], BeforeValidator(_odoo_false_to_none)]
 
 
 class SaleByEmployee(BaseModel):
@@ -13,17 +22,6 @@ class SaleByEmployee(BaseModel):
     transaction_count: int
     first_sale_time: Optional[str] = Field(None, description="Time of first sale (apertura)")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "employee_name": "SILVIA CHICAIZA",
-                "payment_method": "Efectivo",
-                "total_amount": 150.75,
-                "transaction_count": 12,
-                "first_sale_time": "08:30:00"
-            }
-        }
-
 
 class PaymentMethodSummary(BaseModel):
     """Payment method summary."""
@@ -31,15 +29,6 @@ class PaymentMethodSummary(BaseModel):
     total: float
     count: int
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "method": "Efectivo",
-                "total": 450.50,
-                "count": 35
-            }
-        }
-
 
 class POSSession(BaseModel):
     """Point of Sale session information."""
@@ -48,45 +37,12 @@ class POSSession(BaseModel):
     state: str = Field(..., description="Session state: opened, closed, etc.")
     user_id: int
     user_name: str
-    start_at: Optional[str] = None
-    stop_at: Optional[str] = None
+    start_at: OdooOptionalStr = None
+    stop_at: OdooOptionalStr = None
     config_id: int
     config_name: str
     cash_register_balance_start: float = 0.0
-    cash_register_balance_end_real: Optional[float] = None
-
-    @field_validator('start_at', 'stop_at', mode='before')
-    @classmethod
-    def validate_datetime_fields(cls, v):
-        """Handle Odoo False values for datetime fields."""
-        if v is False:
-            return None
-        return v
-
-    @field_validator('cash_register_balance_end_real', mode='before')
-    @classmethod
-    def validate_balance_end(cls, v):
-        """Handle Odoo False values for float fields."""
-        if v is False:
-            return None
-        return v
-
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "id": 1,
-                "name": "POS/2024/0001",
-                "state": "opened",
-                "user_id": 2,
-                "user_name": "Juan Pérez",
-                "start_at": "2024-01-15T08:00:00",
-                "stop_at": None,
-                "config_id": 1,
-                "config_name": "Main POS",
-                "cash_register_balance_start": 100.00,
-                "cash_register_balance_end_real": None
-            }
-        }
+    cash_register_balance_end_real: OdooOptionalFloat = None
 
 
 class CierreCajaResponse(BaseModel):
@@ -97,20 +53,7 @@ class CierreCajaResponse(BaseModel):
     payment_methods: List[PaymentMethodSummary]
     first_sale_time: Optional[str] = Field(None, description="Time of first sale (apertura general)")
     last_sale_time: Optional[str] = Field(None, description="Time of last sale")
-    pos_sessions: List[POSSession] = Field(default_factory=list, description="Active POS sessions")
-
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "date": "2024-01-15",
-                "total_sales": 1250.75,
-                "sales_by_employee": [],
-                "payment_methods": [],
-                "first_sale_time": "08:30:00",
-                "last_sale_time": "18:45:00",
-                "pos_sessions": []
-            }
-        }
+    pos_sessions: List[POSSession] = []  # Active POS sessions
 
 
 class SalesDateRange(BaseModel):
@@ -118,10 +61,4 @@ class SalesDateRange(BaseModel):
     start_date: str = Field(..., description="Start date (YYYY-MM-DD)")
     end_date: Optional[str] = Field(None, description="End date (YYYY-MM-DD), defaults to start_date")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "start_date": "2024-01-15",
-                "end_date": "2024-01-15"
-            }
-        }
+    model_config = ConfigDict(frozen=True)
@@ -1,9 +1,11 @@
 """
 Transfer-related schemas.
 """
-from typing import List, Optional
+from typing import Any, List, Optional
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.dataclasses import dataclass
+from app.schemas.common import ORMBase
 
 
 class TransferItem(BaseModel):
@@ -11,68 +13,33 @@ class TransferItem(BaseModel):
     barcode: str = Field(..., description="Product barcode")
     quantity: int = Field(..., gt=0, description="Quantity to transfer")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "barcode": "123456789",
-                "quantity": 5
-            }
-        }
-
 
 class TransferRequest(BaseModel):
     """Request to prepare a transfer."""
     products: List[TransferItem] = Field(..., min_length=1, description="Products to transfer")
     destination_location_id: Optional[str] = Field(None, description="Destination location ID (e.g., 'sucursal', 'sucursal_sacha')")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "products": [
-                    {"barcode": "123456789", "quantity": 5},
-                    {"barcode": "987654321", "quantity": 3}
-                ],
-                "destination_location_id": "sucursal"
-            }
-        }
-
 
 class VerifyTransferRequest(BaseModel):
     """Request to verify a transfer (bodeguero verifying cajero's transfer)."""
     transfer_id: int = Field(..., description="ID of transfer to verify")
     products: List[TransferItem] = Field(..., min_length=1, description="Verified products (can be edited)")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "transfer_id": 1,
-                "products": [
-                    {"barcode": "123456789", "quantity": 5},
-                    {"barcode": "987654321", "quantity": 3}
-                ]
-            }
-        }
-
 
 class ConfirmTransferRequest(BaseModel):
     """Request to confirm and execute a transfer."""
     products: List[TransferItem] = Field(..., min_length=1, description="Final confirmed products")
     destination_location_id: Optional[str] = Field(None, description="Destination location ID (admin can override)")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "products": [
-                    {"barcode": "123456789", "quantity": 5},
-                    {"barcode": "987654321", "quantity": 3}
-                ],
-                "destination_location_id": "sucursal_sacha"
-            }
-        }
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class TransferProductDetail:
+    """
+    Detailed product information in transfer response.
 
-class TransferProductDetail(BaseModel):
-    """Detailed product information in transfer response."""
+    Frozen, slots-backed pydantic dataclass built from keyword arguments
+    only (one per transferred product).
+    """
     barcode: str
     name: str
     quantity_requested: int
@@ -94,21 +61,10 @@ class TransferResponse(BaseModel):
     inventory_reduced: bool = Field(default=False, description="Whether inventory was actually reduced")
     products: Optional[List[TransferProductDetail]] = None
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "success": True,
-                "message": "Transfer prepared successfully",
-                "xml_content": "<?xml version='1.0'?>...",
-                "pdf_filename": "transfer_admin_report_20240115_103000.pdf",
-                "processed_count": 2,
-                "inventory_reduced": False
-            }
-        }
-
-
-class TransferValidationError(BaseModel):
-    """Transfer validation error details."""
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class TransferValidationError:
+    """Transfer validation error details (frozen, slots-backed, keyword arguments only)."""
     barcode: str
     product_name: str
     error_type: str  # 'not_found', 'insufficient_stock', 'exceeds_limit'
@@ -125,8 +81,11 @@ class TransferValidationResponse(BaseModel):
 
 
 # Pending Transfer Schemas
+#
+# Listing endpoints build these from DB rows with ``from_orm_fast`` (trusted,
+# no validation); request schemas above are always validated.
 
-class PendingTransferItemResponse(BaseModel):
+class PendingTransferItemResponse(ORMBase):
     """Response schema for a pending transfer item."""
     id: int
     barcode: str
@@ -136,11 +95,10 @@ class PendingTransferItemResponse(BaseModel):
     available_stock: int
     unit_price: Optional[float] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(frozen=True)
 
 
-class PendingTransferResponse(BaseModel):
+class PendingTransferResponse(ORMBase):
     """Response schema for a pending transfer."""
     id: int
     user_id: Optional[int] = None  # Nullable for Odoo admins
@@ -157,36 +115,11 @@ class PendingTransferResponse(BaseModel):
     destination_location_name: Optional[str] = None
     items: List[PendingTransferItemResponse] = []
 
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
-            "example": {
-                "id": 1,
-                "user_id": 5,
-                "username": "bodeguero1",
-                "created_by_role": "bodeguero",
-                "status": "pending",
-                "created_at": "2025-12-03T10:30:00",
-                "updated_at": "2025-12-03T10:30:00",
-                "verified_at": None,
-                "verified_by": None,
-                "confirmed_at": None,
-                "confirmed_by": None,
-                "destination_location_id": "sucursal",
-                "destination_location_name": "Sucursal Principal",
-                "items": [
-                    {
-                        "id": 1,
-                        "barcode": "123456789",
-                        "product_id": 100,
-                        "product_name": "Producto Ejemplo",
-                        "quantity": 5,
-                        "available_stock": 20,
-                        "unit_price": 15.50
-                    }
-                ]
-            }
-        }
+    @classmethod
+    def from_orm_fast(cls, obj: Any, **values: Any) -> "PendingTransferResponse":
+        """Build from a trusted PendingTransfer row, items included."""
+        values.setdefault("items", [PendingTransferItemResponse.from_orm_fast(item) for item in obj.items])
+        return super().from_orm_fast(obj, **values)
 
 
 class PendingTransferListResponse(BaseModel):
@@ -194,26 +127,10 @@ class PendingTransferListResponse(BaseModel):
     transfers: List[PendingTransferResponse]
     total: int
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "transfers": [
-                    {
-                        "id": 1,
-                        "username": "bodeguero1",
-                        "status": "pending",
-                        "created_at": "2025-12-03T10:30:00",
-                        "items": []
-                    }
-                ],
-                "total": 1
-            }
-        }
-
 
 # Transfer History Schemas
 
-class TransferHistoryItemResponse(BaseModel):
+class TransferHistoryItemResponse(ORMBase):
     """Response schema for a transfer history item."""
     id: int
     barcode: str
@@ -231,11 +148,10 @@ class TransferHistoryItemResponse(BaseModel):
     total_value: Optional[float] = None
     is_new_product: bool = False
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(frozen=True)
 
 
-class TransferHistoryResponse(BaseModel):
+class TransferHistoryResponse(ORMBase):
     """Response schema for transfer history."""
     id: int
     status: str  # "PENDING", "PENDING_VERIFICATION", "COMPLETED"
@@ -255,47 +171,16 @@ class TransferHistoryResponse(BaseModel):
     pdf_filename: Optional[str] = None
     items: List[TransferHistoryItemResponse] = []
 
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
-            "example": {
-                "id": 1,
-                "pending_transfer_id": 5,
-                "origin_location": "principal",
-                "destination_location_id": "sucursal",
-                "destination_location_name": "Sucursal Principal",
-                "executed_by": "admin",
-                "executed_at": "2025-12-10T15:30:00",
-                "total_items": 3,
-                "successful_items": 2,
-                "failed_items": 1,
-                "total_quantity_requested": 15,
-                "total_quantity_transferred": 10,
-                "has_errors": True,
-                "error_summary": "Product X: Insufficient stock",
-                "pdf_filename": "transfer_report_20251210_153000.pdf",
-                "items": []
-            }
-        }
-
 
 class TransferHistoryListResponse(BaseModel):
     """Response schema for list of transfer history."""
     history: List[TransferHistoryResponse]
     total: int
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "history": [],
-                "total": 0
-            }
-        }
-
 
 # Product Search Schemas
 
-class ProductMatchInfo(BaseModel):
+class ProductMatchInfo(ORMBase):
     """Information about the product found in the transfer."""
     barcode: str
     product_name: str
@@ -303,11 +188,8 @@ class ProductMatchInfo(BaseModel):
     quantity_transferred: int
     success: bool
 
-    class Config:
-        from_attributes = True
-
 
-class TransferHistorySearchResult(BaseModel):
+class TransferHistorySearchResult(ORMBase):
     """Transfer with information about the matched product."""
     # Transfer fields
     id: int
@@ -325,9 +207,6 @@ class TransferHistorySearchResult(BaseModel):
     # Matched product information
     matched_product: ProductMatchInfo
 
-    class Config:
-        from_attributes = True
-
 
 class TransferHistoryProductSearchResponse(BaseModel):
     """Response from product search in transfer history."""
@@ -335,13 +214,3 @@ class TransferHistoryProductSearchResponse(BaseModel):
     total: int
     search_query: str
     search_type: str
-
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "results": [],
-                "total": 0,
-                "search_query": "ABC123",
-                "search_type": "barcode"
-            }
-        }
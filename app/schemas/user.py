@@ -2,10 +2,13 @@
 User-related schemas.
 """
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from typing import Literal, Optional
+from pydantic import BaseModel, EmailStr, Field
 from app.core.constants import UserRole
 
+# Roles that can be assigned to local users (admins authenticate via Odoo)
+LocalUserRole = Literal["cajero", "bodeguero"]
+
 
 class UserBase(BaseModel):
     """Base user schema."""
@@ -17,27 +20,7 @@ class UserBase(BaseModel):
 class UserCreate(UserBase):
     """Schema for creating a new user."""
     password: str = Field(..., min_length=8, description="Password (min 8 characters)")
-    role: UserRole = Field(..., description="User role (cajero or bodeguero)")
-
-    @field_validator('role')
-    @classmethod
-    def validate_role(cls, v: UserRole) -> UserRole:
-        """Ensure role is not admin (admins auth via Odoo)."""
-        if v == UserRole.ADMIN:
-            raise ValueError("Cannot create admin users. Admins authenticate via Odoo.")
-        return v
-
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "username": "jperez",
-                "email": "jperez@example.com",
-                "full_name": "Juan Pérez",
-                "password": "SecurePass123",
-                "role": "cajero"
-            }
-        }
-    }
+    role: LocalUserRole = Field(..., description="User role (cajero or bodeguero)")
 
 
 class UserUpdate(BaseModel):
@@ -46,15 +29,7 @@ class UserUpdate(BaseModel):
     full_name: Optional[str] = Field(None, max_length=100)
     password: Optional[str] = Field(None, min_length=8)
     is_active: Optional[bool] = None
-    role: Optional[UserRole] = None
-
-    @field_validator('role')
-    @classmethod
-    def validate_role(cls, v: Optional[UserRole]) -> Optional[UserRole]:
-        """Ensure role is not admin (admins auth via Odoo)."""
-        if v == UserRole.ADMIN:
-            raise ValueError("Cannot assign admin role. Admins authenticate via Odoo.")
-        return v
+    role: Optional[LocalUserRole] = None
 
 
 class UserResponse(UserBase):
@@ -65,21 +40,7 @@ class UserResponse(UserBase):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {
-        "from_attributes": True,
-        "json_schema_extra": {
-            "example": {
-                "id": 1,
-                "username": "jperez",
-                "email": "jperez@example.com",
-                "full_name": "Juan Pérez",
-                "role": "cajero",
-                "is_active": True,
-                "created_at": "2024-01-15T10:30:00",
-                "updated_at": "2024-01-15T10:30:00"
-            }
-        }
-    }
+    model_config = {"from_attributes": True}
 
 
 class UserListResponse(BaseModel):
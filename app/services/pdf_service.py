@@ -8,6 +8,15 @@ from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate
 from reportlab.lib.units import inch
 
+# Standard document settings (margins precomputed in points)
+_DOCUMENT_DEFAULTS: Dict[str, Any] = {
+    'pagesize': letter,
+    'rightMargin': 0.75 * inch,
+    'leftMargin': 0.75 * inch,
+    'topMargin': 0.75 * inch,
+    'bottomMargin': 0.75 * inch,
+}
+
 
 class PDFService:
     """
@@ -27,20 +36,7 @@ class PDFService:
         Returns:
             SimpleDocTemplate: Configured document
         """
-        pagesize = kwargs.get('pagesize', letter)
-        right_margin = kwargs.get('rightMargin', 0.75 * inch)
-        left_margin = kwargs.get('leftMargin', 0.75 * inch)
-        top_margin = kwargs.get('topMargin', 0.75 * inch)
-        bottom_margin = kwargs.get('bottomMargin', 0.75 * inch)
-
-        return SimpleDocTemplate(
-            buffer,
-            pagesize=pagesize,
-            rightMargin=right_margin,
-            leftMargin=left_margin,
-            topMargin=top_margin,
-            bottomMargin=bottom_margin
-        )
+        return SimpleDocTemplate(buffer, **{**_DOCUMENT_DEFAULTS, **kwargs})
 
     @staticmethod
     def format_currency(amount: float) -> str:
@@ -55,4 +51,4 @@ class PDFService:
     @staticmethod
     def truncate_text(text: str, max_length: int = 30) -> str:
         """Truncate text to max length."""
-        return text[:max_length] if len(text) > max_length else text
+        return text[:max_length]
@@ -1,11 +1,16 @@
 """
 Formatting utilities for numbers, prices, and Ecuador-specific formats.
 """
-import locale
-from decimal import Decimal, ROUND_HALF_UP
+import math
+from decimal import Decimal
 from typing import Union
 from app.core.constants import VALID_PRICE_ENDINGS, IVA_RATE
 
+# Swaps "1,234.56" separators into Ecuador format "1.234,56"
+_EC_NUMBER_SEPARATORS = str.maketrans(",.", ".,")
+# Turns Ecuador format "1.234,56" into "1234.56" for float()
+_EC_NUMBER_PARSE = str.maketrans({".": None, ",": "."})
+
 
 def format_decimal_for_odoo(value: Union[float, Decimal]) -> float:
     """
@@ -20,6 +25,9 @@ def format_decimal_for_odoo(value: Union[float, Decimal]) -> float:
     Returns:
         Float with 8 decimal precision
     """
+    # Floats (the common case) skip the float() conversion
+    if type(value) is float:
+        return round(value, 8)
     return round(float(value), 8)
 
 
@@ -43,14 +51,9 @@ def round_price_ecuador(price: float) -> float:
         >>> round_price_ecuador(10.48)
         10.50
     """
-    # Round to nearest 0.05
-    price_decimal = Decimal(str(price))
-    rounded = (price_decimal / Decimal('0.05')).quantize(
-        Decimal('1'),
-        rounding=ROUND_HALF_UP
-    ) * Decimal('0.05')
-
-    return float(rounded)
+    # Round half up to nearest 0.05; round() absorbs float noise
+    # (10.025 * 20 == 200.49999999999997)
+    return math.copysign(math.floor(round(abs(price) * 20, 6) + 0.5) / 20, price)
 
 
 def round_to_quarter_dollar(price: float) -> float:
@@ -77,7 +80,6 @@ def round_to_quarter_dollar(price: float) -> float:
         >>> round_to_quarter_dollar(12.00)
         12.00
     """
-    import math
     # Round UP to nearest 0.25
     # Multiply by 4 to work in integer cents quarters, then ceil, then divide
     return math.ceil(round(price * 4, 6)) / 4
@@ -147,16 +149,17 @@ def calculate_sale_price(
         >>> calculate_sale_price(10.00, 0.50, include_iva=True, round_ecuador=True)
         17.25  # (10 * 1.5 * 1.15 = 17.25)
     """
-    # Apply margin
-    price = apply_profit_margin(cost_price, profit_margin)
+    # Same arithmetic as apply_profit_margin / calculate_price_with_iva /
+    # round_to_quarter_dollar, inlined to skip three calls per price
+    price = cost_price * (1 + profit_margin)
 
     # Apply IVA if requested
     if include_iva:
-        price = calculate_price_with_iva(price)
+        price *= 1 + IVA_RATE
 
     # Round UP to nearest 25 cents if requested
     if round_ecuador:
-        price = round_to_quarter_dollar(price)
+        price = math.ceil(round(price * 4, 6)) / 4
 
     return price
 
@@ -175,13 +178,10 @@ def format_currency_ecuador(amount: float) -> str:
         >>> format_currency_ecuador(1234.56)
         '$1,234.56'
     """
-    try:
-        # Try to use locale formatting
-        locale.setlocale(locale.LC_ALL, 'en_US.UTF-8')
-        return locale.currency(amount, grouping=True)
-    except:
-        # Fallback to simple formatting
-        return f"${amount:,.2f}"
+    # Same output as the en_US locale, without the process-global setlocale
+    if amount < 0:
+        return f"-${-amount:,.2f}"
+    return f"${amount:,.2f}"
 
 
 def parse_ecuadorian_number(value: str) -> float:
@@ -198,12 +198,7 @@ def parse_ecuadorian_number(value: str) -> float:
         >>> parse_ecuadorian_number("1.234,56")
         1234.56
     """
-    # Remove thousand separators (dots)
-    value = value.replace('.', '')
-    # Replace decimal comma with dot
-    value = value.replace(',', '.')
-
-    return float(value)
+    return float(value.translate(_EC_NUMBER_PARSE))
 
 
 def format_ecuadorian_number(value: float, decimals: int = 2) -> str:
@@ -221,12 +216,4 @@ def format_ecuadorian_number(value: float, decimals: int = 2) -> str:
         >>> format_ecuadorian_number(1234.56)
         '1.234,56'
     """
-    # Format with comma as thousand separator
-    formatted = f"{value:,.{decimals}f}"
-
-    # Swap separators (comma <-> dot)
-    formatted = formatted.replace(',', 'TEMP')
-    formatted = formatted.replace('.', ',')
-    formatted = formatted.replace('TEMP', '.')
-
-    return formatted
+    return f"{value:,.{decimals}f}".translate(_EC_NUMBER_SEPARATORS)
@@ -0,0 +1,187 @@
+"""
+JSON serialization utilities backed by orjson.
+
+Model ``to_dict`` methods return native ``datetime`` objects; orjson
+serializes them (RFC 3339) in C, so no per-field ``isoformat()`` is needed.
+"""
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Type
+import orjson
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.openapi.models import Schema
+from fastapi.openapi.utils import validation_error_definition, validation_error_response_definition
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ValidationError
+
+_COMPONENT_REF = "#/components/schemas/{model}"
+
+# Request schemas documented by json_body_openapi, keyed by component name
+_json_body_models: Dict[str, Type[BaseModel]] = {}
+
+
+def orjson_default(obj: Any) -> Any:
+    """
+    Fallback for types orjson does not serialize natively.
+
+    Args:
+        obj: Object orjson could not serialize
+
+    Returns:
+        JSON-serializable representation
+
+    Raises:
+        TypeError: If the type is not supported
+    """
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to JSON bytes.
+
+    Naive datetimes are emitted without offset (they are stored in
+    Ecuador local time), matching the previous ``isoformat()`` output.
+
+    Args:
+        obj: Object to serialize (e.g. the result of a model ``to_dict``)
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    return orjson.dumps(obj, default=orjson_default)
+
+
+def serialize_rows(
+    fields: Tuple[str, ...],
+    getter: Callable[[Any], Tuple[Any, ...]],
+    rows: Iterable[Any]
+) -> List[Dict[str, Any]]:
+    """
+    Convert ORM rows to dicts keyed by ``fields``.
+
+    Args:
+        fields: Field names, in the order ``getter`` returns them
+        getter: ``operator.attrgetter(*fields)``, which reads every field in C
+        rows: ORM objects to convert
+
+    Returns:
+        One dict per row
+    """
+    return [dict(zip(fields, getter(row))) for row in rows]
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (installed as the app's default response class)."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def model_response(model: BaseModel) -> Response:
+    """
+    Serialize an already-validated response model straight to JSON.
+
+    Returning a ``Response`` makes FastAPI skip its ``response_model``
+    round-trip (dump, re-validate, dump again); the route's
+    ``response_model`` still documents the body in OpenAPI.
+
+    Args:
+        model: Response schema instance built by the service layer
+
+    Returns:
+        ``application/json`` response rendered by pydantic-core
+    """
+    return Response(model.model_dump_json(), media_type="application/json")
+
+
+def json_body(model: Type[BaseModel]) -> Callable:
+    """
+    Build a dependency that validates the raw request body in one pass.
+
+    FastAPI's default body handling runs ``json.loads`` and then validates
+    the resulting dicts; ``model_validate_json`` parses and validates the
+    bytes directly in pydantic-core, which matters for large item lists.
+    Pair with ``json_body_openapi(model)`` so the body stays documented,
+    and declare the route's auth dependency before it: dependencies resolve
+    in order, so unauthorized callers get 401/403 before the body is read.
+
+    Args:
+        model: Request schema to validate against
+
+    Returns:
+        Async dependency returning a validated ``model`` instance
+    """
+    async def parse_body(request: Request) -> BaseModel:
+        try:
+            return model.model_validate_json(await request.body())
+        except ValidationError as e:
+            raise RequestValidationError([
+                {**error, "loc": ("body", *error["loc"])}
+                for error in e.errors(include_url=False)
+            ])
+
+    return parse_body
+
+
+def json_body_openapi(model: Type[BaseModel]) -> dict:
+    """
+    ``openapi_extra`` describing ``model`` as the JSON request body.
+
+    The body references ``model`` under ``components/schemas``; the schema
+    itself is registered there by ``add_json_body_schemas``. The 422 response
+    FastAPI documents for regular body parameters is declared too, since
+    ``json_body`` raises the same ``RequestValidationError``.
+    """
+    _json_body_models[model.__name__] = model
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"$ref": _COMPONENT_REF.format(model=model.__name__)}
+                }
+            },
+        },
+        "responses": {
+            "422": {
+                "description": "Validation Error",
+                "content": {
+                    "application/json": {
+                        "schema": {"$ref": _COMPONENT_REF.format(model="HTTPValidationError")}
+                    }
+                },
+            }
+        },
+    }
+
+
+def add_json_body_schemas(openapi_schema: dict) -> None:
+    """
+    Register ``json_body_openapi`` request schemas in an OpenAPI document.
+
+    Each model and its nested definitions go under ``components/schemas``
+    (with ``$ref``s pointing there, discriminator mappings included) and are
+    normalized the way FastAPI dumps its own components; components FastAPI
+    already generated are left untouched.
+
+    Args:
+        openapi_schema: OpenAPI document to update in place
+    """
+    schemas = openapi_schema.setdefault("components", {}).setdefault("schemas", {})
+    if _json_body_models:
+        schemas.setdefault("ValidationError", validation_error_definition)
+        schemas.setdefault("HTTPValidationError", validation_error_response_definition)
+    for name, model in _json_body_models.items():
+        schema = model.model_json_schema(ref_template=_COMPONENT_REF)
+        definitions = schema.pop("$defs", {})
+        for definition_name, definition in (*definitions.items(), (name, schema)):
+            if definition_name not in schemas:
+                schemas[definition_name] = jsonable_encoder(
+                    Schema(**definition), by_alias=True, exclude_none=True
+                )
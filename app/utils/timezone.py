@@ -22,6 +22,19 @@ def get_ecuador_now() -> datetime:
     return datetime.now(ECUADOR_TZ)
 
 
+def get_ecuador_now_naive(_now=datetime.now, _tz=ECUADOR_TZ) -> datetime:
+    """
+    Get current Ecuador datetime without tzinfo.
+
+    Used as SQLAlchemy column default/onupdate and for timestamp columns,
+    since SQLite needs naive datetimes.
+
+    Returns:
+        Current naive datetime in Ecuador local time
+    """
+    return _now(_tz).replace(tzinfo=None)
+
+
 def utc_to_ecuador(dt: datetime) -> datetime:
     """
     Convert UTC datetime to Ecuador timezone.
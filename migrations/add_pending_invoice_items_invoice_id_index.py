@@ -0,0 +1,31 @@
+"""
+Migration: Add invoice_id index on pending_invoice_items.
+
+Tables created from the models (Base.metadata.create_all) had no index on
+the items foreign key, so the selectin load of invoice items scanned the
+whole items table.
+
+Date: 2026-10-17
+"""
+
+from sqlalchemy import text
+
+
+def upgrade(engine):
+    """Create index on pending_invoice_items.invoice_id"""
+    with engine.begin() as conn:
+        print("Creating ix_pending_invoice_items_invoice_id...")
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_pending_invoice_items_invoice_id "
+            "ON pending_invoice_items (invoice_id)"
+        ))
+
+    print("✅ pending_invoice_items.invoice_id index created")
+
+
+def downgrade(engine):
+    """Drop index on pending_invoice_items.invoice_id"""
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX IF EXISTS ix_pending_invoice_items_invoice_id"))
+
+    print("✅ pending_invoice_items.invoice_id index dropped")
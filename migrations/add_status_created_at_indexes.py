@@ -0,0 +1,56 @@
+"""
+Migration: Add composite (status, created_at) indexes on pending tables.
+
+Replaces the single-column status indexes on pending_invoices,
+pending_adjustments and pending_transfers with (status, created_at)
+composites, so "filter by status, newest first" queries avoid a sort pass.
+Also replaces the product_sync_history_items.history_id index with a
+(history_id, action) composite.
+
+Date: 2026-10-17
+"""
+
+from sqlalchemy import text
+
+
+INDEXES = [
+    ("ix_pending_invoices_status", "ix_pending_invoices_status_created_at",
+     "pending_invoices", "status, created_at"),
+    ("ix_pending_adjustments_status", "ix_pending_adjustments_status_created_at",
+     "pending_adjustments", "status, created_at"),
+    ("ix_pending_transfers_status", "ix_pending_transfers_status_created_at",
+     "pending_transfers", "status, created_at"),
+    ("ix_product_sync_history_items_history_id", "ix_product_sync_history_items_history_id_action",
+     "product_sync_history_items", "history_id, action"),
+]
+
+# Names the same single-column indexes got from the create_*_tables migrations
+LEGACY_INDEXES = [
+    "idx_pending_invoices_status",
+    "idx_product_sync_history_items_history",
+]
+
+
+def upgrade(engine):
+    """Create composite indexes and drop the single-column ones they cover"""
+    # CREATE/DROP INDEX IF EXISTS work the same on PostgreSQL and SQLite
+    with engine.begin() as conn:
+        for old_index, new_index, table, columns in INDEXES:
+            print(f"Creating {new_index} on {table}({columns})...")
+            conn.execute(text(f"CREATE INDEX IF NOT EXISTS {new_index} ON {table} ({columns})"))
+            conn.execute(text(f"DROP INDEX IF EXISTS {old_index}"))
+        for legacy_index in LEGACY_INDEXES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {legacy_index}"))
+
+    print("✅ Composite indexes created")
+
+
+def downgrade(engine):
+    """Restore single-column indexes"""
+    with engine.begin() as conn:
+        for old_index, new_index, table, columns in INDEXES:
+            first_column = columns.split(",")[0].strip()
+            conn.execute(text(f"CREATE INDEX IF NOT EXISTS {old_index} ON {table} ({first_column})"))
+            conn.execute(text(f"DROP INDEX IF EXISTS {new_index}"))
+
+    print("✅ Single-column indexes restored")
@@ -0,0 +1,85 @@
+"""
+Migration: Convert status/type/reason enum columns to VARCHAR.
+
+The ORM now stores these values as plain strings instead of SQLAlchemy Enum
+columns. On PostgreSQL the native enum types are dropped after converting:
+- pending_invoices.status (invoicestatus) -> VARCHAR(30)
+- pending_transfers.status (transferstatus) -> VARCHAR(20)
+- pending_adjustments.status (adjustmentstatus) -> VARCHAR(20)
+- pending_adjustments.adjustment_type (adjustmenttype) -> VARCHAR(20)
+- pending_adjustment_items.adjustment_type (adjustmenttype) -> VARCHAR(20)
+- pending_adjustment_items.reason (adjustmentreason) -> VARCHAR(30)
+
+SQLite already stores these columns as VARCHAR, so nothing changes there.
+
+Partial indexes filtering on status cannot be rebuilt across the type change
+(no varchar = enum operator), so any that exist are dropped first;
+index_pending_queue_partial recreates them afterwards.
+
+Date: 2026-10-17
+"""
+
+from sqlalchemy import text
+
+
+COLUMNS = [
+    ("pending_invoices", "status", 30),
+    ("pending_transfers", "status", 20),
+    ("pending_adjustments", "status", 20),
+    ("pending_adjustments", "adjustment_type", 20),
+    ("pending_adjustment_items", "adjustment_type", 20),
+    ("pending_adjustment_items", "reason", 30),
+]
+
+# Partial indexes whose WHERE clause compares status to a literal
+STATUS_PARTIAL_INDEXES = [
+    "ix_pending_invoices_bodeguero_queue",
+    "ix_pending_adjustments_pending",
+    "ix_pending_transfers_pending",
+]
+
+ENUM_TYPES = [
+    "invoicestatus",
+    "transferstatus",
+    "adjustmentstatus",
+    "adjustmenttype",
+    "adjustmentreason",
+]
+
+
+def is_postgres(engine):
+    """Check if database is PostgreSQL"""
+    return "postgresql" in str(engine.url)
+
+
+def upgrade(engine):
+    """Convert enum columns to VARCHAR and drop the enum types"""
+    if not is_postgres(engine):
+        print("Skipping: SQLite already stores these columns as VARCHAR")
+        return
+
+    with engine.begin() as conn:
+        for index in STATUS_PARTIAL_INDEXES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {index}"))
+
+        for table, column, length in COLUMNS:
+            print(f"Converting {table}.{column} to VARCHAR({length})...")
+            conn.execute(text(f"""
+                ALTER TABLE {table}
+                ALTER COLUMN {column} TYPE VARCHAR({length})
+                USING {column}::text
+            """))
+
+        for enum_type in ENUM_TYPES:
+            conn.execute(text(f"DROP TYPE IF EXISTS {enum_type}"))
+
+        print("✅ Enum columns converted to VARCHAR")
+
+
+def downgrade(engine):
+    """
+    Note: Recreating the enum types would require listing every value again
+    and casting the columns back. Since VARCHAR accepts all existing values,
+    no downgrade is implemented.
+    """
+    print("⚠️  Downgrade not supported for enum to VARCHAR conversion")
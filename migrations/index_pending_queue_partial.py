@@ -0,0 +1,42 @@
+"""
+Migration: Add partial indexes for the active pending queues.
+
+Indexes created_at only for rows still waiting on someone (bodeguero review
+for invoices, admin confirmation for adjustments and transfers), so the
+indexes stay small as confirmed/synced rows accumulate.
+
+Named to sort after convert_status_enums_to_varchar: on PostgreSQL the
+predicates must be built against VARCHAR status columns, not the old enums.
+
+Date: 2026-10-17
+"""
+
+from sqlalchemy import text
+
+
+INDEXES = [
+    ("ix_pending_invoices_bodeguero_queue", "pending_invoices",
+     "status IN ('pendiente_revision', 'en_revision')"),
+    ("ix_pending_adjustments_pending", "pending_adjustments", "status = 'pending'"),
+    ("ix_pending_transfers_pending", "pending_transfers", "status = 'pending'"),
+]
+
+
+def upgrade(engine):
+    """Create partial indexes on created_at for active pending rows"""
+    # Partial indexes use the same syntax on PostgreSQL and SQLite
+    with engine.begin() as conn:
+        for index, table, where in INDEXES:
+            print(f"Creating {index} on {table}(created_at) WHERE {where}...")
+            conn.execute(text(f"CREATE INDEX IF NOT EXISTS {index} ON {table} (created_at) WHERE {where}"))
+
+    print("✅ Partial indexes created")
+
+
+def downgrade(engine):
+    """Drop partial indexes"""
+    with engine.begin() as conn:
+        for index, table, where in INDEXES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {index}"))
+
+    print("✅ Partial indexes dropped")
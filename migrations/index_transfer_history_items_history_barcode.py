@@ -0,0 +1,41 @@
+"""
+Migration: Add composite (history_id, barcode) index on transfer_history_items.
+
+Replaces the single-column history_id index; the composite serves both the
+per-history item load and history + barcode lookups. The standalone barcode
+index is kept for product search across all histories.
+
+Named to sort after create_transfer_history_tables: the runner applies
+migrations in filename order and the table must exist first.
+
+Date: 2026-10-17
+"""
+
+from sqlalchemy import text
+
+
+def upgrade(engine):
+    """Create composite index and drop the history_id index it covers"""
+    with engine.begin() as conn:
+        print("Creating ix_transfer_history_items_history_id_barcode...")
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_transfer_history_items_history_id_barcode "
+            "ON transfer_history_items (history_id, barcode)"
+        ))
+        # Model-created (ix_) and migration-created (idx_) names of the old index
+        conn.execute(text("DROP INDEX IF EXISTS ix_transfer_history_items_history_id"))
+        conn.execute(text("DROP INDEX IF EXISTS idx_transfer_history_items_history"))
+
+    print("✅ Composite index created")
+
+
+def downgrade(engine):
+    """Restore the single-column history_id index"""
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_transfer_history_items_history_id "
+            "ON transfer_history_items (history_id)"
+        ))
+        conn.execute(text("DROP INDEX IF EXISTS ix_transfer_history_items_history_id_barcode"))
+
+    print("✅ history_id index restored")
@@ -0,0 +1,55 @@
+"""
+Migration: Convert adjustment_history snapshot columns from TEXT to JSONB.
+
+snapshots_before/snapshots_after held json.dumps() text that was parsed on
+every read. On PostgreSQL they become JSONB and are decoded by the driver.
+SQLite keeps the JSON text as-is (SQLAlchemy's JSON type reads it directly).
+
+Named to sort after create_adjustment_history_tables: the runner applies
+migrations in filename order and the table must exist first.
+
+Date: 2026-10-17
+"""
+
+from sqlalchemy import text
+
+
+def is_postgres(engine):
+    """Check if database is PostgreSQL"""
+    return "postgresql" in str(engine.url)
+
+
+COLUMNS = [
+    "snapshots_before",
+    "snapshots_after",
+]
+
+
+def upgrade(engine):
+    """Convert snapshot columns to JSONB"""
+    if not is_postgres(engine):
+        print("⏭️  SQLite stores JSON as text, skipping")
+        return
+
+    with engine.begin() as conn:
+        for column in COLUMNS:
+            print(f"Converting adjustment_history.{column} to JSONB...")
+            conn.execute(text(f"""
+                ALTER TABLE adjustment_history
+                ALTER COLUMN {column} TYPE JSONB
+                USING {column}::jsonb
+            """))
+
+    print("✅ Snapshot columns converted to JSONB")
+
+
+def downgrade(engine):
+    """Convert snapshot columns back to TEXT"""
+    if not is_postgres(engine):
+        return
+
+    with engine.begin() as conn:
+        for column in COLUMNS:
+            conn.execute(text(f"ALTER TABLE adjustment_history ALTER COLUMN {column} TYPE TEXT USING {column}::text"))
+
+    print("✅ Snapshot columns reverted to TEXT")
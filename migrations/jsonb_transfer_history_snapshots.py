@@ -0,0 +1,58 @@
+"""
+Migration: Convert transfer_history snapshot columns from TEXT to JSONB.
+
+The snapshot and new_products columns held json.dumps() text that was parsed
+on every read. On PostgreSQL they become JSONB and are decoded by the driver.
+SQLite keeps the JSON text as-is (SQLAlchemy's JSON type reads it directly).
+
+Named to sort after create_transfer_history_tables: the runner applies
+migrations in filename order and the table must exist first.
+
+Date: 2026-10-17
+"""
+
+from sqlalchemy import text
+
+
+def is_postgres(engine):
+    """Check if database is PostgreSQL"""
+    return "postgresql" in str(engine.url)
+
+
+COLUMNS = [
+    "origin_snapshots_before",
+    "origin_snapshots_after",
+    "destination_snapshots_before",
+    "destination_snapshots_after",
+    "new_products",
+]
+
+
+def upgrade(engine):
+    """Convert snapshot columns to JSONB"""
+    if not is_postgres(engine):
+        print("⏭️  SQLite stores JSON as text, skipping")
+        return
+
+    with engine.begin() as conn:
+        for column in COLUMNS:
+            print(f"Converting transfer_history.{column} to JSONB...")
+            conn.execute(text(f"""
+                ALTER TABLE transfer_history
+                ALTER COLUMN {column} TYPE JSONB
+                USING {column}::jsonb
+            """))
+
+    print("✅ Snapshot columns converted to JSONB")
+
+
+def downgrade(engine):
+    """Convert snapshot columns back to TEXT"""
+    if not is_postgres(engine):
+        return
+
+    with engine.begin() as conn:
+        for column in COLUMNS:
+            conn.execute(text(f"ALTER TABLE transfer_history ALTER COLUMN {column} TYPE TEXT USING {column}::text"))
+
+    print("✅ Snapshot columns reverted to TEXT")
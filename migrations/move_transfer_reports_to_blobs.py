@@ -0,0 +1,104 @@
+"""
+Migration: Move transfer_history PDF/XML content into transfer_history_blobs.
+
+Creates transfer_history_blobs (one row per history record), copies the
+existing reports there with the PDF stored as raw bytes instead of base64,
+and drops pdf_content/xml_content from transfer_history so list queries no
+longer carry the payloads.
+
+Date: 2026-10-17
+"""
+
+import base64
+from sqlalchemy import text
+
+
+def is_postgres(engine):
+    """Check if database is PostgreSQL"""
+    return "postgresql" in str(engine.url)
+
+
+def column_exists(conn, table_name: str, column_name: str, is_postgres: bool) -> bool:
+    """Check if a column exists in a table."""
+    if is_postgres:
+        result = conn.execute(text("""
+            SELECT EXISTS (
+                SELECT FROM information_schema.columns
+                WHERE table_name = :table_name AND column_name = :column_name
+            )
+        """), {"table_name": table_name, "column_name": column_name})
+        return result.scalar()
+    else:
+        result = conn.execute(text(f"PRAGMA table_info({table_name})"))
+        return any(row[1] == column_name for row in result)
+
+
+def upgrade(engine):
+    """Create transfer_history_blobs and move report content into it"""
+    is_pg = is_postgres(engine)
+    binary_type = "BYTEA" if is_pg else "BLOB"
+
+    with engine.begin() as conn:
+        print("Creating table: transfer_history_blobs")
+        conn.execute(text(f"""
+            CREATE TABLE IF NOT EXISTS transfer_history_blobs (
+                history_id INTEGER PRIMARY KEY REFERENCES transfer_history(id) ON DELETE CASCADE,
+                pdf_bytes {binary_type},
+                xml_content TEXT
+            )
+        """))
+
+        if not column_exists(conn, 'transfer_history', 'pdf_content', is_pg):
+            print("⏭️  transfer_history.pdf_content already moved, skipping")
+            return
+
+        rows = conn.execute(text("""
+            SELECT id, pdf_content, xml_content FROM transfer_history
+            WHERE pdf_content IS NOT NULL OR xml_content IS NOT NULL
+        """)).fetchall()
+        print(f"Copying reports for {len(rows)} transfer history records...")
+        for history_id, pdf_content, xml_content in rows:
+            conn.execute(
+                text("""
+                    INSERT INTO transfer_history_blobs (history_id, pdf_bytes, xml_content)
+                    VALUES (:history_id, :pdf_bytes, :xml_content)
+                """),
+                {
+                    "history_id": history_id,
+                    "pdf_bytes": base64.b64decode(pdf_content) if pdf_content else None,
+                    "xml_content": xml_content
+                }
+            )
+
+        conn.execute(text("ALTER TABLE transfer_history DROP COLUMN pdf_content"))
+        conn.execute(text("ALTER TABLE transfer_history DROP COLUMN xml_content"))
+
+    print("✅ Transfer reports moved to transfer_history_blobs")
+
+
+def downgrade(engine):
+    """Move report content back into transfer_history"""
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE transfer_history ADD COLUMN pdf_content TEXT"))
+        conn.execute(text("ALTER TABLE transfer_history ADD COLUMN xml_content TEXT"))
+
+        rows = conn.execute(text(
+            "SELECT history_id, pdf_bytes, xml_content FROM transfer_history_blobs"
+        )).fetchall()
+        for history_id, pdf_bytes, xml_content in rows:
+            conn.execute(
+                text("""
+                    UPDATE transfer_history
+                    SET pdf_content = :pdf_content, xml_content = :xml_content
+                    WHERE id = :history_id
+                """),
+                {
+                    "history_id": history_id,
+                    "pdf_content": base64.b64encode(pdf_bytes).decode('utf-8') if pdf_bytes else None,
+                    "xml_content": xml_content
+                }
+            )
+
+        conn.execute(text("DROP TABLE transfer_history_blobs"))
+
+    print("✅ Transfer reports moved back to transfer_history")
@@ -0,0 +1,57 @@
+"""
+Migration: Convert short free-text columns from TEXT to sized VARCHAR.
+
+error_summary (history tables) and pending_invoice_items.sync_error become
+VARCHAR(1000); pending_adjustment_items.description becomes VARCHAR(500).
+Existing values are truncated to fit. SQLite does not enforce VARCHAR
+lengths, so no change is needed there.
+
+Date: 2026-10-17
+"""
+
+from sqlalchemy import text
+
+
+def is_postgres(engine):
+    """Check if database is PostgreSQL"""
+    return "postgresql" in str(engine.url)
+
+
+COLUMNS = [
+    ("adjustment_history", "error_summary", 1000),
+    ("invoice_history", "error_summary", 1000),
+    ("product_sync_history", "error_summary", 1000),
+    ("transfer_history", "error_summary", 1000),
+    ("pending_invoice_items", "sync_error", 1000),
+    ("pending_adjustment_items", "description", 500),
+]
+
+
+def upgrade(engine):
+    """Convert TEXT columns to sized VARCHAR"""
+    if not is_postgres(engine):
+        print("⏭️  SQLite does not enforce VARCHAR lengths, skipping")
+        return
+
+    with engine.begin() as conn:
+        for table, column, length in COLUMNS:
+            print(f"Converting {table}.{column} to VARCHAR({length})...")
+            conn.execute(text(f"""
+                ALTER TABLE {table}
+                ALTER COLUMN {column} TYPE VARCHAR({length})
+                USING left({column}, {length})
+            """))
+
+    print("✅ Text columns converted to sized VARCHAR")
+
+
+def downgrade(engine):
+    """Convert sized VARCHAR columns back to TEXT"""
+    if not is_postgres(engine):
+        return
+
+    with engine.begin() as conn:
+        for table, column, length in COLUMNS:
+            conn.execute(text(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE TEXT"))
+
+    print("✅ Columns reverted to TEXT")